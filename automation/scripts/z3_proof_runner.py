@@ -1,21 +1,58 @@
+"""
+Z3 verification of interview date flags.
+
+By default, runs the sampled verification suite: each case's flag
+thresholds are solved with Z3 across a process pool, and the results are
+logged in case order to markdown and JSON files under ``logs/``.
+``--prove-yaml`` instead proves an interview's date flags symbolically for
+every date, and ``--verify-graph`` checks its whole question graph.
+"""
+
+import argparse
 import json
+import math
+import multiprocessing
 import os
+import time
+import traceback
+from collections import Counter, deque
+from contextlib import suppress
 from datetime import datetime, timedelta
+from multiprocessing.connection import Connection, wait
 from pathlib import Path
 from typing import Any, Dict
 
 import z3
 
+from grizlyudvacator.formal.date_flag_proofs import prove_date_flags
+from grizlyudvacator.formal.graph_verifier import verify_interview_graph
 from grizlyudvacator.formal.interview_model import InterviewVerifier
+from grizlyudvacator.formal.proof_cache import ProofCache, proof_key
+
+SECONDS_PER_DAY = 24 * 60 * 60
 
 
 class Z3ProofLogger:
-    def __init__(self, output_dir: str = "logs"):
-        """Initialize the logger with output directory."""
+    def __init__(
+        self,
+        output_dir: str = "logs",
+        cache: ProofCache | None = None,
+        timeout_ms: int | None = None,
+    ):
+        """
+        Initialize the logger with output directory.
+
+        Args:
+            output_dir: Log directory, relative to the project root
+            cache: Proof-result cache (default: output/cache/proofs)
+            timeout_ms: Per-case solver timeout; None waits indefinitely
+        """
         # Get the project root directory
         project_root = Path(__file__).parent.parent.parent
         self.output_dir = project_root / output_dir
         self.verifier = InterviewVerifier()
+        self.cache = cache if cache is not None else ProofCache()
+        self.timeout_ms = timeout_ms
         os.makedirs(self.output_dir, exist_ok=True)
 
     def create_test_case(self, days_ago: int, flags: dict[str, int]) -> dict[str, Any]:
@@ -28,10 +65,67 @@ class Z3ProofLogger:
             "flags": flags,
         }
 
+    def solve_flags(self, elapsed: int, flags: dict[str, int]) -> dict[str, Any]:
+        """
+        Solve the threshold constraints for a case, via the proof cache.
+
+        The constraints only depend on the seconds elapsed since the answer
+        date and on the thresholds, so they are encoded relative to the
+        answer date and cached under the hash of exactly those values. A hit
+        skips the solver entirely.
+
+        Args:
+            elapsed: Whole seconds from the answer date to the current date
+            flags: Days threshold of each flag
+
+        Returns:
+            Dict with ``status``, ``z3_model`` and ``z3_constraints``;
+            ``status`` is "UNKNOWN" if the solver gave up or timed out, and
+            such results are not cached
+        """
+        key = proof_key({"elapsed": elapsed, "flags": sorted(flags.items())})
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        solver = z3.Solver()
+        if self.timeout_ms:
+            solver.set("timeout", self.timeout_ms)
+        since_answer = z3.Int("elapsed")
+        solver.add(since_answer == elapsed)
+
+        constraints = []
+        for threshold, days in sorted(flags.items()):
+            constraint = z3.Implies(
+                since_answer > days * SECONDS_PER_DAY, z3.Bool(threshold)
+            )
+            solver.add(constraint)
+            constraints.append(str(constraint))
+
+        result = solver.check()
+        model = solver.model() if result == z3.sat else None
+        if result == z3.unknown:
+            return {
+                "status": "UNKNOWN",
+                "z3_model": f"None ({solver.reason_unknown()})",
+                "z3_constraints": constraints,
+            }
+        proof = {
+            "status": "SAT" if result == z3.sat else "UNSAT",
+            "z3_model": str(model) if model else "None",
+            "z3_constraints": constraints,
+        }
+        self.cache.put(key, proof)
+        return proof
+
     def evaluate_flags(self, test_case: dict[str, Any]) -> dict[str, Any]:
         """
         Evaluate flags using Z3 and return detailed results.
 
+        Solver results come from ``solve_flags``, so unchanged cases are
+        answered from the proof cache; the rest of the result is rebuilt
+        every time and can be logged as usual.
+
         Returns:
             Dict containing:
             - status: SAT/UNSAT
@@ -44,26 +138,9 @@ class Z3ProofLogger:
         answer_date = datetime.fromisoformat(test_case["answer_date"])
         flags = test_case["flags"]
 
-        # Create Z3 solver and variables
-        solver = z3.Solver()
-        current = z3.Int("current")
-        answer = z3.Int("answer")
-
-        # Add base constraints
-        solver.add(current == int(current_date.timestamp()))
-        solver.add(answer == int(answer_date.timestamp()))
-
-        # Add flag constraints
-        constraints = []
-        for threshold, days in flags.items():
-            threshold_ts = answer_date.timestamp() + (days * 24 * 60 * 60)
-            constraint = z3.Implies(current > threshold_ts, z3.Bool(threshold))
-            solver.add(constraint)
-            constraints.append(str(constraint))
-
-        # Check and get model
-        result = solver.check()
-        model = solver.model() if result == z3.sat else None
+        # Solve (or look up) the constraints relative to the answer date
+        elapsed = int((current_date - answer_date).total_seconds())
+        proof = self.solve_flags(elapsed, flags)
 
         # Generate explanation
         explanation = []
@@ -80,9 +157,7 @@ class Z3ProofLogger:
                 )
 
         return {
-            "status": "SAT" if result == z3.sat else "UNSAT",
-            "z3_model": str(model) if model else "None",
-            "z3_constraints": constraints,
+            **proof,
             "triggered_flags": [
                 flag
                 for flag, days in flags.items()
@@ -96,18 +171,9 @@ class Z3ProofLogger:
             "timestamp": datetime.now().isoformat(),
         }
 
-    def log_proof(
-        self,
-        test_case: dict[str, Any],
-        result: dict[str, Any],
-        format: str = "markdown",
-    ) -> None:
-        """Log the Z3 proof in specified format."""
-        # Ensure logs directory exists
-        os.makedirs(self.output_dir, exist_ok=True)
-
-        if format == "markdown":
-            log = f"""
+    def _markdown_entry(self, test_case: dict[str, Any], result: dict[str, Any]) -> str:
+        """Format one proof as a markdown log entry."""
+        return f"""
 ### [{result['timestamp']}]: Test Case - {test_case["answer_date"]} vs {test_case["current_date"]}
 
 📅 Current Date: {result["current_date"]}
@@ -136,6 +202,33 @@ class Z3ProofLogger:
 ---
 """
 
+    def log_proof(
+        self,
+        test_case: dict[str, Any],
+        result: dict[str, Any],
+        format: str = "markdown",
+    ) -> None:
+        """Log the Z3 proof in specified format."""
+        self.log_proofs([(test_case, result)], format)
+
+    def log_proofs(
+        self,
+        entries: list[tuple[dict[str, Any], dict[str, Any]]],
+        format: str = "markdown",
+    ) -> None:
+        """
+        Log several Z3 proofs, in order, with one write per log file.
+
+        Args:
+            entries: ``(test_case, result)`` pairs
+            format: "markdown" or "json"
+        """
+        # Ensure logs directory exists
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        if format == "markdown":
+            log = "".join(self._markdown_entry(c, r) for c, r in entries)
+
             # Write markdown log
             with open(self.output_dir / "z3_proof_log.md", "a") as f:
                 f.write(log)
@@ -156,31 +249,30 @@ class Z3ProofLogger:
             except json.JSONDecodeError:
                 data = []
 
-            # Add new result
-            data.append(result)
+            # Add new results
+            results = [result for _, result in entries]
+            data.extend(results)
 
             # Write back with proper formatting
             try:
                 with open(json_file, "w") as f:
                     json.dump(data, f, indent=2)
-                print(f"Logged result to {json_file}")
+                print(f"Logged {len(results)} result(s) to {json_file}")
             except Exception as e:
                 print(f"Error writing JSON: {e}")
-                # If writing fails, try to append the result as a new line
+                # If writing fails, try to append the results as new lines
                 try:
                     with open(json_file, "a") as f:
-                        f.write(json.dumps(result, indent=2) + "\n")
-                    print(f"Appended result to {json_file}")
+                        for result in results:
+                            f.write(json.dumps(result, indent=2) + "\n")
+                    print(f"Appended results to {json_file}")
                 except Exception as e:
                     print(f"Error appending to JSON: {e}")
 
 
-def run_verification_suite():
-    """Run a suite of verification tests."""
-    logger = Z3ProofLogger()
-
-    # Define comprehensive test cases
-    test_cases = [
+def default_test_cases(logger: Z3ProofLogger) -> list[dict[str, Any]]:
+    """Return the built-in verification cases, dated relative to now."""
+    return [
         # Case 1: Multiple thresholds triggered
         logger.create_test_case(
             days_ago=10,
@@ -265,13 +357,266 @@ def run_verification_suite():
         ),
     ]
 
-    # Run and log each test case with both formats
-    for i, case in enumerate(test_cases, 1):
-        print(f"\nRunning Test Case {i}...")
-        result = logger.evaluate_flags(case)
-        logger.log_proof(case, result, format="markdown")
-        logger.log_proof(case, result, format="json")
+
+# Logger of a pool worker, created once by ``_init_worker``
+_worker_logger: Z3ProofLogger | None = None
+
+
+def _init_worker(
+    output_dir: str, cache_dir: Path, cache_bytes: int, timeout_ms: int | None
+) -> None:
+    """Create the per-process logger, sharing the on-disk proof cache."""
+    global _worker_logger
+    _worker_logger = Z3ProofLogger(
+        output_dir, ProofCache(cache_dir, cache_bytes), timeout_ms
+    )
+
+
+def _evaluate_in_worker(test_case: dict[str, Any]) -> dict[str, Any]:
+    """Pool entry point for ``Z3ProofLogger.evaluate_flags``."""
+    return _worker_logger.evaluate_flags(test_case)
+
+
+def _worker_loop(conn: Connection, initargs: tuple) -> None:
+    """Worker process: solve the cases sent over ``conn`` until sent None."""
+    _init_worker(*initargs)
+    while (task := conn.recv()) is not None:
+        index, test_case = task
+        # The case's deadline runs from here, not from when it was queued
+        conn.send(("started", index, time.monotonic()))
+        try:
+            conn.send(("done", index, _evaluate_in_worker(test_case)))
+        except Exception:
+            conn.send(("failed", index, traceback.format_exc()))
+
+
+def _solve_in_pool(
+    test_cases: list[dict[str, Any]],
+    workers: int,
+    initargs: tuple,
+    case_timeout: float | None,
+) -> list[dict[str, Any]]:
+    """
+    Solve cases across worker processes owned by this call.
+
+    Each case gets ``case_timeout`` seconds from the moment its worker
+    reports starting it. A worker still on its case past that deadline is
+    terminated and replaced, and the case is reported as TIMEOUT.
+
+    Raises:
+        RuntimeError: If a case raises or its worker dies
+    """
+    context = multiprocessing.get_context()
+    processes = []
+
+    def spawn() -> tuple[Connection, multiprocessing.Process]:
+        conn, child = context.Pipe()
+        process = context.Process(
+            target=_worker_loop, args=(child, initargs), daemon=True
+        )
+        process.start()
+        child.close()
+        processes.append(process)
+        return conn, process
+
+    results: list[dict[str, Any] | None] = [None] * len(test_cases)
+    queued = deque(enumerate(test_cases))
+    idle = [spawn() for _ in range(min(workers, len(test_cases)))]
+    # Connection -> [process, case index, deadline]
+    busy: dict[Connection, list] = {}
+    try:
+        while queued or busy:
+            while queued and idle:
+                conn, process = idle.pop()
+                index, test_case = queued.popleft()
+                conn.send((index, test_case))
+                busy[conn] = [process, index, math.inf]
+
+            deadline = min(entry[2] for entry in busy.values())
+            timeout = None
+            if deadline != math.inf:
+                timeout = max(0.0, deadline - time.monotonic())
+            for conn in wait(list(busy), timeout):
+                process, index, _ = busy[conn]
+                try:
+                    kind, _, payload = conn.recv()
+                except EOFError:
+                    raise RuntimeError(
+                        f"Proof worker exited during case {index + 1}"
+                    ) from None
+                if kind == "started":
+                    if case_timeout is not None:
+                        busy[conn][2] = payload + case_timeout
+                elif kind == "done":
+                    results[index] = payload
+                    del busy[conn]
+                    idle.append((conn, process))
+                else:
+                    raise RuntimeError(f"Case {index + 1} failed:\n{payload}")
+
+            now = time.monotonic()
+            for conn, (process, index, deadline) in list(busy.items()):
+                if deadline <= now:
+                    process.terminate()
+                    process.join()
+                    conn.close()
+                    del busy[conn]
+                    results[index] = _timed_out(test_cases[index], case_timeout)
+                    if queued:
+                        idle.append(spawn())
+    finally:
+        for conn, _ in idle:
+            with suppress(OSError):
+                conn.send(None)
+        for process, _, _ in busy.values():
+            process.terminate()
+        for process in processes:
+            process.join()
+    return results
+
+
+def _timed_out(test_case: dict[str, Any], seconds: float) -> dict[str, Any]:
+    """Return the result logged for a case whose worker did not answer."""
+    return {
+        "status": "TIMEOUT",
+        "z3_model": "None",
+        "z3_constraints": [],
+        "triggered_flags": [],
+        "explanation": [f"No result within {seconds:g}s"],
+        "current_date": test_case["current_date"],
+        "answer_date": test_case["answer_date"],
+        "flags": test_case["flags"],
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+def run_verification_suite(
+    test_cases: list[dict[str, Any]] | None = None,
+    workers: int | None = None,
+    timeout_ms: int | None = 10_000,
+    output_dir: str = "logs",
+    cache: ProofCache | None = None,
+    case_timeout: float | None = 60.0,
+) -> dict[str, Any]:
+    """
+    Run a suite of verification tests across a process pool.
+
+    Cases are solved in parallel, then logged in case order with one write
+    per log file, followed by a throughput summary.
+
+    Args:
+        test_cases: Cases to verify (default: ``default_test_cases``)
+        workers: Pool size; 0 runs in-process, None uses every CPU
+        timeout_ms: Solver timeout per case; timed-out cases are UNKNOWN
+        output_dir: Log directory, relative to the project root
+        cache: Proof-result cache (default: output/cache/proofs)
+        case_timeout: Wall-clock seconds each pooled case may run, counted
+            from when its worker starts it, as a backstop for a worker the
+            solver timeout does not stop; such cases are TIMEOUT and their
+            worker is replaced. None waits indefinitely
+
+    Returns:
+        Dict with ``cases``, ``workers``, ``elapsed`` seconds,
+        ``cases_per_second`` and the count of each ``status``
+    """
+    logger = Z3ProofLogger(output_dir, cache, timeout_ms)
+    if test_cases is None:
+        test_cases = default_test_cases(logger)
+
+    started = time.monotonic()
+    if workers == 0:
+        results = [logger.evaluate_flags(case) for case in test_cases]
+    else:
+        workers = workers or os.cpu_count() or 1
+        cache = logger.cache
+        initargs = (output_dir, cache.directory, cache.max_bytes, timeout_ms)
+        results = _solve_in_pool(test_cases, workers, initargs, case_timeout)
+    elapsed = time.monotonic() - started
+
+    entries = list(zip(test_cases, results))
+    for i, (_, result) in enumerate(entries, 1):
+        print(f"Test Case {i}: {result['status']}")
+    logger.log_proofs(entries, format="markdown")
+    logger.log_proofs(entries, format="json")
+
+    summary = {
+        "cases": len(entries),
+        "workers": workers,
+        "elapsed": elapsed,
+        "cases_per_second": len(entries) / elapsed if elapsed > 0 else 0.0,
+        "statuses": dict(Counter(result["status"] for result in results)),
+    }
+    statuses = ", ".join(f"{k}: {v}" for k, v in sorted(summary["statuses"].items()))
+    print(
+        f"\nVerified {summary['cases']} cases in {elapsed:.2f}s "
+        f"({summary['cases_per_second']:,.1f} cases/s, {workers or 1} workers; "
+        f"{statuses})"
+    )
+    return summary
+
+
+def print_date_flag_proof(result: dict[str, Any]) -> None:
+    """Report a ``prove_date_flags`` result."""
+    for question_id, proof in result["questions"].items():
+        print(f"{'✅' if proof['proved'] else '❌'} {question_id}")
+        for counterexample in proof["counterexamples"]:
+            print(f"   {json.dumps(counterexample)}")
+    verdict = "proved" if result["proved"] else "NOT proved"
+    print(f"\nDate flags {verdict} for YAML {result['yaml_hash'][:12]}")
+
+
+def print_graph_verification(result: dict[str, Any]) -> None:
+    """Report a ``verify_interview_graph`` result."""
+    for check, found in result.items():
+        if check not in ("proved", "yaml_hash") and found:
+            print(f"❌ {check}: {json.dumps(found)}")
+    verdict = "verified" if result["proved"] else "NOT verified"
+    print(f"\nQuestion graph {verdict} for YAML {result['yaml_hash'][:12]}")
+
+
+def main() -> None:
+    """Run the verification suite from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-j", "--workers", type=int, help="Worker processes (default: all CPUs)"
+    )
+    parser.add_argument(
+        "--timeout-ms",
+        type=int,
+        default=10_000,
+        help="Solver timeout per case in milliseconds (default: 10000)",
+    )
+    parser.add_argument(
+        "--case-timeout",
+        type=float,
+        default=60.0,
+        help="Seconds each case may run once started (default: 60)",
+    )
+    parser.add_argument(
+        "--prove-yaml",
+        metavar="YAML",
+        help="Instead of sampled cases, prove the interview's date flags "
+        "symbolically for every date",
+    )
+    parser.add_argument(
+        "--verify-graph",
+        metavar="YAML",
+        help="Verify the interview's whole question graph: termination, "
+        "reachability of every question and flag",
+    )
+    args = parser.parse_args()
+    if args.verify_graph:
+        print_graph_verification(verify_interview_graph(args.verify_graph))
+    if args.prove_yaml:
+        print_date_flag_proof(prove_date_flags(args.prove_yaml))
+    if args.verify_graph or args.prove_yaml:
+        return
+    run_verification_suite(
+        workers=args.workers,
+        timeout_ms=args.timeout_ms,
+        case_timeout=args.case_timeout,
+    )
 
 
 if __name__ == "__main__":
-    run_verification_suite()
+    main()
@@ -6,51 +6,60 @@ from pathlib import Path
 from docxtpl import DocxTemplate
 
 
-def generate_motion(answers, result):
+def render_motion(answers, result, output_path, summary_path=None):
+    """
+    Render a motion to ``output_path`` without printing.
+
+    The Markdown summary goes to ``summary_path`` (default: next to the
+    motion, with an ``.md`` suffix). Errors are raised to the caller.
+    """
     template_path = Path(__file__).parent / "templates" / "motion_template.docx"
-    output_path = (
-        Path("output")
-        / "documents"
-        / f"motion_to_vacate_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
-    )
+    if not template_path.exists():
+        raise FileNotFoundError(f"Template file not found at {template_path}")
+    output_path = Path(output_path)
+    summary_path = Path(summary_path or output_path.with_suffix(".md"))
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Load template and prepare context for template rendering
+    doc = DocxTemplate(template_path)
+    context = {
+        "statute_list": ", ".join(result["statutes"]),
+        "justification": result["justification"],
+        "facts": "\n".join(f"{k}: {v}" for k, v in answers.items()),
+    }
+
+    # Render and save document
+    doc.render(context)
+    doc.save(output_path)
+
+    # Generate summary
+    with open(summary_path, "w") as f:
+        f.write("# 📄 Motion to Vacate Summary\n\n")
+        f.write(
+            f"## 📅 Date Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        )
+        f.write("## 📋 Statutes\n")
+        for statute in result["statutes"]:
+            f.write(f"- {statute}\n")
+        f.write("\n## 📝 Justification\n")
+        f.write(f"{result['justification']}\n\n")
+        f.write("## 📋 Facts\n")
+        for k, v in answers.items():
+            f.write(f"- **{k}**: {v}\n")
+    return output_path
 
-    try:
-        # Load template and create output paths
-        doc = DocxTemplate(template_path)
-
-        # Prepare context for template rendering
-        context = {
-            "statute_list": ", ".join(result["statutes"]),
-            "justification": result["justification"],
-            "facts": "\n".join(f"{k}: {v}" for k, v in answers.items()),
-        }
-
-        # Render and save document
-        doc.render(context)
-        doc.save(output_path)
-
-        # Generate summary
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        summary_path = Path("output") / "documents" / f"motion_summary_{timestamp}.md"
-
-        with open(summary_path, "w") as f:
-            f.write("# 📄 Motion to Vacate Summary\n\n")
-            f.write(
-                f"## 📅 Date Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-            )
-            f.write("## 📋 Statutes\n")
-            for statute in result["statutes"]:
-                f.write(f"- {statute}\n")
-            f.write("\n## 📝 Justification\n")
-            f.write(f"{result['justification']}\n\n")
-            f.write("## 📋 Facts\n")
-            for k, v in answers.items():
-                f.write(f"- **{k}**: {v}\n")
 
+def generate_motion(answers, result):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_path = Path("output") / "documents" / f"motion_to_vacate_{timestamp}.docx"
+    summary_path = Path("output") / "documents" / f"motion_summary_{timestamp}.md"
+
+    try:
+        render_motion(answers, result, output_path, summary_path)
         print(f"✅ Motion saved to: {output_path}")
         return str(output_path)
     except FileNotFoundError:
-        raise FileNotFoundError(f"Template file not found at {template_path}")
+        raise
     except Exception as e:
         print(f"❌ Error occurred while saving motion: {str(e)}")
         return None
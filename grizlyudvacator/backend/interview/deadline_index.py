@@ -0,0 +1,228 @@
+"""
+Caseload index of statutory filing deadlines.
+
+Each statute keeps a heap of ``(deadline ordinal, case ID, version)``
+entries, so inserting or updating a session as its answers change costs
+O(log n). Removals are lazy: a replaced or removed entry stays in the heap
+with a stale version and is dropped the next time the heap is queried. A
+query first compacts the heap into sorted order (still a valid heap), so
+"which cases lose § 473(b) eligibility in the next 14 days" is two bisects
+plus a slice, and the next N expiring cases are a bisect plus a slice,
+without rescanning saved results.
+"""
+
+import heapq
+import itertools
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+from datetime import date
+from typing import Any
+
+from grizlyudvacator.backend.rules.deadlines import (
+    ccp_473_5_deadline,
+    ccp_473b_deadline,
+)
+from grizlyudvacator.utils.court_days import CourtCalendar
+from grizlyudvacator.utils.date_utils import parse_date
+
+
+def answer_deadlines(
+    answers: Mapping[str, Any], court_calendar: CourtCalendar | None = None
+) -> dict[str, date]:
+    """
+    Derive a session's filing deadlines from its interview answers.
+
+    Uses ``judgment_date`` and, for the 180-day limit of CCP § 473.5,
+    ``notice_of_entry_date``: the date written notice of entry of judgment
+    was served. ``became_aware_date`` is deliberately not used for it, since
+    learning of the judgment some other way does not start the 180 days;
+    without a notice date the § 473.5 deadline is the two-year limit.
+    Sessions without a usable judgment date have no deadlines yet, and a
+    deadline the court calendar cannot compute (a date outside its range)
+    is left out as unknown.
+
+    Args:
+        answers (Mapping[str, Any]): Session answers keyed by question ID
+        court_calendar (Optional[CourtCalendar]): Calendar to use
+
+    Returns:
+        Dict[str, date]: Deadlines keyed by statute (``ccp_473b``, ``ccp_473_5``)
+    """
+    judgment_date = _answer_date(answers, "judgment_date")
+    if judgment_date is None:
+        return {}
+    notice_date = _answer_date(answers, "notice_of_entry_date")
+    rules = {
+        "ccp_473b": lambda: ccp_473b_deadline(judgment_date, court_calendar),
+        "ccp_473_5": lambda: ccp_473_5_deadline(
+            judgment_date, notice_date, court_calendar
+        ),
+    }
+    deadlines = {}
+    for statute, deadline in rules.items():
+        try:
+            deadlines[statute] = deadline()
+        except (ValueError, OverflowError):
+            continue
+    return deadlines
+
+
+def _answer_date(answers: Mapping[str, Any], question_id: str) -> date | None:
+    """Parse a date answer, or None if missing or malformed."""
+    try:
+        return parse_date(answers[question_id])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class DeadlineIndex:
+    """
+    Per-statute heap index of case deadlines.
+
+    Attributes:
+        court_calendar (Optional[CourtCalendar]): Calendar used to derive
+            deadlines from answers
+    """
+
+    __slots__ = (
+        "court_calendar",
+        "_entries",
+        "_cases",
+        "_versions",
+        "_stale",
+        "_sorted",
+        "_counter",
+    )
+
+    def __init__(self, court_calendar: CourtCalendar | None = None) -> None:
+        self.court_calendar = court_calendar
+        self._entries: dict[str, list[tuple[int, str, int]]] = {}
+        self._cases: dict[str, dict[str, date]] = {}
+        self._versions: dict[str, int] = {}
+        self._stale: dict[str, int] = {}
+        self._sorted: set[str] = set()
+        self._counter = itertools.count()
+
+    @classmethod
+    def from_sessions(
+        cls,
+        sessions: Iterable[tuple[str, Mapping[str, Any]]],
+        court_calendar: CourtCalendar | None = None,
+    ) -> "DeadlineIndex":
+        """Build an index from ``(case ID, answers)`` pairs."""
+        index = cls(court_calendar)
+        for case_id, answers in sessions:
+            index.update_answers(case_id, answers)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._cases)
+
+    def __contains__(self, case_id: object) -> bool:
+        return case_id in self._cases
+
+    def deadlines(self, case_id: str) -> dict[str, date]:
+        """Return the indexed deadlines for a case."""
+        return dict(self._cases.get(case_id, {}))
+
+    def update(self, case_id: str, deadlines: Mapping[str, date]) -> None:
+        """
+        Insert a case, or replace its deadlines.
+
+        Args:
+            case_id (str): Case or session identifier
+            deadlines (Mapping[str, date]): Deadlines keyed by statute
+        """
+        self.remove(case_id)
+        if not deadlines:
+            return
+        version = next(self._counter)
+        for statute, deadline in deadlines.items():
+            entries = self._entries.setdefault(statute, [])
+            heapq.heappush(entries, (deadline.toordinal(), case_id, version))
+            self._sorted.discard(statute)
+        self._cases[case_id] = dict(deadlines)
+        self._versions[case_id] = version
+
+    def update_answers(self, case_id: str, answers: Mapping[str, Any]) -> None:
+        """Insert or refresh a case from its current interview answers."""
+        self.update(case_id, answer_deadlines(answers, self.court_calendar))
+
+    def remove(self, case_id: str) -> None:
+        """Drop a case from the index; unknown cases are ignored."""
+        deadlines = self._cases.pop(case_id, None)
+        if not deadlines:
+            return
+        del self._versions[case_id]
+        for statute in deadlines:
+            stale = self._stale[statute] = self._stale.get(statute, 0) + 1
+            # Keep stale entries under half the heap when nothing queries it
+            if 2 * stale > len(self._entries[statute]):
+                self._compact(statute)
+                heapq.heapify(self._entries[statute])
+
+    def _compact(self, statute: str) -> None:
+        """Drop a statute's stale entries."""
+        if not self._stale.pop(statute, 0):
+            return
+        versions = self._versions
+        entries = self._entries[statute]
+        entries[:] = [e for e in entries if versions.get(e[1]) == e[2]]
+        self._sorted.discard(statute)
+
+    def _live(self, statute: str) -> list[tuple[int, str, int]]:
+        """
+        Return a statute's live entries in sorted order.
+
+        A sorted list is also a valid heap, so later pushes need no rebuild.
+        """
+        if statute not in self._entries:
+            return []
+        self._compact(statute)
+        entries = self._entries[statute]
+        if statute not in self._sorted:
+            entries.sort()
+            self._sorted.add(statute)
+        return entries
+
+    def expiring(self, statute: str, start: date, end: date) -> list[tuple[date, str]]:
+        """
+        Return the cases whose deadline for ``statute`` falls in a range.
+
+        Args:
+            statute (str): Statute key, e.g. ``ccp_473b``
+            start (date): First day of the range
+            end (date): Last day of the range, inclusive
+
+        Returns:
+            List[Tuple[date, str]]: ``(deadline, case ID)`` pairs, soonest first
+        """
+        entries = self._live(statute)
+        low = bisect_left(entries, (start.toordinal(),))
+        high = bisect_left(entries, (end.toordinal() + 1,))
+        return [
+            (date.fromordinal(day), case_id) for day, case_id, _ in entries[low:high]
+        ]
+
+    def next_expiring(
+        self, statute: str, count: int, after: date | None = None
+    ) -> list[tuple[date, str]]:
+        """
+        Return the ``count`` soonest deadlines for ``statute``.
+
+        Args:
+            statute (str): Statute key, e.g. ``ccp_473b``
+            count (int): Maximum number of cases to return
+            after (Optional[date]): Skip deadlines before this day; defaults
+                to today, so already-expired cases are not returned
+
+        Returns:
+            List[Tuple[date, str]]: ``(deadline, case ID)`` pairs, soonest first
+        """
+        entries = self._live(statute)
+        after = after or date.today()
+        low = bisect_left(entries, (after.toordinal(),))
+        return [
+            (date.fromordinal(day), case_id)
+            for day, case_id, _ in entries[low : low + count]
+        ]
@@ -0,0 +1,187 @@
+# backend/rules/bulk.py
+"""
+Vectorized statute evaluation for a whole caseload.
+
+The caseload is a boolean cases x flags matrix whose columns follow a list
+of flag names (e.g. a ``FlagRegistry``'s interned order), plus optional
+answer columns keyed by question ID. Rows are packed into 64-bit words and
+each rule becomes a handful of whole-column mask operations:
+
+- required flags: ``words & all_mask == all_mask``
+- trigger flags: ``words & any_mask != 0``
+- forbidden flags: ``words & forbidden_mask == 0``
+
+Answer predicates run once per column and statute dependencies OR earlier
+result columns, so the cost per rule is independent of the number of cases
+handled in Python. Results match ``RuleEngine.evaluate`` on each row.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+from .rule_engine import PREDICATES, RuleEngine, get_rule_engine
+
+
+def encode_flags(
+    flag_sets: Iterable[Iterable[str]], flag_names: Sequence[str]
+) -> np.ndarray:
+    """
+    Build a cases x flags boolean matrix from per-case flag lists.
+
+    Flags not in ``flag_names`` are ignored.
+
+    Args:
+        flag_sets (Iterable[Iterable[str]]): Flags raised for each case
+        flag_names (Sequence[str]): Column order
+
+    Returns:
+        np.ndarray: Boolean matrix of shape (cases, len(flag_names))
+    """
+    column = {name: i for i, name in enumerate(flag_names)}
+    rows = [[column[f] for f in flags if f in column] for flags in flag_sets]
+    matrix = np.zeros((len(rows), len(flag_names)), dtype=bool)
+    for row, columns in enumerate(rows):
+        matrix[row, columns] = True
+    return matrix
+
+
+def _pack(matrix: np.ndarray) -> np.ndarray:
+    """Pack boolean rows into little-endian uint64 words, shape (cases, W)."""
+    cases, width = matrix.shape
+    words = max(1, -(-width // 64))
+    padded = np.zeros((cases, words * 64), dtype=bool)
+    padded[:, :width] = matrix
+    packed = np.packbits(padded, axis=1, bitorder="little")
+    return packed.view("<u8").reshape(cases, words)
+
+
+def _mask(flags: Iterable[str], column: Mapping[str, int], words: int) -> np.ndarray:
+    """Return the packed word mask selecting ``flags``' columns."""
+    mask = np.zeros(words, dtype=np.uint64)
+    for flag in flags:
+        index = column[flag]
+        mask[index // 64] |= np.uint64(1 << (index % 64))
+    return mask
+
+
+def _predicate_column(
+    column: np.ndarray | None, predicate: str, argument: Any, cases: int
+) -> np.ndarray:
+    """Evaluate one answer predicate over an answer column."""
+    if column is None:
+        return np.full(cases, PREDICATES[predicate](None, argument), dtype=bool)
+    if predicate == "truthy":
+        return _truthy(column)
+    if predicate == "falsy":
+        return ~_truthy(column)
+    if predicate == "in":
+        return np.array([value in argument for value in column], dtype=bool)
+    if column.dtype == object:
+        test = PREDICATES[predicate]
+        return np.array([test(value, argument) for value in column], dtype=bool)
+    equal = column == argument
+    return equal if predicate == "eq" else ~equal
+
+
+def _missing(column: np.ndarray) -> np.ndarray:
+    """Return which entries of an object answer column are None."""
+    return np.array([value is None for value in column], dtype=bool)
+
+
+def _truthy(column: np.ndarray) -> np.ndarray:
+    """Return the truthiness of each answer."""
+    if column.dtype == object:
+        return np.array([bool(value) for value in column], dtype=bool)
+    return column.astype(bool)
+
+
+def evaluate_matrix(
+    flags: np.ndarray,
+    flag_names: Sequence[str],
+    answers: Mapping[str, np.ndarray] | None = None,
+    engine: RuleEngine | None = None,
+) -> tuple[list[str], np.ndarray]:
+    """
+    Evaluate every statute for every case at once.
+
+    Answers and flags are merged as ``statute_facts`` merges them for a
+    single case: a question's answer decides both its predicates and
+    whether its name counts as an active flag, and a flag of the same name
+    only stands in (as True) where that answer is missing.
+
+    Args:
+        flags (np.ndarray): Boolean (cases, flags) matrix
+        flag_names (Sequence[str]): Name of each flag column
+        answers (Optional[Mapping[str, np.ndarray]]): Answer column per
+            question ID; missing answers should be None in object columns
+        engine (Optional[RuleEngine]): Rules to apply; defaults to the
+            statute table
+
+    Returns:
+        Tuple[List[str], np.ndarray]: Statute names, and the boolean
+        (cases, statutes) result matrix whose columns follow them
+
+    Raises:
+        ValueError: If the matrix width or an answer column length is wrong
+    """
+    engine = engine or get_rule_engine()
+    answers = {qid: np.asarray(col) for qid, col in (answers or {}).items()}
+    flags = np.asarray(flags, dtype=bool)
+    if flags.ndim != 2 or flags.shape[1] != len(flag_names):
+        raise ValueError("Flag matrix must have one column per flag name")
+    cases = flags.shape[0]
+    for question_id, column in answers.items():
+        if column.shape != (cases,):
+            raise ValueError(f"Answer column {question_id} must have one row per case")
+    source = {name: i for i, name in enumerate(flag_names)}
+    for question_id, column in answers.items():
+        if question_id in source and column.dtype == object:
+            stand_in = flags[:, source[question_id]] & _missing(column)
+            if stand_in.any():
+                column = column.copy()
+                column[stand_in] = True
+                answers[question_id] = column
+
+    # Only names some rule reads need a column; answered questions join them
+    names = [name for name in flag_names if name in engine.relevant_flags]
+    names += [
+        qid for qid in answers if qid in engine.relevant_flags and qid not in names
+    ]
+    column = {name: i for i, name in enumerate(names)}
+    active = np.zeros((cases, len(names)), dtype=bool)
+    for name, index in column.items():
+        if name in answers:
+            active[:, index] = _truthy(answers[name])
+        elif name in source:
+            active[:, index] = flags[:, source[name]]
+    words = _pack(active)
+    width = words.shape[1]
+    zero = np.uint64(0)
+
+    statutes = [rule.statute for rule in engine.rules]
+    result = np.zeros((cases, len(statutes)), dtype=bool)
+    for position, rule in enumerate(engine.rules):
+        if any(flag not in column for flag in rule.all_flags):
+            continue
+        ok = np.ones(cases, dtype=bool)
+        if rule.all_flags:
+            mask = _mask(rule.all_flags, column, width)
+            ok &= ((words & mask) == mask).all(axis=1)
+        if rule.any_flags:
+            mask = _mask((f for f in rule.any_flags if f in column), column, width)
+            ok &= ((words & mask) != zero).any(axis=1)
+        if rule.forbidden_flags:
+            present = [f for f in rule.forbidden_flags if f in column]
+            mask = _mask(present, column, width)
+            ok &= ((words & mask) == zero).all(axis=1)
+        for question_id, predicate, argument in rule.answers:
+            ok &= _predicate_column(
+                answers.get(question_id), predicate, argument, cases
+            )
+        if rule.any_statutes:
+            prerequisites = [statutes.index(s) for s in rule.any_statutes]
+            ok &= result[:, prerequisites].any(axis=1)
+        result[:, position] = ok
+    return statutes, result
@@ -0,0 +1,180 @@
+# backend/rules/deadlines.py
+"""
+Statutory deadlines for a motion to set aside a default judgment.
+
+- CCP § 473(b): within 6 months after the judgment.
+- CCP § 473.5: by the earlier of 2 years after the judgment or 180 days
+  after service of written notice of it.
+- CCP § 1005(b): moving papers served at least 16 court days before the
+  hearing, plus 5 calendar days when served by mail.
+
+A filing deadline that falls on a day the courts are closed moves to the
+next court day (CCP § 12a). Every function has a scalar form for one motion
+and an ``_array`` form over ``datetime64[D]`` columns for a caseload.
+"""
+
+import calendar
+from datetime import date, timedelta
+
+import numpy as np
+
+from grizlyudvacator.utils.court_days import CourtCalendar, get_court_calendar
+
+CCP_473B_MONTHS = 6
+CCP_473_5_YEARS = 2
+CCP_473_5_NOTICE_DAYS = 180
+CCP_1005_COURT_DAYS = 16
+CCP_1005_MAIL_DAYS = 5
+
+
+def add_months(day: date, months: int) -> date:
+    """Add calendar months, clamping to the end of shorter months."""
+    month_index = day.year * 12 + day.month - 1 + months
+    year, month = divmod(month_index, 12)
+    month += 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def add_months_array(days: np.ndarray, months: int) -> np.ndarray:
+    """Vectorized ``add_months`` over ``datetime64[D]`` dates."""
+    days = np.asarray(days, dtype="datetime64[D]")
+    month_start = days.astype("datetime64[M]")
+    offset = days - month_start.astype("datetime64[D]")
+    target = month_start + months
+    month_end = (target + 1).astype("datetime64[D]") - 1
+    return np.minimum(target.astype("datetime64[D]") + offset, month_end)
+
+
+def ccp_473b_deadline(
+    judgment_date: date, court_calendar: CourtCalendar | None = None
+) -> date:
+    """Return the last day to file under CCP § 473(b)."""
+    court_calendar = court_calendar or get_court_calendar()
+    return court_calendar.next_court_day(add_months(judgment_date, CCP_473B_MONTHS))
+
+
+def ccp_473_5_deadline(
+    judgment_date: date,
+    notice_date: date | None = None,
+    court_calendar: CourtCalendar | None = None,
+) -> date:
+    """
+    Return the last day to file under CCP § 473.5.
+
+    Args:
+        judgment_date (date): Date the default judgment was entered
+        notice_date (Optional[date]): Date written notice of the judgment
+            was served, if it was
+        court_calendar (Optional[CourtCalendar]): Calendar to use
+
+    Returns:
+        date: The earlier of the two-year and 180-day limits
+    """
+    court_calendar = court_calendar or get_court_calendar()
+    deadline = add_months(judgment_date, 12 * CCP_473_5_YEARS)
+    if notice_date is not None:
+        deadline = min(deadline, notice_date + timedelta(days=CCP_473_5_NOTICE_DAYS))
+    return court_calendar.next_court_day(deadline)
+
+
+def last_service_date(
+    hearing_date: date,
+    by_mail: bool = False,
+    court_calendar: CourtCalendar | None = None,
+) -> date:
+    """Return the last day to serve moving papers for a hearing (CCP § 1005(b))."""
+    court_calendar = court_calendar or get_court_calendar()
+    served = court_calendar.add_court_days(hearing_date, -CCP_1005_COURT_DAYS)
+    if by_mail:
+        served -= timedelta(days=CCP_1005_MAIL_DAYS)
+    return served
+
+
+def earliest_hearing_date(
+    service_date: date,
+    by_mail: bool = False,
+    court_calendar: CourtCalendar | None = None,
+) -> date:
+    """Return the first court day a motion served on ``service_date`` can be heard."""
+    court_calendar = court_calendar or get_court_calendar()
+    if by_mail:
+        service_date += timedelta(days=CCP_1005_MAIL_DAYS)
+    return court_calendar.add_court_days(service_date, CCP_1005_COURT_DAYS)
+
+
+def motion_deadlines(
+    judgment_date: date,
+    notice_date: date | None = None,
+    service_date: date | None = None,
+    by_mail: bool = False,
+    court_calendar: CourtCalendar | None = None,
+) -> dict[str, date | None]:
+    """
+    Compute the filing and hearing dates for one motion.
+
+    Args:
+        judgment_date (date): Date the default judgment was entered
+        notice_date (Optional[date]): Date written notice of the judgment was
+            served, if it was
+        service_date (Optional[date]): Date the motion is served, if known
+        by_mail (bool): Whether the motion is served by mail
+        court_calendar (Optional[CourtCalendar]): Calendar to use
+
+    Returns:
+        Dict[str, Optional[date]]: Dates keyed by ``ccp_473b``, ``ccp_473_5``
+        and ``earliest_hearing`` (None without a service date)
+    """
+    court_calendar = court_calendar or get_court_calendar()
+    return {
+        "ccp_473b": ccp_473b_deadline(judgment_date, court_calendar),
+        "ccp_473_5": ccp_473_5_deadline(judgment_date, notice_date, court_calendar),
+        "earliest_hearing": (
+            earliest_hearing_date(service_date, by_mail, court_calendar)
+            if service_date is not None
+            else None
+        ),
+    }
+
+
+def motion_deadlines_array(
+    judgment_dates: np.ndarray,
+    notice_dates: np.ndarray | None = None,
+    service_dates: np.ndarray | None = None,
+    by_mail: bool | np.ndarray = False,
+    court_calendar: CourtCalendar | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Vectorized ``motion_deadlines`` over ``datetime64[D]`` columns.
+
+    NaT inputs give NaT for the dates that depend on them; a NaT notice
+    date means no notice was served.
+
+    Returns:
+        Dict[str, np.ndarray]: ``datetime64[D]`` columns keyed like
+        ``motion_deadlines``
+    """
+    court_calendar = court_calendar or get_court_calendar()
+    judgment_dates = np.asarray(judgment_dates, dtype="datetime64[D]")
+
+    ccp_473b = add_months_array(judgment_dates, CCP_473B_MONTHS)
+    ccp_473_5 = add_months_array(judgment_dates, 12 * CCP_473_5_YEARS)
+    if notice_dates is not None:
+        notice_limit = np.asarray(notice_dates, dtype="datetime64[D]") + np.timedelta64(
+            CCP_473_5_NOTICE_DAYS, "D"
+        )
+        ccp_473_5 = np.where(
+            np.isnat(notice_limit), ccp_473_5, np.fmin(ccp_473_5, notice_limit)
+        )
+
+    if service_dates is None:
+        earliest = np.full(judgment_dates.shape, np.datetime64("NaT"), "datetime64[D]")
+    else:
+        mail_days = np.where(by_mail, CCP_1005_MAIL_DAYS, 0).astype("timedelta64[D]")
+        served = np.asarray(service_dates, dtype="datetime64[D]") + mail_days
+        earliest = court_calendar.add_court_days_array(served, CCP_1005_COURT_DAYS)
+
+    return {
+        "ccp_473b": court_calendar.next_court_day_array(ccp_473b),
+        "ccp_473_5": court_calendar.next_court_day_array(ccp_473_5),
+        "earliest_hearing": earliest,
+    }
@@ -0,0 +1,184 @@
+# backend/rules/incremental.py
+"""
+Incremental statute matching.
+
+``IncrementalMatcher`` keeps partial matches for every rule of a compiled
+``RuleEngine``, in the spirit of a Rete network: per-flag memories (which
+names are active) feed per-rule counters of present required, trigger and
+forbidden flags, failing answer predicates and applying prerequisite
+statutes. Asserting or retracting one flag or answer only updates the
+rules indexed under it, and a statute's eligibility change propagates only
+to the rules that depend on it, so the live result is always current with
+no full re-evaluation.
+"""
+
+from typing import Any
+
+from .rule_engine import PREDICATES, RuleEngine, get_rule_engine
+
+
+class IncrementalMatcher:
+    """
+    Live statute eligibility for one case.
+
+    Facts follow ``RuleEngine.evaluate``: a name is active when it is a
+    raised flag or a question with a truthy answer.
+
+    Attributes:
+        engine (RuleEngine): Compiled rule table being matched
+        answers (Dict[str, Any]): Answers asserted so far
+    """
+
+    __slots__ = (
+        "engine",
+        "answers",
+        "_refs",
+        "_all",
+        "_any",
+        "_forbidden",
+        "_failing",
+        "_prerequisites",
+        "_eligible",
+    )
+
+    def __init__(self, engine: RuleEngine | None = None) -> None:
+        """
+        Start with no flags or answers.
+
+        Args:
+            engine (Optional[RuleEngine]): Rules to match; defaults to the
+                statute table
+        """
+        self.engine = engine or get_rule_engine()
+        rules = self.engine.rules
+        self.answers: dict[str, Any] = {}
+        self._refs: dict[str, int] = {}
+        self._all = [0] * len(rules)
+        self._any = [0] * len(rules)
+        self._forbidden = [0] * len(rules)
+        self._failing = [
+            sum(not PREDICATES[p](None, arg) for _, p, arg in rule.answers)
+            for rule in rules
+        ]
+        self._prerequisites = [0] * len(rules)
+        self._eligible: set[int] = set()
+        for position in range(len(rules)):
+            self._recheck(position)
+
+    @property
+    def eligible(self) -> list[str]:
+        """Statutes that currently apply, in declaration order."""
+        rules = self.engine.rules
+        return [rules[position].statute for position in sorted(self._eligible)]
+
+    def is_active(self, name: str) -> bool:
+        """Check whether a flag or truthy answer named ``name`` is asserted."""
+        return name in self._refs
+
+    def add_flag(self, name: str) -> None:
+        """Assert a raised flag."""
+        self._acquire(name)
+
+    def remove_flag(self, name: str) -> None:
+        """Retract a flag previously asserted with ``add_flag``."""
+        self._release(name)
+
+    def set_answer(self, question_id: str, answer: Any) -> None:
+        """Assert or replace the answer to a question."""
+        old = self.answers.get(question_id)
+        had = question_id in self.answers
+        self.answers[question_id] = answer
+        self._answer_changed(question_id, had and bool(old), bool(answer), old)
+
+    def clear_answer(self, question_id: str) -> None:
+        """Retract the answer to a question, if any."""
+        if question_id in self.answers:
+            old = self.answers.pop(question_id)
+            self._answer_changed(question_id, bool(old), False, old)
+
+    def result(self) -> dict[str, Any]:
+        """
+        Return the current result in ``RuleEngine.evaluate`` form.
+
+        Returns:
+            Dict[str, Any]: ``statutes`` and their ``justification``
+        """
+        rules = self.engine.rules
+        justification: dict[str, list[str]] = {}
+        for position in sorted(self._eligible):
+            rule = rules[position]
+            reasons = sorted(flag for flag in rule.trigger_flags if flag in self._refs)
+            reasons += [s for s in justification if s in rule.any_statutes]
+            justification[rule.statute] = reasons
+        return {"statutes": list(justification), "justification": justification}
+
+    def _answer_changed(
+        self, question_id: str, was_true: bool, is_true: bool, old: Any
+    ) -> None:
+        """Update answer predicates and the answer's active name."""
+        rules = self.engine.rules
+        new = self.answers.get(question_id)
+        for position in self.engine.answer_index.get(question_id, ()):
+            for check_id, predicate, argument in rules[position].answers:
+                if check_id == question_id:
+                    test = PREDICATES[predicate]
+                    self._failing[position] += (not test(new, argument)) - (
+                        not test(old, argument)
+                    )
+            self._recheck(position)
+        if is_true and not was_true:
+            self._acquire(question_id)
+        elif was_true and not is_true:
+            self._release(question_id)
+
+    def _acquire(self, name: str) -> None:
+        """Count one more source for ``name``; activate it on the first."""
+        count = self._refs.get(name, 0)
+        self._refs[name] = count + 1
+        if not count:
+            self._flag_changed(name, 1)
+
+    def _release(self, name: str) -> None:
+        """Drop one source for ``name``; deactivate it on the last."""
+        count = self._refs.get(name, 0)
+        if count <= 1:
+            if self._refs.pop(name, None) is not None:
+                self._flag_changed(name, -1)
+        else:
+            self._refs[name] = count - 1
+
+    def _flag_changed(self, name: str, delta: int) -> None:
+        """Update the counters of every rule that mentions ``name``."""
+        rules = self.engine.rules
+        for position in self.engine.index.get(name, ()):
+            rule = rules[position]
+            if name in rule.all_flags:
+                self._all[position] += delta
+            if name in rule.any_flags:
+                self._any[position] += delta
+            self._recheck(position)
+        for position in self.engine.forbidden_index.get(name, ()):
+            self._forbidden[position] += delta
+            self._recheck(position)
+
+    def _recheck(self, position: int) -> None:
+        """Re-derive one rule's eligibility and propagate any change."""
+        rule = self.engine.rules[position]
+        eligible = (
+            self._all[position] == len(rule.all_flags)
+            and (not rule.any_flags or self._any[position] > 0)
+            and not self._forbidden[position]
+            and not self._failing[position]
+            and (not rule.any_statutes or self._prerequisites[position] > 0)
+        )
+        if eligible == (position in self._eligible):
+            return
+        if eligible:
+            self._eligible.add(position)
+            delta = 1
+        else:
+            self._eligible.discard(position)
+            delta = -1
+        for dependent in self.engine.dependents.get(rule.statute, ()):
+            self._prerequisites[dependent] += delta
+            self._recheck(dependent)
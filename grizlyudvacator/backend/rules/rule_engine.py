@@ -1,32 +1,423 @@
 # backend/rules/rule_engine.py
-from .ccp_473b import evaluate_ccp_473b
+"""
+Table-driven statute evaluation.
 
+Each statute is declared as data (see ``statutes.py``): the flags that
+trigger it, flags it requires or forbids, predicates on interview answers,
+and statutes it depends on. ``RuleEngine`` compiles the table into an
+inverted index from flag to the rules that flag can trigger, so one
+evaluation only visits rules touched by the active flags and its cost grows
+with the number of active flags rather than the number of rules.
+"""
 
-def evaluate_statutes(answers):
+import hashlib
+import heapq
+import json
+from collections import OrderedDict
+from collections.abc import Container, Iterable, Mapping
+from typing import Any
+
+from . import statutes
+from .statutes import StatuteRule
+
+# Answer predicates, by name: (answer, argument) -> bool. Missing answers
+# are passed as None.
+PREDICATES = {
+    "truthy": lambda value, arg: bool(value),
+    "falsy": lambda value, arg: not value,
+    "eq": lambda value, arg: value == arg,
+    "ne": lambda value, arg: value != arg,
+    "in": lambda value, arg: value in arg,
+}
+
+
+def rules_version(rules: Iterable[StatuteRule]) -> str:
+    """
+    Return a stable hash of rule definitions.
+
+    Sets are sorted first so the hash does not depend on string hash
+    randomization and is the same in every process.
+    """
+    canonical = [
+        [
+            rule.statute,
+            rule.description,
+            sorted(rule.any_flags),
+            sorted(rule.all_flags),
+            sorted(rule.forbidden_flags),
+            [list(check) for check in rule.answers],
+            sorted(rule.any_statutes),
+        ]
+        for rule in rules
+    ]
+    data = json.dumps(canonical, default=repr, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _flag_condition(
+    condition: str, names: Iterable[str], active: Container[str]
+) -> dict[str, Any]:
+    """Trace one flag or statute condition of a rule for ``explain``."""
+    inputs = {name: name in active for name in sorted(names)}
+    if condition == "all_flags":
+        value = all(inputs.values())
+    elif condition == "forbidden_flags":
+        value = not any(inputs.values())
+    else:
+        value = any(inputs.values())
+    return {"condition": condition, "value": value, "inputs": inputs}
+
+
+class RuleEngine:
     """
-    Given a list of flags, return applicable CCP statutes and the justification map.
+    Compiled statute table with a flag -> rules inverted index.
+
+    Attributes:
+        rules (Tuple[StatuteRule, ...]): Rules in declaration order
+        index (Dict[str, Tuple[int, ...]]): Rule positions triggered by each flag
+        dependents (Dict[str, Tuple[int, ...]]): Rule positions depending on
+            each statute
+        forbidden_index (Dict[str, Tuple[int, ...]]): Rule positions each
+            flag disqualifies
+        answer_index (Dict[str, Tuple[int, ...]]): Rule positions with a
+            predicate on each question's answer
+        version (str): Hash of the rule definitions
     """
-    # Evaluate CCP § 473(b) first
-    ccp_473b_flags = evaluate_ccp_473b(answers)
-    if ccp_473b_flags:
+
+    __slots__ = (
+        "rules",
+        "index",
+        "dependents",
+        "forbidden_index",
+        "answer_index",
+        "relevant_flags",
+        "version",
+    )
+
+    def __init__(self, rules: Iterable[StatuteRule]) -> None:
+        """
+        Compile a rule table.
+
+        Args:
+            rules (Iterable[StatuteRule]): Rules in evaluation order
+
+        Raises:
+            ValueError: If a rule has no triggers, uses an unknown predicate,
+                or depends on a statute not declared before it
+        """
+        self.rules = tuple(rules)
+        index: dict[str, list[int]] = {}
+        dependents: dict[str, list[int]] = {}
+        forbidden_index: dict[str, list[int]] = {}
+        answer_index: dict[str, list[int]] = {}
+        declared: set[str] = set()
+
+        for position, rule in enumerate(self.rules):
+            if not rule.trigger_flags and not rule.any_statutes:
+                raise ValueError(f"Rule {rule.statute} has no trigger flags")
+            for question_id, predicate, _ in rule.answers:
+                if predicate not in PREDICATES:
+                    raise ValueError(
+                        f"Rule {rule.statute} uses unknown predicate "
+                        f"'{predicate}' on {question_id}"
+                    )
+                positions = answer_index.setdefault(question_id, [])
+                if position not in positions:
+                    positions.append(position)
+            for statute in rule.any_statutes:
+                if statute not in declared:
+                    raise ValueError(
+                        f"Rule {rule.statute} depends on undeclared statute {statute}"
+                    )
+                dependents.setdefault(statute, []).append(position)
+            for flag in rule.trigger_flags:
+                index.setdefault(flag, []).append(position)
+            for flag in rule.forbidden_flags:
+                forbidden_index.setdefault(flag, []).append(position)
+            declared.add(rule.statute)
+
+        self.index = {flag: tuple(p) for flag, p in index.items()}
+        self.dependents = {statute: tuple(p) for statute, p in dependents.items()}
+        self.forbidden_index = {f: tuple(p) for f, p in forbidden_index.items()}
+        self.answer_index = {qid: tuple(p) for qid, p in answer_index.items()}
+        self.relevant_flags = frozenset(self.index) | frozenset(self.forbidden_index)
+        self.version = rules_version(self.rules)
+
+    @staticmethod
+    def active_flags(facts: Mapping[str, Any] | Iterable[str]) -> set[str]:
+        """Return the active flags in a facts mapping or flag list."""
+        if isinstance(facts, Mapping):
+            return {key for key, value in facts.items() if value}
+        return set(facts)
+
+    def matches(
+        self,
+        rule: StatuteRule,
+        active: set[str],
+        facts: Mapping[str, Any],
+        applied: Mapping[str, Any],
+    ) -> list[str] | None:
+        """
+        Check one rule, returning its justification or None if it fails.
+
+        Args:
+            rule (StatuteRule): Rule to check
+            active (Set[str]): Active flags
+            facts (Mapping[str, Any]): Answers and flags
+            applied (Mapping[str, Any]): Statutes already found to apply
+
+        Returns:
+            Optional[List[str]]: Matched flags, or matched statutes for
+            statute-dependent rules
+        """
+        if not rule.all_flags <= active or rule.forbidden_flags & active:
+            return None
+        if rule.any_flags and not rule.any_flags & active:
+            return None
+        for question_id, predicate, argument in rule.answers:
+            if not PREDICATES[predicate](facts.get(question_id), argument):
+                return None
+        reasons = sorted(rule.trigger_flags & active)
+        if rule.any_statutes:
+            statutes = [s for s in applied if s in rule.any_statutes]
+            if not statutes:
+                return None
+            reasons += statutes
+        return reasons
+
+    def evaluate(self, facts: Mapping[str, Any] | Iterable[str]) -> dict[str, Any]:
+        """
+        Evaluate every statute against a case in one pass.
+
+        Args:
+            facts (Union[Mapping[str, Any], Iterable[str]]): Answers merged
+                with flags set to True, or just a list of flag names
+
+        Returns:
+            Dict[str, Any]: ``statutes`` that apply, in declaration order, and
+            ``justification`` mapping each to the flags or statutes behind it
+        """
+        active = self.active_flags(facts)
+        if not isinstance(facts, Mapping):
+            facts = dict.fromkeys(active, True)
+
+        index = self.index
+        candidates = sorted(
+            {position for flag in active for position in index.get(flag, ())}
+        )
+        queued = set(candidates)
+        justification: dict[str, list[str]] = {}
+        while candidates:
+            rule = self.rules[heapq.heappop(candidates)]
+            reasons = self.matches(rule, active, facts, justification)
+            if reasons is None:
+                continue
+            justification[rule.statute] = reasons
+            for position in self.dependents.get(rule.statute, ()):
+                if position not in queued:
+                    queued.add(position)
+                    heapq.heappush(candidates, position)
+
+        return {"statutes": list(justification), "justification": justification}
+
+    def explain(self, facts: Mapping[str, Any] | Iterable[str]) -> dict[str, Any]:
+        """
+        Evaluate like ``evaluate`` while recording every condition checked.
+
+        This is a separate path so ``evaluate`` carries no tracing cost. All
+        rules are checked, including those no active flag reaches, so the
+        trace also says why a statute does not apply.
+
+        Args:
+            facts (Union[Mapping[str, Any], Iterable[str]]): As for ``evaluate``
+
+        Returns:
+            Dict[str, Any]: The ``evaluate`` result plus ``explanation``, one
+            entry per rule with the statute, whether it ``applies`` and its
+            ``conditions``. Each condition names its kind, its ``value`` and
+            the ``inputs`` it was computed from.
+        """
+        active = self.active_flags(facts)
+        if not isinstance(facts, Mapping):
+            facts = dict.fromkeys(active, True)
+
+        justification: dict[str, list[str]] = {}
+        explanation = []
+        for rule in self.rules:
+            conditions = []
+            if rule.all_flags:
+                conditions.append(_flag_condition("all_flags", rule.all_flags, active))
+            if rule.any_flags:
+                conditions.append(_flag_condition("any_flags", rule.any_flags, active))
+            if rule.forbidden_flags:
+                conditions.append(
+                    _flag_condition("forbidden_flags", rule.forbidden_flags, active)
+                )
+            for question_id, predicate, argument in rule.answers:
+                answer = facts.get(question_id)
+                conditions.append(
+                    {
+                        "condition": "answer",
+                        "predicate": predicate,
+                        "argument": argument,
+                        "value": PREDICATES[predicate](answer, argument),
+                        "inputs": {question_id: answer},
+                    }
+                )
+            if rule.any_statutes:
+                conditions.append(
+                    _flag_condition("any_statutes", rule.any_statutes, justification)
+                )
+
+            applies = all(condition["value"] for condition in conditions)
+            if applies:
+                reasons = sorted(rule.trigger_flags & active)
+                reasons += [s for s in justification if s in rule.any_statutes]
+                justification[rule.statute] = reasons
+            explanation.append(
+                {"statute": rule.statute, "applies": applies, "conditions": conditions}
+            )
+
         return {
-            "statutes": ["CCP § 473(b)"],
-            "justification": "Excusable neglect, mistake, surprise, or inadvertence",
+            "statutes": list(justification),
+            "justification": justification,
+            "explanation": explanation,
         }
 
-    # If no CCP § 473(b) flags, check for other conditions
-    if answers.get("judgment_void_on_face", False):
+    def fingerprint(
+        self, facts: Mapping[str, Any] | Iterable[str]
+    ) -> tuple[frozenset[str], tuple[bool, ...]]:
+        """
+        Return a canonical key for everything the rules can observe.
+
+        Two cases with the same fingerprint get the same result: it holds
+        the active flags that some rule mentions and the outcome of every
+        answer predicate, so unrelated flags and answer wording do not
+        split the key.
+        """
+        active = self.active_flags(facts)
+        if not isinstance(facts, Mapping):
+            facts = dict.fromkeys(active, True)
+        outcomes = tuple(
+            PREDICATES[predicate](facts.get(question_id), argument)
+            for rule in self.rules
+            for question_id, predicate, argument in rule.answers
+        )
+        return frozenset(active & self.relevant_flags), outcomes
+
+
+class RuleCache:
+    """
+    Bounded LRU of rule results keyed by ``RuleEngine.fingerprint``.
+
+    Without an explicit engine the cache follows ``get_rule_engine()`` and
+    drops every entry when the rule definitions' version hash changes.
+
+    Attributes:
+        maxsize (int): Maximum number of cached results
+        hits (int): Lookups answered from the cache
+        misses (int): Lookups that ran the rule engine
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_engine", "_version", "_results")
+
+    def __init__(self, engine: RuleEngine | None = None, maxsize: int = 4096) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            engine (Optional[RuleEngine]): Fixed engine; defaults to
+                following the statute table
+            maxsize (int): Maximum number of cached results
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._engine = engine
+        self._version: str | None = None
+        self._results: OrderedDict[Any, dict[str, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @property
+    def engine(self) -> RuleEngine:
+        """Engine results are computed with."""
+        return self._engine or get_rule_engine()
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the counters."""
+        self._results.clear()
+        self.hits = self.misses = 0
+
+    def evaluate(self, facts: Mapping[str, Any] | Iterable[str]) -> dict[str, Any]:
+        """
+        Return ``RuleEngine.evaluate(facts)``, from the cache when possible.
+
+        Returns:
+            Dict[str, Any]: A fresh copy of the result, safe to modify
+        """
+        engine = self.engine
+        if engine.version != self._version:
+            self.clear()
+            self._version = engine.version
+
+        if not isinstance(facts, Mapping):
+            facts = dict.fromkeys(facts, True)
+        key = engine.fingerprint(facts)
+        result = self._results.get(key)
+        if result is None:
+            self.misses += 1
+            result = engine.evaluate(facts)
+            self._results[key] = result
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        else:
+            self.hits += 1
+            self._results.move_to_end(key)
+
+        justification = result["justification"]
         return {
-            "statutes": ["CCP § 473(d)"],
-            "justification": "Void judgment due to lack of jurisdiction or facial defects",
+            "statutes": list(result["statutes"]),
+            "justification": {s: list(r) for s, r in justification.items()},
         }
 
-    return {"statutes": [], "justification": {}}
 
-    for statute, info in rules.items():
-        matched_flags = [f for f in flags if f in info["flags"]]
-        if matched_flags:
-            result["statutes"].append(statute)
-            result["justification"][statute] = matched_flags
+_engine: RuleEngine | None = None
+_engine_rules: tuple[StatuteRule, ...] | None = None
+_cache = RuleCache()
 
-    return result
+
+def get_rule_engine() -> RuleEngine:
+    """
+    Return the engine compiled from ``statutes.STATUTE_RULES``.
+
+    The table is recompiled whenever ``STATUTE_RULES`` is replaced.
+    """
+    global _engine, _engine_rules
+    rules = statutes.STATUTE_RULES
+    if _engine is None or rules is not _engine_rules:
+        _engine = RuleEngine(rules)
+        _engine_rules = rules
+    return _engine
+
+
+def get_rule_cache() -> RuleCache:
+    """Return the shared cache used by ``evaluate_statutes``."""
+    return _cache
+
+
+def evaluate_statutes(
+    facts: Mapping[str, Any] | Iterable[str], explain: bool = False
+) -> dict[str, Any]:
+    """
+    Given a case's flags (or answers merged with flags), return every
+    applicable CCP statute and the justification map.
+
+    Results are memoized by flag-set fingerprint; see ``RuleCache``. With
+    ``explain`` the result also carries a per-condition ``explanation``
+    from ``RuleEngine.explain``, which is never cached.
+    """
+    if explain:
+        return get_rule_engine().explain(facts)
+    return _cache.evaluate(facts)
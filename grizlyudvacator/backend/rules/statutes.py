@@ -0,0 +1,89 @@
+# backend/rules/statutes.py
+"""
+Statute rule table.
+
+Each entry states, as data, when a statute supports the motion. The flags
+come from the interview YAML (``cli/prompts/vacate_default.yaml``) and the
+conditions checked by ``ccp_473b.evaluate_ccp_473b``. Rules that depend on
+other statutes must be listed after them.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class StatuteRule:
+    """
+    Declarative conditions under which a statute applies.
+
+    Attributes:
+        statute (str): Statute name, e.g. ``CCP § 473(b)``
+        description (str): Short legal basis for the statute
+        any_flags (FrozenSet[str]): At least one must be active, if given
+        all_flags (FrozenSet[str]): All must be active
+        forbidden_flags (FrozenSet[str]): None may be active
+        answers (Tuple[Tuple[str, str, Any], ...]): ``(question_id,
+            predicate, argument)`` checks that must all hold; see
+            ``rule_engine.PREDICATES``
+        any_statutes (FrozenSet[str]): At least one must apply, if given
+    """
+
+    statute: str
+    description: str = ""
+    any_flags: frozenset[str] = frozenset()
+    all_flags: frozenset[str] = frozenset()
+    forbidden_flags: frozenset[str] = frozenset()
+    answers: tuple[tuple[str, str, Any], ...] = ()
+    any_statutes: frozenset[str] = frozenset()
+
+    @property
+    def trigger_flags(self) -> frozenset[str]:
+        """Flags whose presence can make this rule apply."""
+        return self.any_flags | self.all_flags
+
+
+CCP_473B = "CCP § 473(b)"
+CCP_473_5 = "CCP § 473.5"
+CCP_473D = "CCP § 473(d)"
+CCP_918 = "CCP § 918"
+
+STATUTE_RULES = (
+    StatuteRule(
+        CCP_473B,
+        "Excusable neglect, mistake, surprise, or inadvertence",
+        any_flags=frozenset(
+            {
+                "excusable_neglect",
+                "illness",
+                "work_conflict",
+                "misunderstood",
+                "relied_on_someone",
+                "emotional_state",
+                "tenant_unaware_of_hearing",
+                "mailing_not_done",
+                "service_defective",
+                "tenant_mistake_or_confusion",
+                "unable_to_appear_due_to_emergency",
+            }
+        ),
+    ),
+    StatuteRule(
+        CCP_473_5,
+        "No actual notice in time to defend the action",
+        any_flags=frozenset({"no_actual_notice"}),
+        answers=(("received_notice", "ne", True),),
+    ),
+    StatuteRule(
+        CCP_473D,
+        "Void judgment due to lack of jurisdiction or facial defects",
+        any_flags=frozenset(
+            {"judgment_void_on_face", "jurisdiction_defect", "wrong_address_service"}
+        ),
+    ),
+    StatuteRule(
+        CCP_918,
+        "Stay of enforcement while the motion to set aside is pending",
+        any_statutes=frozenset({CCP_473B, CCP_473_5, CCP_473D}),
+    ),
+)
@@ -0,0 +1,433 @@
+"""
+Non-interactive batch triage of intake files.
+
+Records are streamed from a JSONL or CSV file, walked through the compiled
+interview and statute rules by ``evaluate_case``, and written as JSONL in
+input order. Records that cannot be read (malformed JSON, or JSON that is
+not an object) are written with their byte offset to a separate errors
+file and the run goes on. Work is sent to a process pool in chunks with a
+bounded number of chunks in flight, so memory stays flat however large the
+input is. After each written chunk a checkpoint records the input byte
+offset and both output sizes, and an interrupted run resumes from there
+as long as the input file is unchanged.
+"""
+
+import csv
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from grizlyudvacator.cli.interview.artifact_cache import load_compiled_interview
+from grizlyudvacator.cli.interview.batch import evaluate_case
+from grizlyudvacator.cli.interview.interview_engine import CompiledInterview
+from grizlyudvacator.utils.path_utils import get_output_dir
+
+TRUE_STRINGS = frozenset({"true", "t", "yes", "y", "1"})
+FALSE_STRINGS = frozenset({"false", "f", "no", "n", "0"})
+
+# Compiled interview of a pool worker, loaded once by ``_init_worker``
+_worker_state: dict[str, Any] = {}
+
+
+def coerce_answer(question_type: str, raw: str) -> Any:
+    """
+    Convert a CSV cell to the answer type a question expects.
+
+    Args:
+        question_type (str): The question's ``type``
+        raw (str): Cell text
+
+    Returns:
+        Any: The typed answer; unrecognized booleans and numbers are left as
+        text so validation reports them
+    """
+    value = raw.strip()
+    if question_type == "boolean":
+        lowered = value.lower()
+        if lowered in TRUE_STRINGS:
+            return True
+        if lowered in FALSE_STRINGS:
+            return False
+    elif question_type == "number":
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    elif question_type == "multiple_choice":
+        return [part.strip() for part in value.split(";") if part.strip()]
+    return value
+
+
+def _read_lines(stream: BinaryIO, offset: int) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(end offset, line)`` for each line from ``offset`` on."""
+    stream.seek(offset)
+    for line in iter(stream.readline, b""):
+        offset += len(line)
+        yield offset, line
+
+
+def _parse_json_record(line: bytes) -> dict[str, Any]:
+    """Parse one JSONL line, which must hold a JSON object."""
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError(f"expected a JSON object, got {type(record).__name__}")
+    return record
+
+
+def iter_records(
+    path: str | Path,
+    offset: int = 0,
+    on_error: Callable[[int, str], None] | None = None,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Stream intake records from a JSONL or CSV file.
+
+    JSONL lines hold either an answers object or ``{"case_id": ...,
+    "answers": {...}}``. CSV files have a header of question IDs and an
+    optional ``case_id`` column; multi-line quoted cells are supported.
+
+    Args:
+        path (Union[str, Path]): Input file; ``.csv`` selects CSV
+        offset (int): Byte offset to resume from (0 for the start)
+        on_error (Optional[Callable[[int, str], None]]): Called with the
+            record's starting byte offset and the reason for each record
+            that cannot be read, which is then skipped; without it the
+            first such record raises
+
+    Yields:
+        Tuple[int, Dict[str, Any]]: Byte offset just past the record, and
+        the raw record
+
+    Raises:
+        ValueError: If a record cannot be read and ``on_error`` is None
+    """
+
+    def reject(start: int, error: Exception) -> None:
+        if on_error is None:
+            raise ValueError(f"Unreadable record at byte {start}: {error}") from error
+        on_error(start, str(error))
+
+    path = Path(path)
+    with open(path, "rb") as stream:
+        if path.suffix.lower() != ".csv":
+            start = offset
+            for end, line in _read_lines(stream, offset):
+                if line.strip():
+                    try:
+                        record = _parse_json_record(line)
+                    except ValueError as e:  # includes JSON and UTF-8 errors
+                        reject(start, e)
+                    else:
+                        yield end, record
+                start = end
+            return
+
+        header_line = stream.readline()
+        header = next(csv.reader([header_line.decode("utf-8-sig")]))
+        pending = b""
+        start = max(offset, len(header_line))
+        for end, line in _read_lines(stream, start):
+            pending += line
+            if pending.count(b'"') % 2:
+                continue  # a quoted cell continues on the next line
+            raw, pending = pending, b""
+            try:
+                text = raw.decode("utf-8")
+                row = next(csv.reader(io.StringIO(text))) if text.strip() else None
+            except (ValueError, csv.Error) as e:
+                reject(start, e)
+            else:
+                if row is not None:
+                    yield end, dict(zip(header, row))
+            start = end
+
+
+def normalize_record(
+    compiled: CompiledInterview, record: dict[str, Any], number: int, from_csv: bool
+) -> tuple[str, dict[str, Any]]:
+    """Split a raw record into its case ID and typed answers."""
+    if "answers" in record and isinstance(record["answers"], dict):
+        case_id = record.get("case_id", number)
+        answers = record["answers"]
+    else:
+        answers = dict(record)
+        case_id = answers.pop("case_id", number)
+    if from_csv:
+        questions = compiled.questions
+        answers = {
+            qid: coerce_answer(questions[qid].type, raw)
+            for qid, raw in answers.items()
+            if qid in questions and raw.strip()
+        }
+    return str(case_id), answers
+
+
+def motion_path(documents_dir: Path, case_id: str, offset: int) -> Path:
+    """
+    Return where a case's motion is written.
+
+    The record's byte offset (just past it in the input) keeps names unique
+    when case IDs repeat, and stable across a resumed run, which rewrites
+    the same files.
+    """
+    name = re.sub(r"[^A-Za-z0-9_.-]+", "_", case_id)[:64]
+    return documents_dir / f"motion_{offset}_{name}.docx"
+
+
+def triage_records(
+    compiled: CompiledInterview,
+    records: list[tuple[int, str, dict[str, Any]]],
+    documents_dir: Path | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Evaluate a chunk of normalized records.
+
+    Args:
+        compiled (CompiledInterview): Interview to walk
+        records (List[Tuple[int, str, Dict[str, Any]]]): ``(input offset
+            past the record, case ID, answers)`` per record
+        documents_dir (Optional[Path]): Also render a motion into this
+            directory for each case with at least one applicable statute
+
+    Returns:
+        List[Dict[str, Any]]: One output record per input, in order
+    """
+    if documents_dir is not None:
+        # docxtpl is only needed when documents are requested
+        from grizlyudvacator.backend.generator.doc_filler import render_motion
+
+    results = []
+    for offset, case_id, answers in records:
+        case = evaluate_case(compiled, answers)
+        case = {"case_id": case_id, **case}
+        if documents_dir is not None and case["result"]["statutes"]:
+            path = motion_path(documents_dir, case_id, offset)
+            try:
+                render_motion(case["answers"], case["result"], path)
+                case["motion"] = str(path)
+            except Exception as e:
+                case["motion"] = None
+                case["motion_error"] = str(e)
+        results.append(case)
+    return results
+
+
+def _init_worker(yaml_path: str) -> None:
+    """Load the compiled interview once per pool worker."""
+    _worker_state["compiled"] = load_compiled_interview(yaml_path)
+
+
+def _triage_in_worker(
+    records: list[tuple[int, str, dict[str, Any]]], documents_dir: Path | None
+) -> list[dict[str, Any]]:
+    """Pool entry point for ``triage_records``."""
+    return triage_records(_worker_state["compiled"], records, documents_dir)
+
+
+class _InlineExecutor(Executor):
+    """Runs submitted work immediately; used when ``workers`` is 0."""
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+def read_checkpoint(path: Path) -> dict[str, int] | None:
+    """Return a saved checkpoint, or None if there is none."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def input_signature(path: Path) -> dict[str, int]:
+    """Return the size and modification time a checkpoint is only valid for."""
+    stat = path.stat()
+    return {"input_size": stat.st_size, "input_mtime_ns": stat.st_mtime_ns}
+
+
+def errors_path(output_path: Path) -> Path:
+    """Return the file unreadable records of a run are written to."""
+    return output_path.with_name(output_path.stem + ".errors.jsonl")
+
+
+def _write_checkpoint(path: Path, checkpoint: dict[str, int]) -> None:
+    """Atomically replace the checkpoint file."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def run_batch(
+    input_path: str | Path,
+    output_path: str | Path,
+    yaml_path: str,
+    workers: int | None = None,
+    chunk_size: int = 256,
+    max_pending: int | None = None,
+    generate_documents: bool = False,
+    resume: bool = True,
+    progress: Callable[[int, float], None] | None = None,
+    documents_dir: str | Path | None = None,
+) -> int:
+    """
+    Triage every record of an intake file into a JSONL results file.
+
+    Records that cannot be read go to ``<output stem>.errors.jsonl`` as
+    ``{"offset": ..., "error": ...}`` lines instead, and the run continues.
+
+    Args:
+        input_path (Union[str, Path]): JSONL or CSV intake file
+        output_path (Union[str, Path]): JSONL results file
+        yaml_path (str): Interview YAML to evaluate against
+        workers (Optional[int]): Pool size; 0 runs in-process, None uses
+            every CPU
+        chunk_size (int): Records per task sent to a worker
+        max_pending (Optional[int]): Chunks in flight before reading pauses;
+            defaults to twice the worker count
+        generate_documents (bool): Render a motion for each eligible case
+        resume (bool): Continue from ``<output>.checkpoint`` if present
+        progress (Optional[Callable[[int, float], None]]): Called after each
+            chunk with records written in this run and elapsed seconds
+        documents_dir (Optional[Union[str, Path]]): Where motions are
+            written (default: a directory named after the results file
+            under output/documents)
+
+    Returns:
+        int: Total records in the results file
+
+    Raises:
+        ValueError: If resuming from a checkpoint written for a different
+            version of the input file
+    """
+    input_path, output_path = Path(input_path), Path(output_path)
+    checkpoint_path = output_path.with_name(output_path.name + ".checkpoint")
+    error_path = errors_path(output_path)
+    from_csv = input_path.suffix.lower() == ".csv"
+    compiled = load_compiled_interview(yaml_path)
+    signature = input_signature(input_path)
+    if generate_documents:
+        documents_dir = Path(documents_dir or get_output_dir() / output_path.stem)
+    else:
+        documents_dir = None
+
+    checkpoint = read_checkpoint(checkpoint_path) if resume else None
+    if checkpoint is None:
+        checkpoint = {"offset": 0, "records": 0, "output_size": 0, "errors_size": 0}
+    elif any(checkpoint.get(key) != value for key, value in signature.items()):
+        raise ValueError(
+            f"{input_path} changed since {checkpoint_path} was written; "
+            "start over without resuming (--restart)"
+        )
+    offset, total = checkpoint["offset"], checkpoint["records"]
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Drop output written after the last checkpoint; it is redone
+    for path, size in (
+        (output_path, checkpoint["output_size"]),
+        (error_path, checkpoint["errors_size"]),
+    ):
+        with open(path, "ab") as f:
+            f.truncate(size)
+
+    if workers == 0:
+        executor: Executor = _InlineExecutor()
+        max_pending = max_pending or 1
+
+        def submit(chunk: list[tuple[int, str, dict[str, Any]]]) -> Future:
+            return executor.submit(triage_records, compiled, chunk, documents_dir)
+
+    else:
+        workers = workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(
+            workers, initializer=_init_worker, initargs=(yaml_path,)
+        )
+        max_pending = max_pending or 2 * workers
+
+        def submit(chunk: list[tuple[int, str, dict[str, Any]]]) -> Future:
+            return executor.submit(_triage_in_worker, chunk, documents_dir)
+
+    started = time.monotonic()
+    written = 0
+    # (future, input offset past the chunk, unreadable records in the chunk)
+    pending: deque[tuple[Future, int, list[bytes]]] = deque()
+
+    with executor, open(output_path, "ab") as out, open(error_path, "ab") as errors:
+
+        def drain_one() -> None:
+            nonlocal total, written
+            future, chunk_end, chunk_errors = pending.popleft()
+            results = future.result()
+            lines = (json.dumps(r, ensure_ascii=False, default=str) for r in results)
+            out.write("".join(line + "\n" for line in lines).encode("utf-8"))
+            out.flush()
+            errors.write(b"".join(chunk_errors))
+            errors.flush()
+            total += len(results)
+            written += len(results)
+            _write_checkpoint(
+                checkpoint_path,
+                {
+                    "offset": chunk_end,
+                    "records": total,
+                    "output_size": out.tell(),
+                    "errors_size": errors.tell(),
+                    **signature,
+                },
+            )
+            if progress is not None:
+                progress(written, time.monotonic() - started)
+
+        chunk: list[tuple[int, str, dict[str, Any]]] = []
+        chunk_errors: list[bytes] = []
+
+        def on_error(start: int, reason: str) -> None:
+            line = json.dumps({"offset": start, "error": reason}, ensure_ascii=False)
+            chunk_errors.append(line.encode("utf-8") + b"\n")
+
+        def flush_chunk(end: int) -> None:
+            nonlocal chunk, chunk_errors
+            if len(pending) >= max_pending:
+                drain_one()
+            pending.append((submit(chunk), end, chunk_errors))
+            chunk, chunk_errors = [], []
+
+        number = total
+        for end, record in iter_records(input_path, offset, on_error):
+            case_id, answers = normalize_record(compiled, record, number, from_csv)
+            chunk.append((end, case_id, answers))
+            number += 1
+            if len(chunk) >= chunk_size:
+                flush_chunk(end)
+        if chunk or chunk_errors:
+            flush_chunk(input_signature(input_path)["input_size"])
+        while pending:
+            drain_one()
+
+    return total
+
+
+def print_progress(records: int, elapsed: float) -> None:
+    """Report batch progress on stderr."""
+    rate = records / elapsed if elapsed > 0 else 0.0
+    print(f"⏳ {records} records ({rate:,.0f}/s)", file=sys.stderr)
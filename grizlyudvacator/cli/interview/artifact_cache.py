@@ -0,0 +1,148 @@
+"""
+Compiled interview artifacts.
+
+Parsing an interview YAML and validating its question graph is the bulk of
+the cold-start cost for an intake worker. ``load_interview`` compiles a
+YAML file once into a validated, pickled artifact stored under the SHA-256
+of the YAML bytes; later starts load the artifact and skip parsing and
+validation entirely.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from grizlyudvacator.cli.interview.interview_engine import (
+    CompiledInterview,
+    InterviewEngine,
+)
+from grizlyudvacator.utils.path_utils import get_cache_dir
+
+# Bump whenever the pickled engine definition changes shape so that stale
+# artifacts are ignored rather than loaded.
+ARTIFACT_VERSION = 3
+
+
+def yaml_content_hash(yaml_bytes: bytes) -> str:
+    """Return the hex SHA-256 digest identifying an interview's YAML bytes."""
+    return hashlib.sha256(yaml_bytes).hexdigest()
+
+
+def artifact_path(yaml_bytes: bytes, cache_dir: Path | None = None) -> Path:
+    """Return where the compiled artifact for ``yaml_bytes`` is stored."""
+    cache_dir = Path(cache_dir) if cache_dir else get_cache_dir()
+    name = f"{yaml_content_hash(yaml_bytes)}.v{ARTIFACT_VERSION}.pickle"
+    return cache_dir / name
+
+
+def compile_interview(yaml_bytes: bytes) -> dict[str, Any]:
+    """
+    Parse and validate interview YAML into a ready-to-load artifact.
+
+    Args:
+        yaml_bytes (bytes): Raw contents of the interview YAML file
+
+    Returns:
+        Dict[str, Any]: The artifact, suitable for ``InterviewEngine.from_artifact``
+
+    Raises:
+        ValueError: If the YAML structure or question graph is invalid
+    """
+    data = yaml.safe_load(yaml_bytes)
+    if not isinstance(data, dict) or "questions" not in data:
+        raise ValueError("Invalid YAML structure: missing questions section")
+
+    return {"version": ARTIFACT_VERSION, "interview": CompiledInterview(data)}
+
+
+def _read_artifact(path: Path) -> dict[str, Any] | None:
+    """Load an artifact from disk, or None if missing, stale or corrupt."""
+    try:
+        with open(path, "rb") as f:
+            artifact = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(artifact, dict) or artifact.get("version") != ARTIFACT_VERSION:
+        return None
+    return artifact
+
+
+def _write_artifact(path: Path, artifact: dict[str, Any]) -> None:
+    """Atomically write an artifact so concurrent workers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_artifact(yaml_path: str, cache_dir: Path | None = None) -> dict[str, Any]:
+    """
+    Return the compiled artifact for a YAML file, compiling it on a cache miss.
+
+    Args:
+        yaml_path (str): Path to the interview YAML file
+        cache_dir (Optional[Path]): Artifact directory (default: output/cache)
+
+    Returns:
+        Dict[str, Any]: The validated interview artifact
+    """
+    yaml_bytes = Path(yaml_path).read_bytes()
+    path = artifact_path(yaml_bytes, cache_dir)
+
+    artifact = _read_artifact(path)
+    if artifact is None:
+        artifact = compile_interview(yaml_bytes)
+        try:
+            _write_artifact(path, artifact)
+        except OSError:
+            # A read-only cache only costs us the next cold start.
+            pass
+    return artifact
+
+
+def load_compiled_interview(
+    yaml_path: str, cache_dir: Path | None = None
+) -> CompiledInterview:
+    """
+    Return the shared compiled interview for a YAML file via the artifact cache.
+
+    Args:
+        yaml_path (str): Path to the interview YAML file
+        cache_dir (Optional[Path]): Artifact directory (default: output/cache)
+
+    Returns:
+        CompiledInterview: Definition to start sessions from
+    """
+    return load_artifact(yaml_path, cache_dir)["interview"]
+
+
+def load_interview(yaml_path: str, cache_dir: Path | None = None) -> InterviewEngine:
+    """
+    Create an interview engine for a YAML file via the artifact cache.
+
+    Args:
+        yaml_path (str): Path to the interview YAML file
+        cache_dir (Optional[Path]): Artifact directory (default: output/cache)
+
+    Returns:
+        InterviewEngine: A fresh engine ready to process answers
+    """
+    return InterviewEngine.from_artifact(load_artifact(yaml_path, cache_dir))
+
+
+if __name__ == "__main__":
+    # Precompile one or more interview files, e.g. during deployment.
+    for arg in sys.argv[1:]:
+        load_artifact(arg)
+        print(f"✅ Compiled {arg} -> {artifact_path(Path(arg).read_bytes())}")
@@ -0,0 +1,121 @@
+"""
+Headless evaluation of complete answer sets.
+
+Bulk intake data arrives as finished answer dictionaries keyed by question
+ID. ``evaluate_case`` walks the compiled question graph with those answers
+and no IO, following the same validation, flag and branch rules as an
+interactive session, then evaluates the statutes for the result.
+``evaluate_cases`` does the same for an iterable of answer sets, reusing
+one compiled interview for every case.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+from grizlyudvacator.backend.rules.rule_engine import evaluate_statutes
+from grizlyudvacator.cli.interview.interview_engine import CompiledInterview
+
+
+def statute_facts(answers: Mapping[str, Any], flags: Iterable[str]) -> dict[str, Any]:
+    """
+    Merge a session's answers and triggered flags into one facts mapping.
+
+    Answers win: a flag named like a question (e.g. ``judgment_date``) is
+    only set when that question has no answer, so statute predicates always
+    see the answer the user gave. ``bulk.evaluate_matrix`` merges answer
+    and flag columns by the same rule.
+    """
+    facts = dict(answers)
+    facts.update((flag, True) for flag in flags if flag not in facts)
+    return facts
+
+
+def evaluate_case(
+    compiled: CompiledInterview, answers: Mapping[str, Any]
+) -> dict[str, Any]:
+    """
+    Walk the interview for one complete answer set.
+
+    The walk starts at the first question and stops when the interview is
+    complete, when the path reaches a question with no answer in
+    ``answers``, when a required answer is empty, or when an answer fails
+    validation. Summary questions need no answer. Answers for questions off
+    the taken path are ignored.
+
+    A walk can visit each question at most once, so one that takes more
+    steps than the interview has questions is stopped with an error rather
+    than left to loop.
+
+    Args:
+        compiled (CompiledInterview): The compiled interview to walk
+        answers (Mapping[str, Any]): Answers keyed by question ID
+
+    Returns:
+        Dict[str, Any]: The case result containing:
+            - answers: Answers applied along the path
+            - flags: Triggered flag names
+            - path: Question IDs visited, in order
+            - complete: Whether the walk reached the end of the interview
+            - stopped_at: Question the walk stopped on, or None if complete
+            - error: Validation message for ``stopped_at``, or None
+            - result: ``evaluate_statutes`` output for the answers and flags
+
+    Raises:
+        ValueError: If the walk does not finish within one step per question
+    """
+    session = compiled.new_session()
+    questions = compiled.questions
+    path = []
+    error = None
+
+    current_id = session.current_id
+    while current_id is not None:
+        if len(path) >= len(questions):
+            raise ValueError(
+                f"Interview did not finish within {len(questions)} steps "
+                f"(looping at {current_id})"
+            )
+        if current_id in answers:
+            answer = answers[current_id]
+        elif questions[current_id].is_summary():
+            answer = None
+        else:
+            break
+        path.append(current_id)
+        try:
+            next_id = session.process_answer(current_id, answer)
+        except (TypeError, ValueError) as e:
+            error = str(e)
+            break
+        if next_id == current_id:
+            error = "Required answer missing"
+            break
+        current_id = next_id
+
+    flags = session.flags
+    return {
+        "answers": session.answers,
+        "flags": flags,
+        "path": path,
+        "complete": current_id is None,
+        "stopped_at": current_id,
+        "error": error,
+        "result": evaluate_statutes(statute_facts(session.answers, flags)),
+    }
+
+
+def evaluate_cases(
+    compiled: CompiledInterview, cases: Iterable[Mapping[str, Any]]
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily evaluate many answer sets against one compiled interview.
+
+    Args:
+        compiled (CompiledInterview): The compiled interview to walk
+        cases (Iterable[Mapping[str, Any]]): Answer sets keyed by question ID
+
+    Yields:
+        Dict[str, Any]: One ``evaluate_case`` result per answer set, in order
+    """
+    for answers in cases:
+        yield evaluate_case(compiled, answers)
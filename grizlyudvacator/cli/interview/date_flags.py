@@ -0,0 +1,106 @@
+"""
+Vectorized ``date_flags`` evaluation across a caseload.
+
+A session evaluates a date question's ``date_flags`` thresholds one answer
+at a time (Rule 2.3). Re-deriving those flags for every open case each
+morning is the same comparison repeated per row, so this module does it
+for a whole column of answers at once: dates are held as
+``datetime64[D]``, and one broadcast comparison against the threshold
+vector yields a cases x flags boolean matrix.
+
+A flag is set when ``today - date >= threshold`` days, exactly as in
+``InterviewSession._process_date_flags``. Missing or unparseable dates
+set no flags.
+"""
+
+from collections.abc import Iterable
+from datetime import date
+from typing import Any
+
+import numpy as np
+
+from grizlyudvacator.cli.interview.interview_engine import CompiledInterview
+
+
+def to_datetime64(answers: Iterable[Any]) -> np.ndarray:
+    """
+    Convert a column of ``YYYY-MM-DD`` answers to ``datetime64[D]``.
+
+    Args:
+        answers (Iterable[Any]): Date answers; None or invalid entries allowed
+
+    Returns:
+        np.ndarray: ``datetime64[D]`` array with NaT for unusable answers
+    """
+    values = list(answers)
+    if all(v is None or (isinstance(v, str) and len(v) == 10) for v in values):
+        try:
+            return np.array(values, dtype="datetime64[D]")
+        except ValueError:
+            pass
+
+    dates = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[D]")
+    for row, value in enumerate(values):
+        if isinstance(value, str) and len(value) == 10:
+            try:
+                dates[row] = np.datetime64(value, "D")
+            except ValueError:
+                continue
+    return dates
+
+
+def date_flag_matrix(
+    dates: np.ndarray,
+    thresholds: Iterable[int] | np.ndarray,
+    today: date | np.datetime64 | None = None,
+) -> np.ndarray:
+    """
+    Evaluate day-count thresholds for every case in one shot.
+
+    Args:
+        dates (np.ndarray): ``datetime64[D]`` answers, one per case
+        thresholds (Union[Iterable[int], np.ndarray]): Days per flag column
+        today (Optional[Union[date, np.datetime64]]): Reference day;
+            defaults to the current date
+
+    Returns:
+        np.ndarray: Boolean matrix of shape (cases, flags)
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    thresholds = np.asarray(thresholds, dtype=np.int64)
+    today = np.datetime64(today if today is not None else date.today(), "D")
+
+    elapsed = (today - dates).astype(np.int64)
+    matrix = elapsed[:, None] >= thresholds[None, :]
+    matrix[np.isnat(dates)] = False
+    return matrix
+
+
+def question_date_flags(
+    compiled: CompiledInterview,
+    question_id: str,
+    dates: np.ndarray,
+    today: date | np.datetime64 | None = None,
+) -> tuple[list[str], np.ndarray]:
+    """
+    Evaluate one question's ``date_flags`` for a column of answers.
+
+    Args:
+        compiled (CompiledInterview): Interview defining the thresholds
+        question_id (str): ID of the date question
+        dates (np.ndarray): ``datetime64[D]`` answers, one per case
+        today (Optional[Union[date, np.datetime64]]): Reference day
+
+    Returns:
+        Tuple[List[str], np.ndarray]: Flag names, and the boolean
+        (cases, flags) matrix whose columns follow those names
+
+    Raises:
+        KeyError: If question ID is not found
+    """
+    try:
+        question = compiled.questions[question_id]
+    except KeyError:
+        raise KeyError(f"Question ID not found: {question_id}")
+    date_flags = question.date_flags or {}
+    return list(date_flags), date_flag_matrix(dates, list(date_flags.values()), today)
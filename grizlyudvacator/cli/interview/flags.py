@@ -0,0 +1,80 @@
+"""
+Interned flag IDs and bitmask flag sets.
+
+Every flag name that appears in an interview YAML is interned to a small
+integer when the interview is compiled. A session's flags are then one
+int bitmask: adding, testing, merging and de-duplicating flags are single
+integer operations, and the whole set serializes as one number.
+"""
+
+import threading
+from collections.abc import Iterable
+
+
+class FlagRegistry:
+    """
+    Append-only mapping between flag names and bit positions.
+
+    Flags declared in the YAML get the lowest bits in declaration order.
+    Names first seen at runtime (e.g. via ``add_flag``) are appended, so a
+    bit's meaning never changes once assigned.
+    """
+
+    __slots__ = ("_ids", "_names", "_lock")
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """
+        Create a registry pre-populated with ``names``.
+
+        Args:
+            names (Iterable[str]): Flag names to intern, in order
+        """
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._lock = threading.Lock()
+        for name in names:
+            self.intern(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._ids
+
+    def intern(self, name: str) -> int:
+        """Return the bit position for ``name``, assigning one if needed."""
+        flag_id = self._ids.get(name)
+        if flag_id is None:
+            with self._lock:
+                flag_id = self._ids.get(name)
+                if flag_id is None:
+                    flag_id = len(self._names)
+                    self._names.append(name)
+                    self._ids[name] = flag_id
+        return flag_id
+
+    def bit(self, name: str) -> int:
+        """Return the single-bit mask for ``name``."""
+        return 1 << self.intern(name)
+
+    def mask(self, names: Iterable[str]) -> int:
+        """Return the mask with a bit set for each name."""
+        mask = 0
+        for name in names:
+            mask |= 1 << self.intern(name)
+        return mask
+
+    def test(self, mask: int, name: str) -> bool:
+        """Check whether ``name`` is set in ``mask``."""
+        flag_id = self._ids.get(name)
+        return flag_id is not None and bool(mask >> flag_id & 1)
+
+    def names(self, mask: int) -> list[str]:
+        """Return the flag names set in ``mask``, in bit order."""
+        names = self._names
+        result = []
+        while mask:
+            low = mask & -mask
+            result.append(names[low.bit_length() - 1])
+            mask ^= low
+        return result
@@ -1,10 +1,14 @@
-import re
-from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Dict, List, Optional, Protocol, TypeVar, Union
 
-from grizlyudvacator.utils.sorted_dict import sorted_dict
+from grizlyudvacator.backend.rules.incremental import IncrementalMatcher
+from grizlyudvacator.backend.rules.rule_engine import RuleEngine
+from grizlyudvacator.cli.interview.flags import FlagRegistry
+from grizlyudvacator.cli.interview.keyword_matcher import compile_keyword_matcher
+from grizlyudvacator.cli.interview.transitions import END, END_ID, TransitionTable
+from grizlyudvacator.cli.interview.validators.plan import compile_validator
+from grizlyudvacator.utils.priority_dict import PriorityDict
 
 
 class QuestionType(Protocol):
@@ -60,6 +64,7 @@ class Question:
     prompt: str | None = None
     required: bool = False
     follow_up: dict[str, Any] | None = None
+    next: str | None = None
     validators: dict[str, Any] | None = None
     flags: list[str] | None = None
     flags_from_text: dict[str, Any] | None = None
@@ -210,37 +215,122 @@ class MultipleChoiceValidator:
             raise ValueError(f"At most {question.max_choices} choices allowed")
 
 
-class InterviewEngine:
+class CompiledInterview:
     """
-    Core interview logic engine that manages the flow of questions and answers.
+    Immutable, validated interview definition shared by many sessions.
 
-    This class handles:
-    - Question validation and type checking
-    - Answer processing and storage
-    - Flag management based on answers
-    - Flow control between questions
-    - Date and time calculations
-    - Text pattern matching for flag detection
+    Everything derived from the YAML - the parsed questions, the transition
+    tables, keyword matchers and validation plans - is built once here, so
+    each ``InterviewSession`` only carries its own answers and flags.
 
     Attributes:
         yaml_data (Dict[str, Any]): Parsed YAML data containing interview questions
         questions (Dict[str, Question]): Dictionary of questions by ID
-        current_id (str): ID of the current question being processed
-        answers (Dict[str, Any]): Dictionary of user answers
-        flags (List[str]): List of flags triggered during interview
+        question_list (List[Question]): Questions by transition-table index
+        transitions (TransitionTable): Compiled question graph
+        start_id (str): ID of the first question
+        flag_registry (FlagRegistry): Interned IDs of every flag in the YAML
     """
 
-    def __init__(self, yaml_data: dict[str, Any]) -> None:
+    __slots__ = (
+        "yaml_data",
+        "questions",
+        "question_dicts",
+        "question_list",
+        "transitions",
+        "start_id",
+        "keyword_matchers",
+        "validators",
+        "flag_registry",
+        "static_masks",
+        "keyword_bits",
+        "date_flag_bits",
+        "branch_masks",
+    )
+
+    def __init__(
+        self,
+        yaml_data: dict[str, Any],
+        questions: dict[str, Question] | None = None,
+        transitions: TransitionTable | None = None,
+    ) -> None:
         """
-        Initialize the interview engine with YAML data.
+        Compile an interview definition.
 
         Args:
             yaml_data (Dict[str, Any]): The YAML data containing interview questions
+            questions (Optional[Dict[str, Question]]): Already validated questions,
+                e.g. from a compiled artifact; parsing and validation are
+                skipped when given
+            transitions (Optional[TransitionTable]): Already compiled tables
 
         Raises:
             ValueError: If YAML data is missing required fields
             TypeError: If question types are invalid
         """
+        validate = questions is None
+        if validate:
+            questions = self._parse_questions(yaml_data)
+
+        self.yaml_data = yaml_data
+        self.questions = questions
+        self.question_dicts = {q["id"]: q for q in yaml_data["questions"]}
+        self.question_list = list(questions.values())
+        self.transitions = transitions or TransitionTable(questions)
+        self.start_id = yaml_data.get("start_id", yaml_data["questions"][0]["id"])
+        self.keyword_matchers = [
+            compile_keyword_matcher(q.flags_from_text) for q in self.question_list
+        ]
+        self.validators = [compile_validator(q) for q in self.question_list]
+        self._compile_flags()
+
+        if validate:
+            # Validate that all referenced questions exist
+            self._validate_question_references()
+
+            # Validate flow control
+            self._validate_flow_control()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle only the definition; matchers and plans are rebuilt on load."""
+        return {
+            "yaml_data": self.yaml_data,
+            "questions": self.questions,
+            "transitions": self.transitions,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled definition without re-validating it."""
+        self.__init__(state["yaml_data"], state["questions"], state["transitions"])
+
+    def _compile_flags(self) -> None:
+        """Intern every flag in the YAML and precompute per-question masks."""
+        registry = FlagRegistry()
+        self.static_masks = []
+        self.keyword_bits = []
+        self.date_flag_bits = []
+        for question, matcher in zip(self.question_list, self.keyword_matchers):
+            self.static_masks.append(registry.mask(question.flags or ()))
+            labels = matcher.labels if matcher else ()
+            self.keyword_bits.append(tuple(registry.bit(label) for label in labels))
+            self.date_flag_bits.append(
+                tuple(
+                    (threshold, registry.bit(flag))
+                    for flag, threshold in (question.date_flags or {}).items()
+                )
+            )
+        self.branch_masks = [
+            registry.mask(flags) for flags in self.transitions.branch_flags
+        ]
+        self.flag_registry = registry
+
+    def new_session(self) -> "InterviewSession":
+        """Start a new session over this interview."""
+        return InterviewSession(self)
+
+    @staticmethod
+    def _parse_questions(yaml_data: dict[str, Any]) -> dict[str, Question]:
+        """Build the ``Question`` objects for every YAML question entry."""
         if not yaml_data.get("questions"):
             raise ValueError("YAML data must contain questions")
 
@@ -250,7 +340,9 @@ class InterviewEngine:
             try:
                 # For summary questions, we don't require all fields
                 if q["type"] == "summary":
-                    question = Question(id=q["id"], type=q["type"], required=False)
+                    question = Question(
+                        id=q["id"], type=q["type"], required=False, next=q.get("next")
+                    )
                 else:
                     question = Question(
                         id=q["id"],
@@ -258,6 +350,7 @@ class InterviewEngine:
                         type=q["type"],
                         required=q.get("required", False),
                         follow_up=q.get("follow_up"),
+                        next=q.get("next"),
                         validators=q.get("validators"),
                         flags=q.get("flags", []),
                         flags_from_text=q.get("flags_from_text"),
@@ -277,73 +370,172 @@ class InterviewEngine:
                 )
             except TypeError as e:
                 raise ValueError(f"Invalid type in question {q.get('id')}: {e}")
-
-        self.yaml_data = yaml_data
-        self.questions = questions_dict
-        self.current_id = yaml_data.get("start_id", yaml_data["questions"][0]["id"])
-        self.answers: dict[str, Any] = {}
-        self.flags: list[str] = []
-        self.flag_priorities: dict[str, int] = {}  # Store flag priorities
-        self.sorted_flags: OrderedDict[str, int] = OrderedDict()  # Store sorted flags
-
-        # Validate that all referenced questions exist
-        self._validate_question_references()
-
-        # Validate flow control
-        self._validate_flow_control()
+        return questions_dict
 
     def _validate_question_references(self) -> None:
-        """Validate that all referenced questions exist."""
+        """
+        Validate that every successor and branch target is a question.
+
+        Only ``None`` and the explicit ``end`` may end the interview, so a
+        misspelled ``if_true``/``if_false``/``options`` target is an error
+        rather than a silent early finish.
+        """
         for question in self.questions.values():
-            if question.follow_up:
-                if isinstance(question.follow_up, dict):
-                    # Check next question references
-                    if "next" in question.follow_up:
-                        next_id = question.follow_up["next"]
-                        if next_id not in self.questions:
-                            raise ValueError(
-                                f"Question {question.id} references non-existent question {next_id}"
-                            )
-                    # Check flag references
-                    if "flags" in question.follow_up:
-                        for flag in question.follow_up["flags"]:
-                            # We don't validate flag names here as they might be dynamically generated
-                            pass
-                elif isinstance(question.follow_up, str):
-                    if question.follow_up not in self.questions:
-                        raise ValueError(
-                            f"Question {question.id} references non-existent question {question.follow_up}"
-                        )
-                else:
+            follow_up = question.follow_up
+            targets = [("next", question.next)]
+            if isinstance(follow_up, str):
+                targets.append(("follow_up", follow_up))
+            elif isinstance(follow_up, dict):
+                targets.append(("follow_up.next", follow_up.get("next")))
+                for key in ("if_true", "if_false"):
+                    targets.append((key, (follow_up.get(key) or {}).get("next")))
+                for option, info in (follow_up.get("options") or {}).items():
+                    targets.append((f"option '{option}'", (info or {}).get("next")))
+            elif follow_up is not None:
+                raise ValueError(
+                    f"Invalid follow_up format in question {question.id}"
+                )
+
+            for source, next_id in targets:
+                if next_id not in self.questions and next_id not in (None, END_ID):
                     raise ValueError(
-                        f"Invalid follow_up format in question {question.id}"
+                        f"Question {question.id} {source} references "
+                        f"non-existent question {next_id}"
                     )
 
     def _validate_flow_control(self) -> None:
-        """Validate the flow control logic."""
+        """
+        Validate the flow control logic.
+
+        Every branch reachable from the start question is followed, whether
+        or not an accepted answer can take it, so any cycle in the question
+        graph is a load error. This is stricter than the original check,
+        which only followed each question's default ``next``: interviews
+        that loop back through an ``if_true``/``if_false`` or option branch
+        used to load and now do not.
+
+        Raises:
+            ValueError: If ``start_id`` is unknown or the flow has a cycle
+        """
         # Check if start_id exists if specified
         if "start_id" in self.yaml_data:
             start_id = self.yaml_data["start_id"]
             if start_id not in self.questions:
                 raise ValueError(f"Start question {start_id} does not exist")
 
-        # Check if there are any circular references
-        visited = set()
-        current = self.current_id
+        # Check for circular references along every branch, not just the
+        # default path: depth-first search over the whole successor table
+        table = self.transitions
+        starts = list(table.offset)
+        ends = starts[1:] + [len(table.successor)]
+        done = set()
+        on_path = set()
+        start = table.index[self.start_id]
+        stack = [(start, iter(range(starts[start], ends[start])))]
+        on_path.add(start)
+
+        while stack:
+            current, branches = stack[-1]
+            for branch in branches:
+                successor = table.successor[branch]
+                if successor == END or successor in done:
+                    continue
+                if successor in on_path:
+                    raise ValueError(
+                        f"Circular reference detected in question flow at "
+                        f"{table.ids[successor]}"
+                    )
+                on_path.add(successor)
+                stack.append(
+                    (successor, iter(range(starts[successor], ends[successor])))
+                )
+                break
+            else:
+                stack.pop()
+                on_path.discard(current)
+                done.add(current)
 
-        while current:
-            if current in visited:
-                raise ValueError(f"Circular reference detected in question flow")
-            visited.add(current)
 
-            question = self.questions[current]
-            if question.follow_up:
-                if isinstance(question.follow_up, dict):
-                    current = question.follow_up.get("next")
-                else:
-                    current = question.follow_up
-            else:
-                current = None
+class InterviewSession:
+    """
+    Core interview logic that manages the flow of questions and answers.
+
+    A session holds only the state of one interview and references a shared
+    ``CompiledInterview``, so a process can keep many thousands of live
+    sessions over a single question graph.
+
+    This class handles:
+    - Question validation and type checking
+    - Answer processing and storage
+    - Flag management based on answers
+    - Flow control between questions
+    - Date and time calculations
+    - Text pattern matching for flag detection
+
+    Attributes:
+        compiled (CompiledInterview): The shared interview definition
+        current_id (str): ID of the current question being processed
+        answers (Dict[str, Any]): Dictionary of user answers
+        flag_mask (int): Bitmask of triggered flags, see ``FlagRegistry``
+        history (List[Tuple]): One step per processed answer recording its
+            delta: (question_id, had_answer, old_answer, added_mask, prev_id)
+        matcher (Optional[IncrementalMatcher]): Live statute eligibility,
+            once enabled with ``track_statutes``
+    """
+
+    __slots__ = (
+        "compiled",
+        "current_id",
+        "answers",
+        "flag_mask",
+        "flag_priorities",
+        "history",
+        "matcher",
+    )
+
+    def __init__(self, compiled: CompiledInterview) -> None:
+        """
+        Start a session over a compiled interview.
+
+        Args:
+            compiled (CompiledInterview): The shared interview definition
+        """
+        self.compiled = compiled
+        self.current_id = compiled.start_id
+        self.answers: dict[str, Any] = {}
+        self.flag_mask = 0
+        self.flag_priorities = PriorityDict()  # Flags kept ordered by priority
+        self.history: list[tuple[str, bool, Any, int, str | None]] = []
+        self.matcher: IncrementalMatcher | None = None
+
+    @property
+    def yaml_data(self) -> dict[str, Any]:
+        """Parsed YAML data of the shared interview."""
+        return self.compiled.yaml_data
+
+    @property
+    def questions(self) -> dict[str, Question]:
+        """Questions of the shared interview by ID."""
+        return self.compiled.questions
+
+    @property
+    def transitions(self) -> TransitionTable:
+        """Transition tables of the shared interview."""
+        return self.compiled.transitions
+
+    @property
+    def flags(self) -> list[str]:
+        """Triggered flags, without duplicates, in interned order."""
+        return self.compiled.flag_registry.names(self.flag_mask)
+
+    @property
+    def sorted_flags(self) -> PriorityDict:
+        """Flags ordered by priority; kept for callers of the old attribute."""
+        return self.flag_priorities
+
+    def has_flag(self, flag: str) -> bool:
+        """Check whether a flag has been triggered."""
+        return self.compiled.flag_registry.test(self.flag_mask, flag)
 
     def add_flag(self, flag: str, priority: int = 5) -> None:
         """
@@ -353,10 +545,51 @@ class InterviewEngine:
             flag (str): The flag to add
             priority (int): Priority level (default 5)
         """
-        self.flags.append(flag)
+        old_mask = self.flag_mask
+        self.flag_mask |= self.compiled.flag_registry.bit(flag)
+        # O(log n) insert or re-prioritization; no re-sort of all flags
         self.flag_priorities[flag] = priority
-        # Sort flags by priority whenever a new one is added
-        self.sorted_flags = sorted_dict(self.flag_priorities)
+        if self.matcher is not None:
+            self._update_matcher(old_mask)
+
+    def track_statutes(self, engine: RuleEngine | None = None) -> IncrementalMatcher:
+        """
+        Keep statute eligibility current after every answer.
+
+        The matcher is seeded from the session's answers and flags, then
+        updated with only the delta of each ``process_answer``, ``undo``,
+        ``revise`` and date-flag refresh.
+
+        Args:
+            engine (Optional[RuleEngine]): Rules to match; defaults to the
+                statute table
+
+        Returns:
+            IncrementalMatcher: The live matcher; see ``eligible`` and
+            ``result()``
+        """
+        matcher = IncrementalMatcher(engine)
+        for flag in self.flags:
+            matcher.add_flag(flag)
+        for question_id, answer in self.answers.items():
+            matcher.set_answer(question_id, answer)
+        self.matcher = matcher
+        return matcher
+
+    def _update_matcher(self, old_mask: int, question_id: str | None = None) -> None:
+        """Feed the flags changed since ``old_mask`` and one answer to the matcher."""
+        matcher = self.matcher
+        names = self.compiled.flag_registry.names
+        changed = old_mask ^ self.flag_mask
+        for flag in names(changed & self.flag_mask):
+            matcher.add_flag(flag)
+        for flag in names(changed & old_mask):
+            matcher.remove_flag(flag)
+        if question_id is not None:
+            if question_id in self.answers:
+                matcher.set_answer(question_id, self.answers[question_id])
+            else:
+                matcher.clear_answer(question_id)
 
     def process_answer(self, question_id: str, answer: Any) -> str | None:
         """
@@ -382,163 +615,172 @@ class InterviewEngine:
             TypeError: If answer type doesn't match expected type
             ValueError: If answer fails validation
         """
+        compiled = self.compiled
         try:
-            question = self.questions[question_id]
+            question_index = compiled.transitions.index[question_id]
         except KeyError:
             raise KeyError(f"Question ID not found: {question_id}")
+        question = compiled.question_list[question_index]
 
         # Rule 1.1: Required Field Validation
         if question.required and not answer:
             return question_id  # Return same question ID to retry
 
-        # Rule 1.2: Type Validation and Processing
-        validator = self._get_validator(question.type)
-        if validator:
-            validator.validate(question, answer)
+        # Rule 1.2: Type Validation and Processing (compiled at load time)
+        validate = compiled.validators[question_index]
+        if validate is not None:
+            validate(answer)
+
+        # Record the step's delta so it can be undone in O(1)
+        answers = self.answers
+        had_answer = question_id in answers
+        step_start = (
+            question_id,
+            had_answer,
+            answers[question_id] if had_answer else None,
+            self.flag_mask,
+            self.current_id,
+        )
 
         # Rule 1.3: Answer Storage
-        self.answers[question_id] = answer
+        answers[question_id] = answer
 
         # Rule 2.0: Flag Management
-        self._process_flags(question, answer)
-
-        # Rule 3.0: Flow Control
-        return self._get_next_question_id(question, answer)
-
-    def _get_validator(self, question_type: str) -> Optional["Validator"]:
-        """Get appropriate validator for question type."""
-        validators = {
-            "number": NumberValidator(),
-            "text": TextValidator(),
-            "boolean": BooleanValidator(),
-            "date": DateValidator(),
-            "choice": ChoiceValidator(),
-            "multiple_choice": MultipleChoiceValidator(),
-        }
-        return validators.get(question_type)
-
-    def _process_flags(self, question: Question, answer: Any) -> None:
-        """Process all types of flags for a question."""
-        # Rule 2.1: Static Flags
-        if question.flags:
-            self.flags.extend(question.flags)
-
-        # Rule 2.2: Text Pattern Flags
-        if (
-            question.type == "text"
-            and question.flags_from_text
-            and isinstance(answer, str)
-        ):
-            self._process_text_flags(question, answer)
-
-        # Rule 2.3: Date-Based Flags
-        if question.type == "date" and question.date_flags and answer:
-            self._process_date_flags(question, answer)
-
-        # Rule 2.4: Choice-Based Flags
-        if question.type in ["choice", "multiple_choice"] and question.follow_up:
-            self._process_choice_flags(question, answer)
-
-        # Validate answer type
-        if q.get("type") == "number":
-            if not isinstance(answer, (int, float)):
-                raise TypeError(f"Expected number, got {type(answer).__name__}")
-            if q.get("min") is not None and answer < q["min"]:
-                return question_id  # Return same question ID to retry
-            if q.get("max") is not None and answer > q["max"]:
-                return question_id  # Return same question ID to retry
-
-        elif q.get("type") == "boolean":
-            if not isinstance(answer, bool):
-                raise TypeError(f"Expected boolean, got {type(answer).__name__}")
-
-        elif q.get("type") == "text":
-            if not isinstance(answer, str):
-                raise TypeError(f"Expected string, got {type(answer).__name__}")
-
-        elif q.get("type") == "date":
-            if not isinstance(answer, str):
-                raise TypeError(
-                    f"Expected string for date, got {type(answer).__name__}"
-                )
-            try:
-                date_obj = datetime.datetime.strptime(answer, "%Y-%m-%d").date()
-            except ValueError:
-                raise ValueError("Invalid date format. Use YYYY-MM-DD")
-
-        # Store answer
-        self.answers[question_id] = answer
+        self._process_flags(question_index, question, answer)
+
+        # Rule 3.0: Flow Control (branch flags and successor by table lookup)
+        transitions = compiled.transitions
+        branch = transitions.branch(question_index, answer)
+        self.flag_mask |= compiled.branch_masks[branch]
+        self.current_id = transitions.next_id(branch)
+
+        old_mask = step_start[3]
+        self.history.append(
+            step_start[:3] + (self.flag_mask & ~old_mask, step_start[4])
+        )
+        if self.matcher is not None:
+            self._update_matcher(old_mask, question_id)
+        return self.current_id
+
+    def undo(self) -> str | None:
+        """
+        Undo the most recent answer.
 
-        # Capture static flags
-        if "flags" in q:
-            if not isinstance(q["flags"], list):
-                raise TypeError("Flags must be a list")
-            self.flags.extend(q["flags"])
+        Only that step's own delta is reverted: the flags it added are
+        cleared, its previous answer (if any) is restored and the session
+        moves back to the question that was current before it.
 
-        # Keyword-based flag detection using regex
-        if q["type"] == "text" and "flags_from_text" in q and isinstance(answer, str):
-            keywords = q["flags_from_text"].get("keywords", [])
-            if not isinstance(keywords, list):
-                raise TypeError("Keywords must be a list")
+        Returns:
+            Optional[str]: The question that is current again, or None if
+            there was nothing to undo
+        """
+        if not self.history:
+            return None
+        question_id, had_answer, old_answer, added_mask, prev_id = self.history.pop()
+        if had_answer:
+            self.answers[question_id] = old_answer
+        else:
+            del self.answers[question_id]
+        old_mask = self.flag_mask
+        self.flag_mask &= ~added_mask
+        self.current_id = prev_id
+        if self.matcher is not None:
+            self._update_matcher(old_mask, question_id)
+        return prev_id
+
+    def revise(self, question_id: str, answer: Any) -> str | None:
+        """
+        Change an earlier answer without replaying the whole session.
 
-            keywords_dict = {}
-            for item in keywords:
-                if not isinstance(item, dict) or len(item) != 1:
-                    raise ValueError("Invalid keyword format")
+        The steps from the latest answer to ``question_id`` onward are undone
+        (newest first), the new answer is processed, and the previous
+        downstream answers are re-applied for as long as the new path still
+        reaches questions that had answers and those answers remain valid.
 
-                key = next(iter(item))
-                value = item[key]
-                keywords_dict[key] = value
+        Args:
+            question_id (str): ID of a previously answered question
+            answer (Any): The corrected answer
 
-            for label, pattern in keywords_dict.items():
-                if re.search(rf"\b{pattern}\b", answer, re.IGNORECASE):
-                    self.flags.append(label)
+        Returns:
+            Optional[str]: ID of the next unanswered question, or None if the
+            interview is complete
 
-        # Calculate time-based flags if dates are involved
-        if q["type"] == "date" and "date_flags" in q and answer:
+        Raises:
+            KeyError: If the question has not been answered in this session
+            TypeError: If answer type doesn't match expected type
+            ValueError: If answer fails validation
+        """
+        history = self.history
+        for position in range(len(history) - 1, -1, -1):
+            if history[position][0] == question_id:
+                break
+        else:
+            raise KeyError(f"Question has not been answered: {question_id}")
+
+        # Validate before touching any state so a bad revision changes nothing
+        compiled = self.compiled
+        index = compiled.transitions.index[question_id]
+        if compiled.question_list[index].required and not answer:
+            return question_id
+        validate = compiled.validators[index]
+        if validate is not None:
+            validate(answer)
+
+        retained: dict[str, Any] = {}
+        while len(history) > position:
+            step_id = history[-1][0]
+            retained.setdefault(step_id, self.answers[step_id])
+            self.undo()
+        retained.pop(question_id, None)
+
+        next_id = self.process_answer(question_id, answer)
+        while next_id in retained:
             try:
-                date_obj = datetime.datetime.strptime(answer, "%Y-%m-%d").date()
-            except ValueError:
-                raise ValueError("Invalid date format. Use YYYY-MM-DD")
-
-            today = datetime.date.today()
-            days_diff = (today - date_obj).days
-
-            for flag, threshold in q["date_flags"].items():
-                if not isinstance(threshold, int):
-                    raise TypeError("Date flag thresholds must be integers")
-                if days_diff >= threshold:
-                    self.flags.append(flag)
+                following = self.process_answer(next_id, retained.pop(next_id))
+            except (TypeError, ValueError):
+                break
+            if following == next_id:
+                break
+            next_id = following
+        return self.current_id
+
+    def _process_flags(
+        self, question_index: int, question: Question, answer: Any
+    ) -> None:
+        """Process all types of flags for a question."""
+        compiled = self.compiled
 
-        # Determine next step
-        if "follow_up" in q:
-            if not isinstance(q["follow_up"], dict):
-                raise TypeError("Follow-up must be a dictionary")
+        # Rule 2.1: Static Flags
+        mask = compiled.static_masks[question_index]
 
-            if isinstance(answer, bool):
-                branch = "if_true" if answer else "if_false"
-                next_info = q["follow_up"].get(branch, {})
-                if not isinstance(next_info, dict):
-                    raise TypeError("Next info must be a dictionary")
+        # Rule 2.2: Text Pattern Flags
+        matcher = compiled.keyword_matchers[question_index]
+        if question.type == "text" and matcher and isinstance(answer, str):
+            mask |= matcher.match_mask(answer, compiled.keyword_bits[question_index])
 
-                self.flags.extend(next_info.get("flags", []))
-                return next_info.get("next")
+        # Rule 2.3: Date-Based Flags
+        if question.type == "date" and question.date_flags and answer:
+            mask |= self._process_date_flags(question_index, question, answer)
 
-            elif isinstance(answer, str) and "options" in q["follow_up"]:
-                if not isinstance(q["follow_up"]["options"], dict):
-                    raise TypeError("Options must be a dictionary")
+        self.flag_mask |= mask
 
-                next_info = q["follow_up"]["options"].get(answer, {})
-                if not isinstance(next_info, dict):
-                    raise TypeError("Next info must be a dictionary")
+    def match_text_flags(self, question_id: str, text: str) -> list[str]:
+        """
+        Rule 2.2: Return the keyword flags a text triggers for a question.
 
-                self.flags.extend(next_info.get("flags", []))
-                return next_info.get("next", q.get("next"))
+        Uses the question's matcher compiled at construction time, so all
+        labels are found in a single pass over the text.
 
-            else:
-                return q.get("next")
+        Args:
+            question_id (str): ID of the question whose keywords apply
+            text (str): Answer text to scan
 
-        return q.get("next")
+        Returns:
+            List[str]: Triggered flag labels
+        """
+        compiled = self.compiled
+        matcher = compiled.keyword_matchers[compiled.transitions.index[question_id]]
+        return matcher.findall(text) if matcher else []
 
     def get_question(self, question_id: str) -> dict[str, Any]:
         """
@@ -567,77 +809,113 @@ class InterviewEngine:
         Raises:
             KeyError: If question ID is not found
         """
-        # ... (rest of the method remains the same)
+        try:
+            return self.compiled.question_dicts[question_id]
+        except KeyError:
+            raise KeyError(f"Question ID not found: {question_id}")
 
-    def _process_date_flags(self, question: Question, answer: str) -> None:
+    def _process_date_flags(
+        self, question_index: int, question: Question, answer: str
+    ) -> int:
         """
         Rule 2.3: Process date-based flags based on time calculations.
 
         This method handles:
         1. Text-based flag processing using keywords
         2. Date-based flag processing using time thresholds
-        3. Flow control based on follow-up logic
+
+        Flow control is handled by the transition table in ``process_answer``.
+
+        Returns:
+            int: Bitmask of the flags triggered by the answer
         """
+        compiled = self.compiled
+        mask = 0
+
         # Process text-based flags
-        if question.flags_from_text:
-            keywords = question.flags_from_text.get("keywords", [])
-            if isinstance(keywords, list):
-                keywords_dict = {}
-                for item in keywords:
-                    if isinstance(item, dict) and len(item) == 1:
-                        key = next(iter(item))
-                        value = item[key]
-                        keywords_dict[key] = value
-                keywords = keywords_dict
-
-            for label, pattern in keywords.items():
-                if re.search(rf"\b{pattern}\b", answer, re.IGNORECASE):
-                    self.flags.append(label)
+        matcher = compiled.keyword_matchers[question_index]
+        if matcher:
+            mask |= matcher.match_mask(answer, compiled.keyword_bits[question_index])
 
         # Calculate time-based flags if dates are involved
-        if question.type == "date" and question.date_flags and answer:
-            try:
-                date_obj = datetime.strptime(answer, "%Y-%m-%d").date()
-                today = datetime.now().date()
-                days_diff = (today - date_obj).days
+        try:
+            date_obj = datetime.strptime(answer, "%Y-%m-%d").date()
+        except ValueError:
+            return mask
+        days_diff = (datetime.now().date() - date_obj).days
+
+        for threshold, bit in compiled.date_flag_bits[question_index]:
+            if days_diff >= threshold:
+                mask |= bit
+        return mask
+
+    def refresh_date_flags(self, today: date | None = None) -> int:
+        """
+        Rule 2.3: Re-evaluate date thresholds for the answers already given.
+
+        Date flags depend on how many days have passed since the answered
+        date, so a stored session can cross a threshold with no new answer.
+        Elapsed days only grow, so a refresh can only add flags. Each new
+        flag is credited to the step that answered its question, so
+        ``undo`` still removes it.
 
-                for flag, threshold in question.date_flags.items():
-                    if days_diff >= threshold:
-                        self.flags.append(flag)
+        Args:
+            today (Optional[date]): Reference day; defaults to the current date
+
+        Returns:
+            int: Bitmask of the flags newly set by the refresh
+        """
+        compiled = self.compiled
+        today = today or datetime.now().date()
+        index = compiled.transitions.index
+        history = self.history
+        added = 0
+
+        for question_id, answer in self.answers.items():
+            date_bits = compiled.date_flag_bits[index[question_id]]
+            if not date_bits or not isinstance(answer, str):
+                continue
+            try:
+                days_diff = (today - datetime.strptime(answer, "%Y-%m-%d").date()).days
             except ValueError:
-                pass
-
-        # Determine next step
-        if question.follow_up:
-            if isinstance(answer, bool):
-                branch = "if_true" if answer else "if_false"
-                next_info = question.follow_up.get(branch, {})
-                self.flags.extend(next_info.get("flags", []))
-                return next_info.get("next")
-            elif isinstance(answer, str) and "options" in question.follow_up:
-                next_info = question.follow_up["options"].get(answer, {})
-                self.flags.extend(next_info.get("flags", []))
-                return next_info.get("next", question.get("next"))
-            else:
-                return question.get("next")
-        return None
+                continue
+            mask = 0
+            for threshold, bit in date_bits:
+                if days_diff >= threshold:
+                    mask |= bit
+            new = mask & ~self.flag_mask
+            if not new:
+                continue
+            self.flag_mask |= new
+            added |= new
+            for position in range(len(history) - 1, -1, -1):
+                step = history[position]
+                if step[0] == question_id:
+                    history[position] = step[:3] + (step[3] | new, step[4])
+                    break
+        if added and self.matcher is not None:
+            self._update_matcher(self.flag_mask & ~added)
+        return added
 
     def get_answers(self) -> dict[str, Any]:
         """Get the collected answers."""
         return self.answers
 
-    def get_sorted_flags(self) -> OrderedDict[str, int]:
+    def get_sorted_flags(self) -> PriorityDict:
         """
         Get flags sorted by priority.
 
+        The container is kept ordered as flags are added, so this returns it
+        directly instead of building a sorted copy.
+
         Returns:
-            OrderedDict: Flags sorted by priority (highest priority first)
+            PriorityDict: Flags sorted by priority (highest priority first)
         """
-        return self.sorted_flags
+        return self.flag_priorities
 
     def get_flags(self) -> list[str]:
-        """Get the triggered flags."""
-        return list(set(self.flags))  # Remove duplicates
+        """Get the triggered flags (the bitmask never holds duplicates)."""
+        return self.flags
 
     def is_complete(self) -> bool:
         """Check if the interview is complete."""
@@ -646,3 +924,87 @@ class InterviewEngine:
     def get_current_question(self) -> dict[str, Any]:
         """Get the current question."""
         return self.questions[self.current_id] if self.current_id else None
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return the session state in JSON-serializable form.
+
+        Flags are stored by name rather than as the bitmask, since bits for
+        flags added at runtime are only stable within one process.
+        """
+        registry = self.compiled.flag_registry
+        return {
+            "current_id": self.current_id,
+            "answers": dict(self.answers),
+            "flags": self.flags,
+            "flag_priorities": dict(self.flag_priorities.items()),
+            "history": [
+                [qid, had, old, registry.names(added), prev_id]
+                for qid, had, old, added, prev_id in self.history
+            ],
+        }
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """Replace the session state with one produced by ``snapshot``."""
+        registry = self.compiled.flag_registry
+        self.current_id = state["current_id"]
+        self.answers = dict(state["answers"])
+        self.flag_mask = registry.mask(state["flags"])
+        self.flag_priorities = PriorityDict(state["flag_priorities"])
+        self.history = [
+            (qid, had, old, registry.mask(added), prev_id)
+            for qid, had, old, added, prev_id in state.get("history", ())
+        ]
+        if self.matcher is not None:
+            self.track_statutes(self.matcher.engine)
+
+
+class InterviewEngine(InterviewSession):
+    """
+    Interview session built directly from YAML data.
+
+    Kept for callers that own a single interview; services running many
+    sessions should compile once and use ``CompiledInterview.new_session``.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, yaml_data: dict[str, Any]) -> None:
+        """
+        Initialize the interview engine with YAML data.
+
+        Args:
+            yaml_data (Dict[str, Any]): The YAML data containing interview questions
+
+        Raises:
+            ValueError: If YAML data is missing required fields
+            TypeError: If question types are invalid
+        """
+        super().__init__(CompiledInterview(yaml_data))
+
+    @classmethod
+    def from_compiled(cls, compiled: CompiledInterview) -> "InterviewEngine":
+        """Create an engine over an already compiled interview."""
+        engine = cls.__new__(cls)
+        InterviewSession.__init__(engine, compiled)
+        return engine
+
+    @classmethod
+    def from_artifact(cls, artifact: dict[str, Any]) -> "InterviewEngine":
+        """
+        Create an engine from a previously compiled interview artifact.
+
+        The artifact's questions were validated when it was compiled, so
+        parsing and validation are skipped entirely.
+
+        Args:
+            artifact (Dict[str, Any]): Artifact produced by ``to_artifact``
+
+        Returns:
+            InterviewEngine: A fresh engine with no answers or flags
+        """
+        return cls.from_compiled(artifact["interview"])
+
+    def to_artifact(self) -> dict[str, Any]:
+        """Return the validated interview definition in cacheable form."""
+        return {"interview": self.compiled}
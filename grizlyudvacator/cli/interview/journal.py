@@ -0,0 +1,354 @@
+"""
+Append-only answer journal with crash-safe session resume.
+
+A journal starts with a header line, ``{"yaml": "<hash>"}``, naming the
+interview YAML it was written against; opening it for a different
+interview is refused. Every processed answer is then appended as one
+compact JSON line, ``["question_id", answer]``; revisions are journaled as
+``["question_id", answer, 1]`` and undos as ``[null]``. Each record is
+handed to the OS with a single unbuffered ``write``, so a crashed intake
+process loses nothing. ``fsync`` never runs on the answer path: one
+flusher thread per process group-commits every open journal with pending
+records once any journal has ``sync_every`` of them or ``sync_interval``
+seconds after the first, which also bounds how long a record can stay
+undurable if the machine goes down. Journals hold no file descriptor
+between records, so tens of thousands of open sessions cost neither a
+thread nor an fd each.
+
+Periodic snapshots store the session state together with the journal
+offset they cover, so resuming only replays the records written since the
+last snapshot. Snapshots carry the same YAML hash as the journal.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from grizlyudvacator.cli.interview.interview_engine import InterviewSession
+
+
+class _GroupCommitFlusher:
+    """
+    Process-wide background thread that syncs every journal with pending
+    records.
+
+    A journal is due ``sync_interval`` seconds after its first pending
+    record, or at once when ``sync_every`` are pending. When any journal is
+    due, every pending journal is committed in the same pass.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._due: dict["AnswerJournal", float] = {}
+        self._thread: threading.Thread | None = None
+
+    def pending(self, journal: "AnswerJournal", count: int) -> None:
+        """Note that ``journal`` has ``count`` records waiting for a commit."""
+        with self._cond:
+            due = self._due.get(journal)
+            if count >= journal.sync_every:
+                self._due[journal] = 0.0
+            elif due is None:
+                self._due[journal] = time.monotonic() + journal.sync_interval
+            else:
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="journal-flusher", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def discard(self, journal: "AnswerJournal") -> None:
+        """Stop tracking a journal, e.g. because it has been closed."""
+        with self._cond:
+            self._due.pop(journal, None)
+
+    def _run(self) -> None:
+        cond = self._cond
+        while True:
+            with cond:
+                while True:
+                    if not self._due:
+                        cond.wait()
+                        continue
+                    wait = min(self._due.values()) - time.monotonic()
+                    if wait <= 0:
+                        break
+                    cond.wait(wait)
+                batch = list(self._due)
+                self._due.clear()
+            for journal in batch:
+                try:
+                    journal.sync()
+                except OSError:
+                    pass  # the next append or close retries
+
+
+_flusher = _GroupCommitFlusher()
+
+
+class AnswerJournal:
+    """
+    Per-session append-only journal of ``process_answer`` calls.
+
+    Attributes:
+        path (Path): Journal file; the snapshot lives next to it
+        records (int): Number of records in the journal
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        yaml_hash: str,
+        sync_every: int = 16,
+        sync_interval: float = 0.2,
+        snapshot_every: int = 256,
+    ) -> None:
+        """
+        Open (or create) a journal.
+
+        Args:
+            path (Union[str, Path]): Journal file path
+            yaml_hash (str): ``yaml_content_hash`` of the interview YAML the
+                journal's answers belong to
+            sync_every (int): Pending records that trigger a group commit
+            sync_interval (float): Maximum seconds a record waits for its
+                group commit
+            snapshot_every (int): Records between snapshots; 0 disables them
+
+        Raises:
+            ValueError: If an existing journal belongs to a different
+                interview or has no header
+        """
+        self.path = Path(path)
+        self.snapshot_path = self.path.with_name(self.path.name + ".snapshot")
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.snapshot_every = snapshot_every
+        self.yaml_hash = yaml_hash
+        self.records = 0
+        self._pending = 0
+        self._since_snapshot = 0
+        self._closed = False
+        # Guards _pending; sync holds it across the fsync
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        header = (
+            json.dumps({"yaml": yaml_hash}, separators=(",", ":")) + "\n"
+        ).encode("utf-8")
+        fd = self._open()
+        try:
+            with os.fdopen(os.dup(fd), "rb") as f:
+                first = f.readline()
+            if not first.endswith(b"\n"):
+                # New journal, or a crash tore the header before any record
+                os.ftruncate(fd, 0)
+                os.write(fd, header)
+                self._pending = 1
+                first = header
+            else:
+                self._check_header(first)
+            self._header_end = len(first)
+            self._offset = os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+        if self._pending:
+            _flusher.pending(self, self._pending)
+
+    def __enter__(self) -> "AnswerJournal":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _open(self) -> int:
+        """Open the journal for appending, creating it if needed."""
+        return os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o600)
+
+    def _check_header(self, line: bytes) -> None:
+        """Refuse a journal written against a different interview."""
+        try:
+            recorded = json.loads(line).get("yaml")
+        except (ValueError, AttributeError):
+            raise ValueError(
+                f"Journal {self.path} has no interview header; "
+                "it was not written by this version of the interview"
+            ) from None
+        if recorded != self.yaml_hash:
+            raise ValueError(
+                f"Journal {self.path} belongs to interview {recorded}, "
+                f"not {self.yaml_hash}; start a new session instead"
+            )
+
+    def append(
+        self,
+        question_id: str,
+        answer: Any,
+        session: "InterviewSession | None" = None,
+    ) -> None:
+        """
+        Record one processed answer.
+
+        Args:
+            question_id (str): ID of the answered question
+            answer (Any): The answer passed to ``process_answer``
+            session (Optional[InterviewSession]): Session state to snapshot
+                when a snapshot is due
+        """
+        self._write([question_id, answer], session)
+
+    def append_revision(
+        self,
+        question_id: str,
+        answer: Any,
+        session: "InterviewSession | None" = None,
+    ) -> None:
+        """Record a ``revise`` call."""
+        self._write([question_id, answer, 1], session)
+
+    def append_undo(self, session: "InterviewSession | None" = None) -> None:
+        """Record an ``undo`` call."""
+        self._write([None], session)
+
+    def _write(self, record: list[Any], session: "InterviewSession | None") -> None:
+        """
+        Append one record and snapshot when due.
+
+        Only the ``write`` happens here; the shared flusher makes the record
+        durable.
+        """
+        if self._closed:
+            raise ValueError(f"Journal {self.path} is closed")
+        data = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        fd = self._open()
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        self._offset += len(data)
+        self.records += 1
+        with self._lock:
+            self._pending += 1
+            pending = self._pending
+        _flusher.pending(self, pending)
+
+        self._since_snapshot += 1
+        if session is not None and self.snapshot_every:
+            if self._since_snapshot >= self.snapshot_every:
+                self.snapshot(session)
+
+    def sync(self) -> None:
+        """Commit every record written so far to stable storage, now."""
+        with self._lock:
+            if not self._pending:
+                return
+            # fsync flushes the file, whichever descriptor it is called on
+            fd = self._open()
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._pending = 0
+
+    def snapshot(self, session: "InterviewSession") -> None:
+        """
+        Atomically store ``session``'s state and the journal offset it covers.
+
+        The journal is synced first so the snapshot never points past the
+        durable end of the journal.
+        """
+        self.sync()
+        payload = json.dumps(
+            {
+                "yaml": self.yaml_hash,
+                "offset": self._offset,
+                "records": self.records,
+                "state": session.snapshot(),
+            },
+            separators=(",", ":"),
+        )
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._since_snapshot = 0
+
+    def restore(self, session: "InterviewSession") -> "InterviewSession":
+        """
+        Rebuild ``session`` from the latest snapshot plus the journal tail.
+
+        A torn final record left by a crash mid-write, or a record the
+        session rejects, ends the replay; it and everything after it are cut
+        from the journal so later appends start on a clean line.
+
+        Args:
+            session (InterviewSession): A fresh session over the same interview
+
+        Returns:
+            InterviewSession: ``session``, with every journaled answer applied
+
+        Raises:
+            ValueError: If the snapshot belongs to a different interview
+        """
+        offset, records = self._header_end, 0
+        try:
+            snapshot = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            snapshot = None
+        if snapshot is not None and snapshot.get("yaml") != self.yaml_hash:
+            raise ValueError(
+                f"Snapshot {self.snapshot_path} belongs to interview "
+                f"{snapshot.get('yaml')}, not {self.yaml_hash}"
+            )
+        if snapshot is not None and snapshot["offset"] <= self._offset:
+            session.restore(snapshot["state"])
+            offset, records = snapshot["offset"], snapshot["records"]
+
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            tail = f.read()
+
+        good = offset
+        replayed = 0
+        for line in tail.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+                if len(record) == 1:
+                    session.undo()
+                elif len(record) == 3:
+                    session.revise(record[0], record[1])
+                else:
+                    session.process_answer(record[0], record[1])
+            except (IndexError, KeyError, TypeError, ValueError):
+                break
+            good += len(line)
+            replayed += 1
+
+        if good != self._offset:
+            os.truncate(self.path, good)
+            self._offset = good
+        self.records = records + replayed
+        self._since_snapshot = replayed
+        return session
+
+    def close(self) -> None:
+        """Commit outstanding records and close the journal."""
+        if not self._closed:
+            self._closed = True
+            _flusher.discard(self)
+            self.sync()
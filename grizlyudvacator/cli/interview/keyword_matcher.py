@@ -0,0 +1,118 @@
+"""
+Precompiled keyword matchers for ``flags_from_text``.
+
+Each question's keyword labels are compiled once into a single alternation
+regex with one named group per label, so one scan of an answer finds every
+flag instead of running one ``re.search`` per label per answer.
+"""
+
+import re
+from typing import Any
+
+
+def parse_keywords(flags_from_text: dict[str, Any] | None) -> dict[str, str]:
+    """
+    Normalize a ``flags_from_text`` block into a label -> pattern mapping.
+
+    The YAML lists keywords as single-entry mappings (``- illness: "illness"``);
+    a plain mapping is accepted as well. Malformed entries are skipped.
+    """
+    if not flags_from_text:
+        return {}
+    keywords = flags_from_text.get("keywords", [])
+    if isinstance(keywords, dict):
+        return dict(keywords)
+
+    keywords_dict = {}
+    if isinstance(keywords, list):
+        for item in keywords:
+            if isinstance(item, dict) and len(item) == 1:
+                key = next(iter(item))
+                keywords_dict[key] = item[key]
+    return keywords_dict
+
+
+class KeywordMatcher:
+    """
+    Single-pass matcher returning every keyword label found in a text.
+
+    The combined pattern is a zero-width lookahead alternation, so a match
+    never consumes text that a later label could also match. When several
+    labels could start at the same position the alternation only reports the
+    first, so the later labels are re-checked at that position alone.
+
+    Attributes:
+        labels (Tuple[str, ...]): Flag labels in declaration order
+    """
+
+    __slots__ = ("labels", "_combined", "_patterns")
+
+    def __init__(self, keywords: dict[str, str]) -> None:
+        """
+        Compile the matcher.
+
+        Args:
+            keywords (Dict[str, str]): Flag label -> regex pattern
+        """
+        self.labels = tuple(keywords)
+        bounded = [rf"\b(?:{pattern})\b" for pattern in keywords.values()]
+        self._patterns = [re.compile(p, re.IGNORECASE) for p in bounded]
+        self._combined = re.compile(
+            "(?=" + "|".join(f"(?P<k{i}>{p})" for i, p in enumerate(bounded)) + ")",
+            re.IGNORECASE,
+        )
+
+    def _scan(self, text: str) -> list[bool]:
+        """Return, per label, whether its pattern occurs in ``text``."""
+        remaining = len(self.labels)
+        found = [False] * remaining
+        for match in self._combined.finditer(text):
+            index = int(match.lastgroup[1:])
+            if not found[index]:
+                found[index] = True
+                remaining -= 1
+            pos = match.start()
+            for other in range(index + 1, len(found)):
+                if not found[other] and self._patterns[other].match(text, pos):
+                    found[other] = True
+                    remaining -= 1
+            if not remaining:
+                break
+        return found
+
+    def findall(self, text: str) -> list[str]:
+        """
+        Return the labels whose pattern occurs in ``text``.
+
+        Args:
+            text (str): Answer text to scan
+
+        Returns:
+            List[str]: Matching labels, in declaration order
+        """
+        return [label for label, hit in zip(self.labels, self._scan(text)) if hit]
+
+    def match_mask(self, text: str, label_bits: tuple[int, ...]) -> int:
+        """
+        Return the flag bitmask of the labels found in ``text``.
+
+        Args:
+            text (str): Answer text to scan
+            label_bits (Tuple[int, ...]): Flag bit for each label, in order
+
+        Returns:
+            int: OR of the bits of every matching label
+        """
+        mask = 0
+        for bit, hit in zip(label_bits, self._scan(text)):
+            if hit:
+                mask |= bit
+        return mask
+
+
+def compile_keyword_matcher(
+    flags_from_text: dict[str, Any] | None,
+) -> KeywordMatcher | None:
+    """Build the matcher for a question, or None if it has no keywords."""
+    keywords = parse_keywords(flags_from_text)
+    return KeywordMatcher(keywords) if keywords else None
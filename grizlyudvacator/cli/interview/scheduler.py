@@ -0,0 +1,226 @@
+"""
+Time-wheel scheduling of stored-session refreshes.
+
+Date flags and statutory windows are evaluated against the day an answer
+is processed, so stored sessions go stale as time passes. On any given day
+almost no case crosses a threshold, so instead of recomputing the whole
+caseload nightly each session is parked in a hashed timing wheel under the
+next day one of its ``date_flags`` thresholds or filing deadlines flips.
+Advancing the wheel to a day wakes only the sessions due on it.
+"""
+
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from grizlyudvacator.backend.interview.deadline_index import answer_deadlines
+from grizlyudvacator.backend.rules.rule_engine import evaluate_statutes
+from grizlyudvacator.cli.interview.batch import statute_facts
+from grizlyudvacator.cli.interview.interview_engine import InterviewSession
+from grizlyudvacator.utils.court_days import CourtCalendar
+
+
+class TimeWheel:
+    """
+    Hashed timing wheel of per-key due days.
+
+    A key due on day ordinal ``d`` lives in slot ``d % size``. Advancing
+    through a day only inspects that day's slot; keys due a whole number of
+    turns later stay in the slot until their day comes round.
+    """
+
+    __slots__ = ("size", "now", "_slots", "_due")
+
+    def __init__(self, start: date, size: int = 512) -> None:
+        """
+        Create an empty wheel.
+
+        Args:
+            start (date): Last day already processed
+            size (int): Number of day slots
+        """
+        self.size = size
+        self.now = start.toordinal()
+        self._slots: list[dict[str, int]] = [{} for _ in range(size)]
+        self._due: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._due
+
+    def due(self, key: str) -> date | None:
+        """Return the day ``key`` is due, or None if it is not scheduled."""
+        ordinal = self._due.get(key)
+        return date.fromordinal(ordinal) if ordinal is not None else None
+
+    def schedule(self, key: str, day: date) -> None:
+        """
+        Schedule ``key`` for ``day``, replacing any earlier schedule.
+
+        Days already processed fire on the next ``advance``.
+        """
+        self.cancel(key)
+        ordinal = max(day.toordinal(), self.now + 1)
+        self._slots[ordinal % self.size][key] = ordinal
+        self._due[key] = ordinal
+
+    def cancel(self, key: str) -> None:
+        """Unschedule ``key``; unknown keys are ignored."""
+        ordinal = self._due.pop(key, None)
+        if ordinal is not None:
+            del self._slots[ordinal % self.size][key]
+
+    def advance(self, day: date) -> Iterator[str]:
+        """
+        Process every day up to and including ``day``.
+
+        Keys are unscheduled as they are yielded, so they may be rescheduled
+        from inside the loop.
+
+        Yields:
+            str: Each key that came due, in due-day order
+        """
+        target = day.toordinal()
+        if self._due and target - self.now > self.size:
+            # Skip straight past empty stretches longer than a full turn
+            self.now = min(min(self._due.values()), target) - 1
+        while self.now < target:
+            self.now += 1
+            slot = self._slots[self.now % self.size]
+            fired = [key for key, ordinal in slot.items() if ordinal == self.now]
+            for key in fired:
+                del slot[key]
+                del self._due[key]
+            yield from fired
+            if not self._due:
+                self.now = target
+
+
+def next_flip(
+    session: InterviewSession,
+    today: date,
+    court_calendar: CourtCalendar | None = None,
+) -> date | None:
+    """
+    Return the first day after ``today`` on which the session's flags or
+    filing windows change.
+
+    Considers every unset ``date_flags`` threshold of the answered date
+    questions and the day after each filing deadline.
+
+    Args:
+        session (InterviewSession): Session to inspect
+        today (date): Day the session's flags are current for
+        court_calendar (Optional[CourtCalendar]): Calendar for deadlines
+
+    Returns:
+        Optional[date]: The next change, or None if nothing will change
+    """
+    compiled = session.compiled
+    index = compiled.transitions.index
+    flips = []
+
+    for question_id, answer in session.answers.items():
+        date_bits = compiled.date_flag_bits[index[question_id]]
+        if not date_bits or not isinstance(answer, str):
+            continue
+        try:
+            answered = datetime.strptime(answer, "%Y-%m-%d").date()
+        except ValueError:
+            continue
+        for threshold, bit in date_bits:
+            if not session.flag_mask & bit:
+                flips.append(answered + timedelta(days=threshold))
+
+    for deadline in answer_deadlines(session.answers, court_calendar).values():
+        flips.append(deadline + timedelta(days=1))
+
+    upcoming = [day for day in flips if day > today]
+    return min(upcoming) if upcoming else None
+
+
+class RefreshScheduler:
+    """
+    Keeps stored sessions' date flags and statute results current.
+
+    Attributes:
+        sessions (Dict[str, InterviewSession]): Tracked sessions by case ID
+        wheel (TimeWheel): Pending refreshes keyed by case ID
+        court_calendar (Optional[CourtCalendar]): Calendar for deadlines
+    """
+
+    def __init__(
+        self,
+        today: date | None = None,
+        court_calendar: CourtCalendar | None = None,
+        wheel_size: int = 512,
+    ) -> None:
+        """
+        Create an empty scheduler.
+
+        Args:
+            today (Optional[date]): Day tracked sessions are current for;
+                defaults to the current date
+            court_calendar (Optional[CourtCalendar]): Calendar for deadlines
+            wheel_size (int): Number of day slots in the wheel
+        """
+        self.today = today or date.today()
+        self.court_calendar = court_calendar
+        self.sessions: dict[str, InterviewSession] = {}
+        self.wheel = TimeWheel(self.today, wheel_size)
+
+    def track(self, case_id: str, session: InterviewSession) -> dict[str, Any]:
+        """
+        Start tracking a session, bringing it up to date first.
+
+        Call again whenever the session's answers change.
+
+        Returns:
+            Dict[str, Any]: The session's current refresh result
+        """
+        self.sessions[case_id] = session
+        return self._refresh(case_id, session)
+
+    def untrack(self, case_id: str) -> None:
+        """Stop tracking a session; unknown case IDs are ignored."""
+        self.sessions.pop(case_id, None)
+        self.wheel.cancel(case_id)
+
+    def advance(self, today: date | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Move to ``today``, refreshing only the sessions that came due.
+
+        Args:
+            today (Optional[date]): New current day; defaults to the current date
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Refresh results of the woken sessions
+        """
+        self.today = today or date.today()
+        due = list(self.wheel.advance(self.today))
+        return {
+            case_id: self._refresh(case_id, self.sessions[case_id]) for case_id in due
+        }
+
+    def _refresh(self, case_id: str, session: InterviewSession) -> dict[str, Any]:
+        """Recompute a session's flags and statutes and reschedule it."""
+        added = session.refresh_date_flags(self.today)
+        deadlines = answer_deadlines(session.answers, self.court_calendar)
+        flags = session.flags
+        facts = statute_facts(session.answers, flags)
+
+        following = next_flip(session, self.today, self.court_calendar)
+        if following is None:
+            self.wheel.cancel(case_id)
+        else:
+            self.wheel.schedule(case_id, following)
+
+        return {
+            "flags": flags,
+            "added_flags": session.compiled.flag_registry.names(added),
+            "expired": sorted(s for s, d in deadlines.items() if d < self.today),
+            "result": evaluate_statutes(facts),
+            "next_refresh": following,
+        }
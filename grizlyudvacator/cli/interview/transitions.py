@@ -0,0 +1,147 @@
+"""
+Integer-indexed transition tables for the interview graph.
+
+The question graph is compiled once into dense tables so that moving from
+one question to the next is a couple of list lookups instead of walking
+the nested ``follow_up`` dicts on every answer.
+
+Every question owns a contiguous block of *branches*:
+
+    offset[q] + 0   default branch (``next`` / ``follow_up.next``)
+    offset[q] + 1   ``follow_up.if_true``
+    offset[q] + 2   ``follow_up.if_false``
+    offset[q] + 3.. one branch per ``follow_up.options`` entry
+
+``successor[b]`` is the index of the next question (``END`` when the
+interview is over) and ``branch_flags[b]`` the flags that branch adds.
+"""
+
+from array import array
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from grizlyudvacator.cli.interview.interview_engine import Question
+
+# Successor value marking the end of the interview.
+END = -1
+
+# Branch target that explicitly ends the interview (as does a missing one).
+END_ID = "end"
+
+DEFAULT_BRANCH = 0
+TRUE_BRANCH = 1
+FALSE_BRANCH = 2
+OPTION_BRANCH = 3
+
+
+class TransitionTable:
+    """
+    Dense successor and flag-delta tables for a validated question graph.
+
+    Attributes:
+        ids (Tuple[str, ...]): Question ID for each question index
+        index (Dict[str, int]): Question index for each question ID
+        offset (array): First branch index of each question
+        successor (array): Next question index for each branch, or ``END``
+        branch_flags (List[Tuple[str, ...]]): Flags added by each branch
+        has_bool_branches (List[bool]): Whether a question has if_true/if_false
+        option_branch (List[Dict[str, int]]): Option value to branch, per question
+    """
+
+    __slots__ = (
+        "ids",
+        "index",
+        "offset",
+        "successor",
+        "branch_flags",
+        "has_bool_branches",
+        "option_branch",
+    )
+
+    def __init__(self, questions: dict[str, "Question"]) -> None:
+        """
+        Compile the transition tables for a set of questions.
+
+        Args:
+            questions (Dict[str, Question]): Questions by ID, in interview order
+        """
+        self.ids = tuple(questions)
+        self.index = {qid: i for i, qid in enumerate(self.ids)}
+        self.offset = array("i")
+        self.successor = array("i")
+        self.branch_flags: list[tuple[str, ...]] = []
+        self.has_bool_branches: list[bool] = []
+        self.option_branch: list[dict[str, int]] = []
+
+        for question in questions.values():
+            self._compile_question(question)
+
+    def _resolve(self, next_id: Any) -> int:
+        """
+        Map a successor question ID to its index.
+
+        ``None`` and ``END_ID`` (unless a question has that ID) finish the
+        interview. Every other target is checked to be a question by
+        ``CompiledInterview._validate_question_references``.
+        """
+        if next_id is None:
+            return END
+        return self.index.get(next_id, END)
+
+    def _add_branch(self, next_id: Any, flags: Any) -> int:
+        """Append one branch row and return its index."""
+        self.successor.append(self._resolve(next_id))
+        self.branch_flags.append(tuple(flags or ()))
+        return len(self.successor) - 1
+
+    def _compile_question(self, question: "Question") -> None:
+        """Append the branch block for a single question."""
+        follow_up = question.follow_up
+        default_next = question.next
+        if isinstance(follow_up, str):
+            default_next = follow_up
+            follow_up = None
+        elif follow_up and follow_up.get("next") is not None:
+            default_next = follow_up["next"]
+        follow_up = follow_up or {}
+
+        self.offset.append(len(self.successor))
+        self._add_branch(default_next, ())
+
+        has_bool = "if_true" in follow_up or "if_false" in follow_up
+        self.has_bool_branches.append(has_bool)
+        for key in ("if_true", "if_false"):
+            info = follow_up.get(key) or {}
+            self._add_branch(info.get("next", default_next), info.get("flags"))
+
+        options = {}
+        for option, info in (follow_up.get("options") or {}).items():
+            info = info or {}
+            options[option] = self._add_branch(
+                info.get("next", default_next), info.get("flags")
+            )
+        self.option_branch.append(options)
+
+    def branch(self, question_index: int, answer: Any) -> int:
+        """
+        Select the branch taken by an answer.
+
+        Args:
+            question_index (int): Index of the answered question
+            answer (Any): The validated answer
+
+        Returns:
+            int: Branch index into ``successor`` and ``branch_flags``
+        """
+        base = self.offset[question_index]
+        if answer is True or answer is False:
+            if self.has_bool_branches[question_index]:
+                return base + (TRUE_BRANCH if answer else FALSE_BRANCH)
+        elif type(answer) is str:
+            return self.option_branch[question_index].get(answer, base)
+        return base
+
+    def next_id(self, branch: int) -> str | None:
+        """Return the question ID a branch leads to, or None at the end."""
+        successor = self.successor[branch]
+        return self.ids[successor] if successor != END else None
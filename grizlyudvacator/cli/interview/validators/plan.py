@@ -0,0 +1,134 @@
+"""
+Validation plan compiler.
+
+Turns each ``Question`` into one specialized validation callable when the
+interview is loaded. Bounds, length limits and options are frozen into the
+closure (options as frozensets), so validating an answer is a single call
+that builds no validator objects. Error messages match the validator
+classes in ``interview_engine`` exactly.
+"""
+
+from collections.abc import Callable
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from grizlyudvacator.cli.interview.interview_engine import Question
+
+ValidateFn = Callable[[Any], None]
+
+
+def _number_plan(question: "Question") -> ValidateFn:
+    """Rule 1.2.1: Number Validation."""
+    low, high = question.min, question.max
+
+    def validate(answer: Any) -> None:
+        if not isinstance(answer, (int, float)):
+            raise TypeError(f"Expected number, got {type(answer).__name__}")
+        if low is not None and answer < low:
+            raise ValueError(f"Value must be at least {low}")
+        if high is not None and answer > high:
+            raise ValueError(f"Value must be at most {high}")
+
+    return validate
+
+
+def _text_plan(question: "Question") -> ValidateFn:
+    """Rule 1.2.2: Text Validation."""
+    min_length, max_length = question.min_length, question.max_length
+
+    def validate(answer: Any) -> None:
+        if not isinstance(answer, str):
+            raise TypeError(f"Expected string, got {type(answer).__name__}")
+        if min_length is not None and len(answer) < min_length:
+            raise ValueError(f"Text must be at least {min_length} characters")
+        if max_length is not None and len(answer) > max_length:
+            raise ValueError(f"Text must be at most {max_length} characters")
+
+    return validate
+
+
+def _boolean_plan(question: "Question") -> ValidateFn:
+    """Rule 1.2.3: Boolean Validation."""
+
+    def validate(answer: Any) -> None:
+        if not isinstance(answer, bool):
+            raise TypeError(f"Expected boolean, got {type(answer).__name__}")
+
+    return validate
+
+
+def _date_plan(question: "Question") -> ValidateFn:
+    """Rule 1.2.4: Date Validation."""
+    strptime = datetime.strptime
+
+    def validate(answer: Any) -> None:
+        if not isinstance(answer, str):
+            raise TypeError(f"Expected string for date, got {type(answer).__name__}")
+        # Mirrors DateValidator: any ValueError, including a future date,
+        # is reported as a format error.
+        try:
+            if strptime(answer, "%Y-%m-%d").date() > date.today():
+                raise ValueError("Date cannot be in the future")
+        except ValueError:
+            raise ValueError("Invalid date format. Use YYYY-MM-DD")
+
+    return validate
+
+
+def _choice_plan(question: "Question") -> ValidateFn:
+    """Rule 1.2.5: Choice Validation."""
+    options = frozenset(question.options or ())
+    message = f"Invalid choice. Options are: {', '.join(question.options or ())}"
+
+    def validate(answer: Any) -> None:
+        if not isinstance(answer, str):
+            raise TypeError(f"Expected string, got {type(answer).__name__}")
+        if answer not in options:
+            raise ValueError(message)
+
+    return validate
+
+
+def _multiple_choice_plan(question: "Question") -> ValidateFn:
+    """Rule 1.2.6: Multiple Choice Validation."""
+    options = frozenset(question.options or ())
+    min_choices, max_choices = question.min_choices, question.max_choices
+
+    def validate(answer: Any) -> None:
+        if not isinstance(answer, list):
+            raise TypeError(f"Expected list, got {type(answer).__name__}")
+        if not options.issuperset(answer):
+            invalid = [choice for choice in answer if choice not in options]
+            raise ValueError(f"Invalid choices: {', '.join(invalid)}")
+        if min_choices is not None and len(answer) < min_choices:
+            raise ValueError(f"At least {min_choices} choices required")
+        if max_choices is not None and len(answer) > max_choices:
+            raise ValueError(f"At most {max_choices} choices allowed")
+
+    return validate
+
+
+_PLANS: dict[str, Callable[["Question"], ValidateFn]] = {
+    "number": _number_plan,
+    "text": _text_plan,
+    "boolean": _boolean_plan,
+    "date": _date_plan,
+    "choice": _choice_plan,
+    "multiple_choice": _multiple_choice_plan,
+}
+
+
+def compile_validator(question: "Question") -> ValidateFn | None:
+    """
+    Compile the validation callable for a question.
+
+    Args:
+        question (Question): The question to compile
+
+    Returns:
+        Optional[Callable[[Any], None]]: Raises TypeError/ValueError for an
+        invalid answer; None for question types without validation
+    """
+    plan = _PLANS.get(question.type)
+    return plan(question) if plan else None
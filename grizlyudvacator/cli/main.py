@@ -8,18 +8,27 @@ when assessing the viability of a motion to set aside default judgment
 in eviction cases.
 """
 
+import argparse
 import datetime
 import os
-import re
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
 
+from grizlyudvacator.backend.rules.rule_engine import evaluate_statutes
+from grizlyudvacator.cli.batch_runner import errors_path, print_progress, run_batch
+from grizlyudvacator.cli.interview.artifact_cache import (
+    load_interview,
+    yaml_content_hash,
+)
+from grizlyudvacator.cli.interview.batch import statute_facts
 from grizlyudvacator.cli.interview.interview_engine import InterviewEngine
+from grizlyudvacator.cli.interview.journal import AnswerJournal
 from grizlyudvacator.cli.io.console_io import ConsoleIO
 from grizlyudvacator.cli.io.io_interface import IOInterface
+from grizlyudvacator.utils.path_utils import get_session_dir
 
 
 def load_yaml(path: str) -> dict[str, Any]:
@@ -113,87 +122,44 @@ def _ask_question_impl(io: IOInterface, q: dict[str, Any]) -> Any:
 
 def _run_interview_impl(io: IOInterface, yaml_data):
     """Internal implementation of run_interview that uses IO interface."""
-    # Initialize interview engine
+    # Prompts go through _ask_question_impl; validation, flags and flow go
+    # through InterviewSession.process_answer
     engine = InterviewEngine(yaml_data)
-    answers = {}
-    flags = []
     current_id = engine.current_id
-
     while current_id:
         question = engine.get_question(current_id)
-        ans = _ask_question_impl(io, question)
-        answers[current_id] = ans
-
-        # Process flags and next question
-        if question.follow_up:
-            if isinstance(ans, bool):
-                branch = "if_true" if ans else "if_false"
-                next_info = question.follow_up.get(branch, {})
-                flags.extend(next_info.get("flags", []))
-                current_id = next_info.get("next", question.get("next"))
-            elif isinstance(ans, str) and "options" in question.follow_up:
-                next_info = question.follow_up["options"].get(ans, {})
-                flags.extend(next_info.get("flags", []))
-                current_id = next_info.get("next", question.get("next"))
-            else:
-                current_id = question.get("next")
-        else:
-            current_id = question.get("next")
-
-        # Handle text-based flags
-        if question.flags_from_text and isinstance(ans, str):
-            # Get the keywords section
-            keywords = question.flags_from_text.get("keywords", [])
-            if isinstance(keywords, list):
-                # If it's a list, convert to dict format
-                keywords_dict = {}
-                for item in keywords:
-                    if isinstance(item, dict) and len(item) == 1:
-                        key = next(iter(item))
-                        value = item[key]
-                        keywords_dict[key] = value
-                keywords = keywords_dict
-
-            # Now process the keywords
-            for label, pattern in keywords.items():
-                if re.search(rf"\b{pattern}\b", ans, re.IGNORECASE):
-                    flags.append(label)
-
-            # Calculate time-based flags if dates are involved
-            if question.type == "date" and question.date_flags and ans:
-                try:
-                    date_obj = datetime.datetime.strptime(ans, "%Y-%m-%d").date()
-                    today = datetime.date.today()
-                    days_diff = (today - date_obj).days
-
-                    for flag, threshold in question.date_flags.items():
-                        if days_diff >= threshold:
-                            flags.append(flag)
-                except ValueError:
-                    # Skip if date is invalid
-                    pass
-
-    # Generate recommendation based on flags
+        answer = _ask_question_impl(io, question)
+        if question["type"] == "summary":
+            break  # the summary ends the interview, as in InterviewRunner
+        try:
+            current_id = engine.process_answer(current_id, answer)
+        except (TypeError, ValueError) as e:
+            io.write_output(f"❌ {e}")
+    answers = engine.get_answers()
+    flags = engine.get_flags()
+
+    # Generate recommendation based on flags (set membership, not list scans)
+    flag_set = set(flags)
     io.write_output("\n📝 Initial Assessment:")
-    if "improper_service" in flags:
+    if "improper_service" in flag_set:
         io.write_output(
             " ✅ Potential grounds for motion based on improper service (CCP § 473.5)"
         )
-    if "mistake_neglect" in flags:
+    if "mistake_neglect" in flag_set:
         io.write_output(
             " ✅ Potential grounds based on mistake/excusable neglect (CCP § 473(b))"
         )
-    if "fraud_misconduct" in flags:
+    if "fraud_misconduct" in flag_set:
         io.write_output(" ✅ Potential grounds based on fraud/misconduct (CCP § 473(d))")
-    if "void_judgment" in flags:
+    if "void_judgment" in flag_set:
         io.write_output(" ✅ Potential void judgment argument available")
-    if "time_barred" in flags:
+    if "time_barred" in flag_set:
         io.write_output(" ⚠️ Motion may be time-barred - careful review needed")
-    if "urgent_lockout" in flags:
+    if "urgent_lockout" in flag_set:
         io.write_output(" ⚠️ URGENT: Lockout imminent - consider ex parte application")
 
     if not any(
-        x in flags
+        x in flag_set
         for x in [
             "improper_service",
             "mistake_neglect",
@@ -207,8 +173,6 @@ def _run_interview_impl(io: IOInterface, yaml_data):
 
     return answers, flags
 
-    return answers
-
 
 def save_results(
     answers: dict[str, Any],
@@ -251,18 +215,33 @@ class InterviewRunner:
         yaml_data (Dict[str, Any]): YAML data containing interview questions and logic
         io (Optional[IOInterface]): Optional IO interface for user interaction
         engine (InterviewEngine): Interview engine instance
+        journal (Optional[AnswerJournal]): Journal recording every processed answer
     """
 
-    def __init__(self, yaml_data: dict[str, Any], io: IOInterface | None = None):
+    def __init__(
+        self,
+        yaml_data: dict[str, Any],
+        io: IOInterface | None = None,
+        engine: InterviewEngine | None = None,
+        journal: AnswerJournal | None = None,
+    ):
         """Initialize with YAML data and optional IO interface.
 
         Args:
             yaml_data (Dict[str, Any]): YAML data containing interview questions and logic
             io (Optional[IOInterface]): Optional IO interface for user interaction
+            engine (Optional[InterviewEngine]): Prebuilt engine, e.g. from the
+                compiled artifact cache; built from ``yaml_data`` if omitted
+            journal (Optional[AnswerJournal]): Journal to append each answer to.
+                When given, the engine is first restored from it, so a run
+                interrupted by a crash resumes where it stopped
         """
         self.yaml_data = yaml_data
         self.io = io or ConsoleIO()
-        self.engine = InterviewEngine(yaml_data)
+        self.engine = engine or InterviewEngine(yaml_data)
+        self.journal = journal
+        if journal is not None:
+            journal.restore(self.engine)
 
     def run(self) -> dict[str, Any]:
         """Run the interview and return results.
@@ -270,18 +249,18 @@ class InterviewRunner:
         Returns:
             Dict[str, Any]: Dictionary containing user answers and flags
         """
-        current_id = self.yaml_data.get(
-            "start_id", self.yaml_data["questions"][0]["id"]
-        )
+        # Start from the engine's position so restored sessions resume
+        current_id = self.engine.current_id
 
-        while True:
+        while current_id is not None:
             question = self.engine.get_question(current_id)
             if not question:
                 break
 
             current_id = self._ask_question(question)
-            if current_id is None:
-                break
+
+        if self.journal is not None:
+            self.journal.sync()
 
         answers = self.engine.get_answers()
         flags = self.engine.get_flags()
@@ -357,8 +336,10 @@ class InterviewRunner:
                             "Enter date (YYYY-MM-DD): "
                         ).strip()
                         try:
-                            date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-                            today = date.today()
+                            date_obj = datetime.datetime.strptime(
+                                date_str, "%Y-%m-%d"
+                            ).date()
+                            today = datetime.date.today()
                             if date_obj > today:
                                 self.io.write_output("Date cannot be in the future")
                                 continue
@@ -404,6 +385,8 @@ class InterviewRunner:
                 # Process the answer and get next question ID
                 try:
                     next_id = self.engine.process_answer(question["id"], answer)
+                    if self.journal is not None:
+                        self.journal.append(question["id"], answer, self.engine)
                     return next_id
                 except ValueError as e:
                     self.io.write_output(str(e))
@@ -421,25 +404,148 @@ def run_interview(
     return runner.run()
 
 
+DEFAULT_YAML_PATH = os.path.join(
+    os.path.dirname(__file__), "prompts", "vacate_default.yaml"
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser; no subcommand runs the interactive interview."""
+    parser = argparse.ArgumentParser(
+        prog="grizly", description="Default Judgment Interview System"
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="SESSION",
+        help="Resume an interrupted interview from its session journal",
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    batch = commands.add_parser(
+        "batch", help="Triage a JSONL or CSV intake file without prompting"
+    )
+    batch.add_argument("input", help="JSONL or CSV file of intake answers")
+    batch.add_argument(
+        "-o", "--output", help="JSONL results file (default: <input>.results.jsonl)"
+    )
+    batch.add_argument("--yaml", default=DEFAULT_YAML_PATH, help="Interview YAML")
+    batch.add_argument(
+        "-j", "--workers", type=int, help="Worker processes (0 runs in-process)"
+    )
+    batch.add_argument("--chunk-size", type=int, default=256)
+    batch.add_argument(
+        "--max-pending", type=int, help="Chunks in flight before reading pauses"
+    )
+    batch.add_argument(
+        "--documents", action="store_true", help="Generate a motion per eligible case"
+    )
+    batch.add_argument(
+        "--restart", action="store_true", help="Ignore any checkpoint and start over"
+    )
+    batch.add_argument("-q", "--quiet", action="store_true", help="No progress output")
+    return parser
+
+
+def batch_main(options: argparse.Namespace) -> None:
+    """Run the ``batch`` subcommand."""
+    input_path = Path(options.input)
+    output_path = options.output or input_path.with_name(
+        input_path.stem + ".results.jsonl"
+    )
+    try:
+        total = run_batch(
+            input_path,
+            output_path,
+            options.yaml,
+            workers=options.workers,
+            chunk_size=options.chunk_size,
+            max_pending=options.max_pending,
+            generate_documents=options.documents,
+            resume=not options.restart,
+            progress=None if options.quiet else print_progress,
+        )
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"✅ {total} records triaged -> {output_path}")
+    error_path = errors_path(Path(output_path))
+    if error_path.stat().st_size:
+        print(f"⚠️ Unreadable records were skipped; see {error_path}")
+
+
+def open_session_journal(
+    yaml_path: str, session: str | None = None
+) -> tuple[str, AnswerJournal]:
+    """
+    Open the journal of an interactive interview session.
+
+    Args:
+        yaml_path (str): Interview YAML the session answers
+        session (Optional[str]): Session to resume; a new, timestamped
+            session is started if omitted
+
+    Returns:
+        Tuple[str, AnswerJournal]: The session name and its open journal
+
+    Raises:
+        ValueError: If ``session`` has no journal, or its journal was written
+            against a different interview YAML
+    """
+    if session is None:
+        session = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = get_session_dir() / f"{session}.journal"
+    else:
+        path = get_session_dir() / f"{Path(session).name}.journal"
+        if Path(session).name != session or not path.exists():
+            raise ValueError(f"No saved session named {session}")
+    with open(yaml_path, "rb") as f:
+        yaml_hash = yaml_content_hash(f.read())
+    return session, AnswerJournal(path, yaml_hash)
+
+
 def main(args=None):
+    options = build_parser().parse_args(args)
+    if options.command == "batch":
+        batch_main(options)
+        return
+
     # Initialize IO
     io = ConsoleIO()
 
     # Get YAML path
-    yaml_path = io.join_path(
-        os.path.dirname(__file__), "prompts", "vacate_default.yaml"
-    )
+    yaml_path = DEFAULT_YAML_PATH
     if not io.exists(yaml_path):
         io.write_output(f"❌ Error: YAML file not found at {yaml_path}")
         sys.exit(1)
 
-    yaml_data = load_yaml(yaml_path)
+    # Load the compiled interview, parsing and validating only on a cache miss
+    try:
+        engine = load_interview(yaml_path)
+    except Exception as e:
+        io.write_output(f"❌ Failed to load YAML: {e}")
+        sys.exit(1)
+
+    # Journal every answer so an interrupted interview can be resumed
+    try:
+        session, journal = open_session_journal(yaml_path, options.resume)
+    except ValueError as e:
+        io.write_output(f"❌ {e}")
+        sys.exit(1)
 
-    # Run the interview
-    answers, flags = run_interview(io, yaml_data)
+    # Run the interview, restoring any journaled answers before the first prompt
+    with journal:
+        try:
+            runner = InterviewRunner(
+                engine.yaml_data, io, engine=engine, journal=journal
+            )
+        except ValueError as e:
+            io.write_output(f"❌ {e}")
+            sys.exit(1)
+        io.write_output(f"📝 Session {session} (resume with --resume {session})")
+        answers, flags = runner.run()
 
     # Evaluate legal basis
-    result = evaluate_statutes(flags)
+    result = evaluate_statutes(statute_facts(answers, flags))
 
     # Generate the motion document
     generate_motion(answers, result)
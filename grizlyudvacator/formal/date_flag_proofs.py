@@ -0,0 +1,252 @@
+"""
+Symbolic proofs of date-flag behaviour.
+
+Sampled checks such as ``InterviewVerifier.verify_date_flags`` prove one
+pair of concrete timestamps at a time. Here the answer date and the current
+day are unbounded symbolic integers counting days.
+
+The specification comes straight from the question's YAML ``date_flags``:
+each flag fires exactly when ``days_diff >= threshold``. The implementation
+side is encoded only from the compiled masks ``InterviewSession`` applies:
+``static_masks``, ``keyword_bits`` (any keyword may match, so each is a
+free boolean), ``branch_masks`` (any of the question's branches may be
+taken) and the ``date_flag_bits`` thresholds, compared with ``>=`` as in
+``_process_date_flags``. Z3 then proves, for every input at once, that the
+two agree and that a fired flag never clears as days pass, which
+``refresh_date_flags`` relies on. A flag the compiled tables raise early or
+late, from any source, is a counterexample. Results are cached by the YAML
+content hash together with the compiled-artifact version and a hash of
+``_process_date_flags``'s source, so a change to the engine's comparison
+redoes the proof.
+"""
+
+import hashlib
+import inspect
+from pathlib import Path
+from typing import Any
+
+import z3
+
+from grizlyudvacator.cli.interview.artifact_cache import (
+    ARTIFACT_VERSION,
+    compile_interview,
+    yaml_content_hash,
+)
+from grizlyudvacator.cli.interview.interview_engine import (
+    CompiledInterview,
+    InterviewSession,
+)
+from grizlyudvacator.formal.proof_cache import ProofCache, proof_key
+
+# Bump whenever the encoding below changes so cached proofs are redone.
+DATE_FLAG_PROOF_VERSION = 3
+
+# The engine code the encoding mirrors; cached proofs are redone when it changes
+ENGINE_FINGERPRINT = hashlib.sha256(
+    inspect.getsource(InterviewSession._process_date_flags).encode("utf-8")
+).hexdigest()
+
+
+class DateFlagProver:
+    """
+    Proves the date flags of compiled interviews in one reused solver.
+
+    Each property is checked by asserting its negation inside a push/pop
+    scope: unsat is a proof, and a model is a counterexample.
+    """
+
+    def __init__(self, context: z3.Context | None = None):
+        self.context = context or z3.Context()
+        self.solver = z3.Solver(ctx=self.context)
+        self.answer = z3.Int("answer_day", self.context)
+        self.today = z3.Int("today", self.context)
+        self.later = z3.Int("later", self.context)
+
+    def _fired(
+        self, day: z3.ArithRef, sources: list[z3.BoolRef], thresholds: list[int]
+    ) -> z3.BoolRef:
+        """Encode whether the implementation raises a flag on ``day``."""
+        crossings = [day - self.answer >= threshold for threshold in thresholds]
+        return z3.Or([*sources, *crossings], self.context)
+
+    def _sources(
+        self, compiled: CompiledInterview, position: int, bit: int
+    ) -> dict[str, z3.BoolRef]:
+        """
+        Encode every way a question raises ``bit`` regardless of the date.
+
+        Returns:
+            Dict[str, z3.BoolRef]: Conditions keyed by source name
+            (``static``, ``keyword:<label>`` or ``branch:<index>``)
+        """
+        ctx = self.context
+        sources = {}
+        if compiled.static_masks[position] & bit:
+            sources["static"] = z3.BoolVal(True, ctx)
+        matcher = compiled.keyword_matchers[position]
+        for label, keyword_bit in zip(
+            matcher.labels if matcher else (), compiled.keyword_bits[position]
+        ):
+            if keyword_bit & bit:
+                sources[f"keyword:{label}"] = z3.Bool(f"keyword_{label}", ctx)
+
+        offset = compiled.transitions.offset
+        end = (
+            offset[position + 1]
+            if position + 1 < len(offset)
+            else len(compiled.branch_masks)
+        )
+        branch = z3.Int("branch", ctx)
+        raising = [
+            b for b in range(offset[position], end) if compiled.branch_masks[b] & bit
+        ]
+        if raising:
+            sources["branch"] = z3.And(
+                offset[position] <= branch,
+                branch < end,
+                z3.Or([branch == b for b in raising], ctx),
+            )
+        return sources
+
+    def _counterexample(self, claim: z3.BoolRef) -> z3.ModelRef | None:
+        """Return a model violating ``claim``, or None if it always holds."""
+        self.solver.push()
+        try:
+            self.solver.add(z3.Not(claim))
+            if self.solver.check() == z3.unsat:
+                return None
+            return self.solver.model()
+        finally:
+            self.solver.pop()
+
+    def _days(self, model: z3.ModelRef, day: z3.ArithRef) -> int:
+        return model.eval(day - self.answer, model_completion=True).as_long()
+
+    @staticmethod
+    def _raised_by(model: z3.ModelRef, sources: dict[str, z3.BoolRef]) -> list[str]:
+        """Return the non-date sources that fire in a counterexample."""
+        return [
+            name
+            for name, condition in sources.items()
+            if z3.is_true(model.eval(condition, model_completion=True))
+        ]
+
+    def prove_question(
+        self, compiled: CompiledInterview, question_id: str
+    ) -> dict[str, Any]:
+        """
+        Prove one question's ``date_flags`` for every answer date and day.
+
+        Args:
+            compiled (CompiledInterview): Interview the question belongs to
+            question_id (str): Question to prove
+
+        Returns:
+            Dict[str, Any]: ``proved`` and a list of ``counterexamples``, each
+            naming the ``flag``, the ``property`` ("exact" or "monotone"),
+            the ``days_diff`` (and ``later_days_diff``) that break it and
+            the non-date sources it was ``raised_by``
+        """
+        position = compiled.transitions.index[question_id]
+        registry = compiled.flag_registry
+        spec = compiled.question_dicts[question_id].get("date_flags") or {}
+        date_bits = compiled.date_flag_bits[position]
+        # Flags the compiled tables compare against a date, even if the YAML
+        # does not declare them for this question
+        compared = registry.names(sum({bit for _, bit in date_bits}))
+
+        counterexamples = []
+        for flag in [*spec, *(name for name in compared if name not in spec)]:
+            bit = registry.bit(flag) if flag in registry else 0
+            sources = self._sources(compiled, position, bit) if bit else {}
+            thresholds = [t for t, flag_bit in date_bits if flag_bit == bit]
+            fired_today = self._fired(self.today, list(sources.values()), thresholds)
+
+            if flag in spec:
+                expected = self.today - self.answer >= spec[flag]
+            else:
+                expected = z3.BoolVal(False, self.context)
+            model = self._counterexample(fired_today == expected)
+            if model is not None:
+                counterexamples.append(
+                    {
+                        "flag": flag,
+                        "property": "exact",
+                        "days_diff": self._days(model, self.today),
+                        "raised_by": self._raised_by(model, sources),
+                    }
+                )
+
+            fired_later = self._fired(self.later, list(sources.values()), thresholds)
+            monotone = z3.Implies(
+                z3.And(self.later >= self.today, fired_today),
+                fired_later,
+            )
+            model = self._counterexample(monotone)
+            if model is not None:
+                counterexamples.append(
+                    {
+                        "flag": flag,
+                        "property": "monotone",
+                        "days_diff": self._days(model, self.today),
+                        "later_days_diff": self._days(model, self.later),
+                        "raised_by": self._raised_by(model, sources),
+                    }
+                )
+
+        return {"proved": not counterexamples, "counterexamples": counterexamples}
+
+    def prove_interview(self, compiled: CompiledInterview) -> dict[str, Any]:
+        """
+        Prove every question that declares ``date_flags``.
+
+        Returns:
+            Dict[str, Any]: ``proved`` overall and ``questions`` mapping each
+            question ID to its ``prove_question`` result
+        """
+        questions = {
+            question.id: self.prove_question(compiled, question.id)
+            for question, date_bits in zip(
+                compiled.question_list, compiled.date_flag_bits
+            )
+            if compiled.question_dicts[question.id].get("date_flags") or date_bits
+        }
+        return {
+            "proved": all(result["proved"] for result in questions.values()),
+            "questions": questions,
+        }
+
+
+def prove_date_flags(
+    yaml_path: str | Path, cache: ProofCache | None = None
+) -> dict[str, Any]:
+    """
+    Prove an interview's date flags, reusing the result for unchanged YAML.
+
+    Args:
+        yaml_path (Union[str, Path]): Interview YAML file
+        cache (Optional[ProofCache]): Result cache (default: output/cache/proofs)
+
+    Returns:
+        Dict[str, Any]: ``DateFlagProver.prove_interview``'s result plus the
+        ``yaml_hash`` it was proved for
+    """
+    yaml_bytes = Path(yaml_path).read_bytes()
+    yaml_hash = yaml_content_hash(yaml_bytes)
+    cache = cache if cache is not None else ProofCache()
+    key = proof_key(
+        {
+            "proof": "date_flags",
+            "version": DATE_FLAG_PROOF_VERSION,
+            "artifact": ARTIFACT_VERSION,
+            "engine": ENGINE_FINGERPRINT,
+            "yaml": yaml_hash,
+        }
+    )
+
+    result = cache.get(key)
+    if result is None:
+        compiled = compile_interview(yaml_bytes)["interview"]
+        result = {"yaml_hash": yaml_hash, **DateFlagProver().prove_interview(compiled)}
+        cache.put(key, result)
+    return result
@@ -0,0 +1,236 @@
+"""
+Whole-graph verification of an interview.
+
+Compiling an interview rejects unknown branch targets and any cycle
+through any branch, so every path is finite. ``GraphVerifier`` goes
+further: it builds an explicit-state model of every transition an accepted
+answer can take, branch by branch, from the compiled ``TransitionTable``
+and the answer types the validation plans accept, and checks on it that:
+
+- every question is reachable from the start question;
+- no reachable question is a dead end that no accepted answer leaves, so
+  every path terminates;
+- every path to the end passes through the final (review) question;
+- every flag the interview declares (static, branch, keyword and date
+  flags) is raised on some path.
+
+Counterexamples name the offending questions, flags or path.
+Results are cached by the YAML content hash, like ``prove_date_flags``.
+"""
+
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from grizlyudvacator.cli.interview.artifact_cache import (
+    compile_interview,
+    yaml_content_hash,
+)
+from grizlyudvacator.cli.interview.interview_engine import CompiledInterview
+from grizlyudvacator.cli.interview.transitions import END, FALSE_BRANCH, TRUE_BRANCH
+from grizlyudvacator.formal.proof_cache import ProofCache, proof_key
+
+# Bump whenever the model below changes so cached results are redone.
+GRAPH_PROOF_VERSION = 2
+
+FINAL_QUESTION_ID = "review_summary"
+
+
+def feasible_branches(compiled: CompiledInterview, position: int) -> list[int]:
+    """
+    Return every branch an accepted answer to a question can take.
+
+    Mirrors ``InterviewSession.process_answer``: a required question
+    retries on a falsy answer, validation plans restrict the answer types,
+    and ``TransitionTable.branch`` picks the branch for the answer.
+
+    Args:
+        compiled (CompiledInterview): Interview the question belongs to
+        position (int): Question index
+
+    Returns:
+        List[int]: Branch indexes, in table order
+    """
+    table = compiled.transitions
+    question = compiled.question_list[position]
+    base = table.offset[position]
+    options = table.option_branch[position]
+    has_bool = table.has_bool_branches[position]
+
+    if question.type == "boolean":
+        if not has_bool:
+            return [base]
+        # A required question retries on False, so only True moves on
+        if question.required:
+            return [base + TRUE_BRANCH]
+        return [base + TRUE_BRANCH, base + FALSE_BRANCH]
+    if question.type == "choice":
+        return sorted({options.get(option, base) for option in question.options or ()})
+    if question.type in ("text", "date"):
+        return sorted({base, *options.values()})
+    if question.type in ("number", "multiple_choice"):
+        return [base]
+    # Types without a validation plan (e.g. summaries) accept any answer
+    bool_branches = (base + TRUE_BRANCH, base + FALSE_BRANCH) if has_bool else ()
+    return sorted({base, *bool_branches, *options.values()})
+
+
+class GraphVerifier:
+    """
+    Explicit-state model of an interview's question graph.
+
+    Attributes:
+        compiled (CompiledInterview): Interview being verified
+        final_id (str): Question every complete path must pass through
+        successors (List[List[int]]): Feasible next question (or ``END``)
+            of each question
+    """
+
+    __slots__ = ("compiled", "final_id", "successors", "_branches")
+
+    def __init__(
+        self, compiled: CompiledInterview, final_id: str = FINAL_QUESTION_ID
+    ) -> None:
+        self.compiled = compiled
+        self.final_id = final_id
+        table = compiled.transitions
+        self._branches = [
+            feasible_branches(compiled, position) for position in range(len(table.ids))
+        ]
+        self.successors = [
+            sorted({table.successor[branch] for branch in branches})
+            for branches in self._branches
+        ]
+
+    def reachable(self) -> list[int]:
+        """Return the question indexes reachable from the start, in BFS order."""
+        start = self.compiled.transitions.index[self.compiled.start_id]
+        seen = {start}
+        order = [start]
+        queue = deque(order)
+        while queue:
+            for successor in self.successors[queue.popleft()]:
+                if successor != END and successor not in seen:
+                    seen.add(successor)
+                    order.append(successor)
+                    queue.append(successor)
+        return order
+
+    def path_bypassing_final(self) -> list[int] | None:
+        """Return a path from the start to the end that skips the final question."""
+        table = self.compiled.transitions
+        start = table.index[self.compiled.start_id]
+        final = table.index.get(self.final_id)
+        if start == final:
+            return None
+        parent: dict[int, int | None] = {start: None}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for successor in self.successors[node]:
+                if successor == END:
+                    path = [node]
+                    while parent[path[-1]] is not None:
+                        path.append(parent[path[-1]])
+                    return path[::-1]
+                if successor != final and successor not in parent:
+                    parent[successor] = node
+                    queue.append(successor)
+        return None
+
+    def flags(self, positions: list[int]) -> tuple[set[str], set[str]]:
+        """
+        Return the flags the interview declares and those raised on some
+        path through ``positions``.
+        """
+        compiled = self.compiled
+        table = compiled.transitions
+        reachable = set(positions)
+        declared: set[str] = set()
+        raised: set[str] = set()
+        for position, question in enumerate(compiled.question_list):
+            matcher = compiled.keyword_matchers[position]
+            own = set(question.flags or ())
+            if question.type == "text" and matcher:
+                own.update(matcher.labels)
+            if question.type == "date":
+                own.update(question.date_flags or ())
+            branch_end = (
+                table.offset[position + 1]
+                if position + 1 < len(table.offset)
+                else len(table.successor)
+            )
+            for branch in range(table.offset[position], branch_end):
+                declared.update(table.branch_flags[branch])
+            declared |= own
+            if position in reachable:
+                raised |= own
+                for branch in self._branches[position]:
+                    raised.update(table.branch_flags[branch])
+        return declared, raised
+
+    def verify(self) -> dict[str, Any]:
+        """
+        Check every property over the whole graph.
+
+        Returns:
+            Dict[str, Any]: ``proved``, plus the counterexamples found:
+            ``unreachable_questions``, ``dead_ends`` (questions no accepted answer leaves),
+            ``bypasses_final`` (a path to the end that skips the final
+            question, or None) and ``unreachable_flags``
+        """
+        ids = self.compiled.transitions.ids
+        reachable = self.reachable()
+        seen = set(reachable)
+        declared, raised = self.flags(reachable)
+        bypass = self.path_bypassing_final()
+
+        result = {
+            "unreachable_questions": [
+                qid for position, qid in enumerate(ids) if position not in seen
+            ],
+            "dead_ends": [
+                ids[position] for position in reachable if not self.successors[position]
+            ],
+            "bypasses_final": [ids[p] for p in bypass] if bypass else None,
+            "unreachable_flags": sorted(declared - raised),
+        }
+        result["proved"] = not any(result.values())
+        return result
+
+
+def verify_interview_graph(
+    yaml_path: str | Path,
+    cache: ProofCache | None = None,
+    final_id: str = FINAL_QUESTION_ID,
+) -> dict[str, Any]:
+    """
+    Verify an interview's question graph, reusing the result for unchanged YAML.
+
+    Args:
+        yaml_path (Union[str, Path]): Interview YAML file
+        cache (Optional[ProofCache]): Result cache (default: output/cache/proofs)
+        final_id (str): Question every complete path must pass through
+
+    Returns:
+        Dict[str, Any]: ``GraphVerifier.verify``'s result plus the
+        ``yaml_hash`` it was verified for
+    """
+    yaml_bytes = Path(yaml_path).read_bytes()
+    yaml_hash = yaml_content_hash(yaml_bytes)
+    cache = cache if cache is not None else ProofCache()
+    key = proof_key(
+        {
+            "proof": "graph",
+            "version": GRAPH_PROOF_VERSION,
+            "yaml": yaml_hash,
+            "final_id": final_id,
+        }
+    )
+
+    result = cache.get(key)
+    if result is None:
+        compiled = compile_interview(yaml_bytes)["interview"]
+        result = {"yaml_hash": yaml_hash, **GraphVerifier(compiled, final_id).verify()}
+        cache.put(key, result)
+    return result
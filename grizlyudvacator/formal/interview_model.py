@@ -1,3 +1,5 @@
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional
@@ -62,8 +64,58 @@ class DateFlag(BaseModel):
 
 # Z3 verification
 class InterviewVerifier:
-    def __init__(self):
-        self.solver = z3.Solver()
+    """
+    Z3 checks of date-based flag logic.
+
+    One solver and context are kept for the verifier's lifetime. The base
+    constraints on the timestamp variables are asserted once, and each case
+    is checked inside its own push/pop scope, so checks never see each
+    other's assertions and the cost of a check does not grow with the number
+    of checks before it.
+    """
+
+    SECONDS_PER_DAY = 24 * 60 * 60
+
+    def __init__(self, context: z3.Context | None = None):
+        self.context = context or z3.Context()
+        self.solver = z3.Solver(ctx=self.context)
+        self.current = z3.Int("current", self.context)
+        self.answer = z3.Int("answer", self.context)
+        self.solver.add(self.current >= 0, self.answer >= 0)
+        self._flags: dict[str, z3.BoolRef] = {}
+
+    def flag(self, name: str) -> z3.BoolRef:
+        """Return the (shared) Z3 variable for a flag."""
+        variable = self._flags.get(name)
+        if variable is None:
+            variable = self._flags[name] = z3.Bool(name, self.context)
+        return variable
+
+    @contextmanager
+    def scope(self) -> Iterator[z3.Solver]:
+        """Assertions added inside the block are dropped when it exits."""
+        self.solver.push()
+        try:
+            yield self.solver
+        finally:
+            self.solver.pop()
+
+    def _check_case(
+        self, date_flags: dict[str, int], current_ts: int, answer_ts: int
+    ) -> tuple[z3.CheckSatResult, z3.ModelRef | None, list[z3.BoolRef]]:
+        """Check one case in a fresh scope; returns result, model, constraints."""
+        with self.scope() as solver:
+            solver.add(self.current == current_ts, self.answer == answer_ts)
+            constraints = [
+                self.flag(threshold)
+                == (self.current > self.answer + days * self.SECONDS_PER_DAY)
+                for threshold, days in date_flags.items()
+            ]
+            solver.add(*constraints)
+            solver.add(z3.Or([self.flag(t) for t in date_flags], self.context))
+            result = solver.check()
+            model = solver.model() if result == z3.sat else None
+        return result, model, constraints
 
     def verify_date_flags(
         self, date_flags: dict[str, int], current_date: datetime, answer_date: datetime
@@ -71,51 +123,60 @@ class InterviewVerifier:
         """
         Verify that date-based flags are correctly triggered using Z3 theorem prover.
 
+        Each flag is constrained to hold exactly when more than its number of
+        days has passed since the answer date.
+
         Args:
             date_flags: Dictionary of date thresholds and days
             current_date: The current date/time
             answer_date: The date provided in the answer
 
         Returns:
-            bool: True if all date-based logic is correct
+            bool: True if the constraints are consistent and at least one flag
+            is triggered
         """
         print(f"\nVerifying date flags with Z3:")
         print(f"Current date: {current_date}")
         print(f"Answer date: {answer_date}")
         print(f"Date flags: {date_flags}")
 
-        # Convert dates to timestamps for comparison
-        current_ts = int(current_date.timestamp())
-        answer_ts = int(answer_date.timestamp())
-
-        # Create Z3 variables
-        current = z3.Int("current")
-        answer = z3.Int("answer")
-        self.solver.add(current == current_ts)
-        self.solver.add(answer == answer_ts)
-
-        # Add constraints for each date flag
-        constraints = []
-        for threshold, days in date_flags.items():
-            threshold_ts = answer_ts + (days * 24 * 60 * 60)  # Convert days to seconds
-            constraint = z3.Implies(current > threshold_ts, z3.Bool(threshold))
-            self.solver.add(constraint)
-            constraints.append(constraint)
+        result, model, constraints = self._check_case(
+            date_flags, int(current_date.timestamp()), int(answer_date.timestamp())
+        )
+        for constraint in constraints:
             print(f"Added constraint: {constraint}")
-
-        # Check if any flags are triggered
-        result = self.solver.check()
         print(f"Z3 solver result: {result}")
 
-        if result == z3.sat:
+        if model is not None:
             print("Solver found a valid solution")
-            m = self.solver.model()
-            print(f"Model: {m}")
+            print(f"Model: {model}")
         else:
             print("No valid solution found")
 
         return result == z3.sat
 
+    def verify_date_flags_batch(
+        self,
+        cases: Iterable[tuple[datetime, dict[str, int]]],
+        current_date: datetime,
+    ) -> list[bool]:
+        """
+        Verify many ``(answer_date, date_flags)`` cases in one solver session.
+
+        Args:
+            cases: Answer date and date flags of each case
+            current_date: The current date/time shared by every case
+
+        Returns:
+            list[bool]: ``verify_date_flags``'s result for each case, in order
+        """
+        current_ts = int(current_date.timestamp())
+        return [
+            self._check_case(date_flags, current_ts, int(answer_date.timestamp()))[0]
+            == z3.sat
+            for answer_date, date_flags in cases
+        ]
+
 
 # Hypothesis testing
 given(
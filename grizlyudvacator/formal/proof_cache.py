@@ -0,0 +1,150 @@
+"""
+Persistent cache of Z3 proof results.
+
+Proof results depend only on the constraints that were solved, so they are
+stored content-addressed: the key is the SHA-256 of a normalized,
+canonically serialized description of the constraints, and each result is
+one small JSON file named after its key. Reading an entry refreshes its
+modification time, and once the directory grows past its size cap the
+least recently used entries are evicted. The total size is counted once
+when the cache is opened and then kept up to date in memory, so the
+directory is only scanned again when an eviction is due.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from grizlyudvacator.utils.path_utils import get_cache_dir
+
+# Bump whenever the shape of stored results or the encoding of the
+# constraints changes so that old entries are never reused.
+PROOF_CACHE_VERSION = 1
+
+
+def proof_key(constraints: Any) -> str:
+    """
+    Return the content hash identifying a set of normalized constraints.
+
+    Args:
+        constraints (Any): JSON-serializable description of what is solved;
+            callers normalize it (e.g. sort flags) so equal problems hash equal
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    canonical = json.dumps(
+        [PROOF_CACHE_VERSION, constraints], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ProofCache:
+    """
+    On-disk LRU cache of proof results.
+
+    Attributes:
+        directory (Path): Where entries are stored
+        max_bytes (int): Total entry size kept after eviction
+        hits (int): Lookups answered from the cache
+        misses (int): Lookups that found nothing
+    """
+
+    def __init__(self, directory: Path | None = None, max_bytes: int = 64 << 20):
+        """
+        Open (and create if needed) a cache directory.
+
+        Args:
+            directory (Optional[Path]): Entry directory (default:
+                output/cache/proofs)
+            max_bytes (int): Size cap for all entries together
+        """
+        self.directory = Path(directory) if directory else get_cache_dir() / "proofs"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._total = sum(size for _, size, _ in self._entries())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.directory.glob("*.json"))
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored result for ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                result = json.load(f)
+            now = time.time_ns()
+            os.utime(path, ns=(now, now))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """
+        Store a result, then evict least recently used entries over the cap.
+
+        Write failures are ignored; they only cost a re-solve next time.
+        """
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result, f)
+            now = time.time_ns()
+            os.utime(tmp_path, ns=(now, now))
+            size = os.path.getsize(tmp_path)
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return
+        self._total += size - replaced
+        if self._total > self.max_bytes:
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+        self._total = 0
+
+    def _entries(self) -> list[tuple[int, int, Path]]:
+        """Return ``(mtime_ns, size, path)`` for every entry on disk."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """
+        Delete the oldest-used entries until the total fits ``max_bytes``.
+
+        Rescans the directory, which also corrects the in-memory total for
+        entries other processes have added or removed.
+        """
+        entries = self._entries()
+        self._total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if self._total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._total -= size
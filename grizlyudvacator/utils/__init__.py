@@ -8,6 +8,7 @@ from .file_utils import (
 )
 from .logging_utils import get_logger, log_exception, log_warning, setup_logger
 from .path_utils import (
+    get_cache_dir,
     get_fixture_dir,
     get_output_dir,
     get_project_root,
@@ -20,6 +21,7 @@ __all__ = [
     "get_output_dir",
     "get_template_dir",
     "get_fixture_dir",
+    "get_cache_dir",
     # Date utilities
     "format_date",
     "parse_date",
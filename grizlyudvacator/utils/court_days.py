@@ -0,0 +1,226 @@
+"""
+California court-day calendar.
+
+Court days are weekdays that are not judicial holidays (CCP §§ 12-12a, 135;
+Gov. Code § 6700). The calendar precomputes the sorted ordinals of every
+court day over a range of years, so adding or counting court days is a
+bisect into that array instead of a day-by-day loop. The same array backs
+vectorized ``datetime64[D]`` forms for whole caseloads.
+"""
+
+import calendar as _calendar
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from functools import lru_cache
+
+import numpy as np
+
+# Fixed-date judicial holidays, as (month, day, name, first_year). first_year
+# is the first year the courts closed for the holiday; None marks holidays
+# older than any year a calendar here covers.
+FIXED_HOLIDAYS = (
+    (1, 1, "New Year's Day", None),
+    (2, 12, "Lincoln's Birthday", None),
+    (3, 31, "Cesar Chavez Day", 2001),
+    (6, 19, "Juneteenth", 2023),
+    (7, 4, "Independence Day", None),
+    (11, 11, "Veterans Day", None),
+    (12, 25, "Christmas Day", None),
+)
+
+# Floating judicial holidays, as (month, weekday, nth, name, first_year);
+# nth=-1 is the last such weekday of the month.
+FLOATING_HOLIDAYS = (
+    (1, _calendar.MONDAY, 3, "Martin Luther King Jr. Day", None),
+    (2, _calendar.MONDAY, 3, "Washington's Birthday", None),
+    (5, _calendar.MONDAY, -1, "Memorial Day", None),
+    (9, _calendar.MONDAY, 1, "Labor Day", None),
+    (9, _calendar.FRIDAY, 4, "Native American Day", 2014),
+    (11, _calendar.THURSDAY, 4, "Thanksgiving Day", None),
+)
+
+DEFAULT_FIRST_YEAR = 2000
+DEFAULT_LAST_YEAR = 2060
+
+
+def _nth_weekday(year: int, month: int, weekday: int, nth: int) -> date:
+    """Return the ``nth`` ``weekday`` of a month (``nth=-1`` for the last)."""
+    if nth > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (nth - 1))
+    last = date(year, month, _calendar.monthrange(year, month)[1])
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def judicial_holidays(year: int) -> dict[date, str]:
+    """
+    Return the days the courts are closed for holidays in ``year``.
+
+    A fixed-date holiday falling on a Saturday is observed the preceding
+    Friday and one falling on a Sunday the following Monday. The Friday
+    after Thanksgiving is also a judicial holiday. Holidays are only
+    applied from their ``first_year`` on.
+
+    Args:
+        year (int): Calendar year
+
+    Returns:
+        Dict[date, str]: Observed holiday dates mapped to holiday names
+    """
+    holidays = {}
+    for month, day, name, first_year in FIXED_HOLIDAYS:
+        if first_year is not None and year < first_year:
+            continue
+        observed = date(year, month, day)
+        if observed.weekday() == _calendar.SATURDAY:
+            observed -= timedelta(days=1)
+        elif observed.weekday() == _calendar.SUNDAY:
+            observed += timedelta(days=1)
+        holidays[observed] = name
+    for month, weekday, nth, name, first_year in FLOATING_HOLIDAYS:
+        if first_year is not None and year < first_year:
+            continue
+        holidays[_nth_weekday(year, month, weekday, nth)] = name
+    thanksgiving = _nth_weekday(year, 11, _calendar.THURSDAY, 4)
+    holidays[thanksgiving + timedelta(days=1)] = "Day after Thanksgiving"
+    return holidays
+
+
+class CourtCalendar:
+    """
+    Precomputed court days over a range of years.
+
+    Attributes:
+        first (date): First day covered by the calendar
+        last (date): Last day covered by the calendar
+        days (List[int]): Sorted ordinals of every court day in range
+        array (np.ndarray): ``days`` as ``datetime64[D]`` for vectorized use
+    """
+
+    __slots__ = ("first", "last", "days", "array")
+
+    def __init__(
+        self, first_year: int = DEFAULT_FIRST_YEAR, last_year: int = DEFAULT_LAST_YEAR
+    ) -> None:
+        """
+        Build the calendar.
+
+        Args:
+            first_year (int): First year covered
+            last_year (int): Last year covered, inclusive
+        """
+        if last_year < first_year:
+            raise ValueError("last_year must not be before first_year")
+        self.first = date(first_year, 1, 1)
+        self.last = date(last_year, 12, 31)
+        closed = set()
+        for year in range(first_year, last_year + 1):
+            closed.update(d.toordinal() for d in judicial_holidays(year))
+        self.days = [
+            ordinal
+            for ordinal in range(self.first.toordinal(), self.last.toordinal() + 1)
+            if ordinal % 7 not in (0, 6) and ordinal not in closed
+        ]
+        # Ordinal 1 is 0001-01-01; numpy counts days from 1970-01-01.
+        epoch = date(1970, 1, 1).toordinal()
+        self.array = (np.array(self.days, dtype=np.int64) - epoch).astype(
+            "datetime64[D]"
+        )
+
+    def _check(self, day: date) -> int:
+        """Return ``day``'s ordinal, rejecting days outside the calendar."""
+        if not self.first <= day <= self.last:
+            raise ValueError(f"{day} is outside the court calendar")
+        return day.toordinal()
+
+    def _at(self, index: int) -> date:
+        """Return the court day at ``index``, rejecting overruns."""
+        if not 0 <= index < len(self.days):
+            raise ValueError("Result is outside the court calendar")
+        return date.fromordinal(self.days[index])
+
+    def is_court_day(self, day: date) -> bool:
+        """Check whether the courts are open on ``day``."""
+        ordinal = self._check(day)
+        index = bisect_left(self.days, ordinal)
+        return index < len(self.days) and self.days[index] == ordinal
+
+    def next_court_day(self, day: date) -> date:
+        """Return ``day`` if it is a court day, else the next court day."""
+        return self._at(bisect_left(self.days, self._check(day)))
+
+    def add_court_days(self, day: date, count: int) -> date:
+        """
+        Count ``count`` court days from ``day``, excluding ``day`` itself.
+
+        A negative ``count`` counts backwards, as when computing the last day
+        to give notice before a hearing.
+
+        Args:
+            day (date): Day to count from
+            count (int): Court days to add; may be negative
+
+        Returns:
+            date: The resulting court day (``day`` itself when ``count`` is 0)
+        """
+        ordinal = self._check(day)
+        if count > 0:
+            return self._at(bisect_right(self.days, ordinal) + count - 1)
+        if count < 0:
+            return self._at(bisect_left(self.days, ordinal) + count)
+        return day
+
+    def court_days_between(self, start: date, end: date) -> int:
+        """
+        Count the court days after ``start`` up to and including ``end``.
+
+        The result is negative when ``end`` is before ``start``.
+        """
+        return bisect_right(self.days, self._check(end)) - bisect_right(
+            self.days, self._check(start)
+        )
+
+    def add_court_days_array(
+        self, days: np.ndarray, count: int | np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized ``add_court_days`` over ``datetime64[D]`` dates.
+
+        NaT entries stay NaT.
+
+        Args:
+            days (np.ndarray): Dates to count from
+            count (Union[int, np.ndarray]): Court days to add per date
+
+        Returns:
+            np.ndarray: ``datetime64[D]`` results
+        """
+        days = np.asarray(days, dtype="datetime64[D]")
+        count = np.broadcast_to(np.asarray(count, dtype=np.int64), days.shape)
+        missing = np.isnat(days)
+        forward = np.searchsorted(self.array, days, side="right") + count - 1
+        backward = np.searchsorted(self.array, days, side="left") + count
+        index = np.where(count > 0, forward, backward)
+        if np.any(~missing & (count != 0) & ((index < 0) | (index >= len(self.days)))):
+            raise ValueError("Result is outside the court calendar")
+        result = self.array[np.clip(index, 0, len(self.days) - 1)]
+        result = np.where(count == 0, days, result)
+        result[missing] = np.datetime64("NaT")
+        return result
+
+    def next_court_day_array(self, days: np.ndarray) -> np.ndarray:
+        """Vectorized ``next_court_day``; NaT entries stay NaT."""
+        days = np.asarray(days, dtype="datetime64[D]")
+        index = np.searchsorted(self.array, days, side="left")
+        missing = np.isnat(days)
+        if np.any(~missing & (index >= len(self.days))):
+            raise ValueError("Result is outside the court calendar")
+        result = self.array[np.clip(index, 0, len(self.days) - 1)]
+        result[missing] = np.datetime64("NaT")
+        return result
+
+
+@lru_cache(maxsize=None)
+def get_court_calendar() -> CourtCalendar:
+    """Return the shared default court calendar."""
+    return CourtCalendar()
@@ -22,3 +22,17 @@ def get_template_dir() -> Path:
 def get_fixture_dir() -> Path:
     """Get the directory containing test fixtures."""
     return get_project_root() / "tests" / "fixtures"
+
+
+def get_cache_dir() -> Path:
+    """Get the directory for compiled artifacts and other caches."""
+    cache_dir = get_project_root() / "output" / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def get_session_dir() -> Path:
+    """Get the directory holding interactive interview session journals."""
+    session_dir = get_project_root() / "output" / "sessions"
+    session_dir.mkdir(parents=True, exist_ok=True)
+    return session_dir
@@ -0,0 +1,96 @@
+from bisect import bisect_left, insort
+from collections.abc import Iterator, Mapping
+
+
+class PriorityDict(Mapping[str, int]):
+    """
+    Mapping kept ordered by its integer values, ascending.
+
+    Unlike ``sorted_dict``, which re-sorts the whole dictionary on every
+    change, keys live in per-priority buckets indexed by a sorted list of the
+    distinct priorities. Inserting or re-prioritizing a key costs a bisect
+    over the distinct priorities, the smallest entry is available in O(1),
+    and iteration walks the buckets in place without copying.
+
+    Keys with equal priority iterate in the order they reached that
+    priority.
+
+    Examples:
+        >>> flags = PriorityDict({'a': 3, 'b': 1})
+        >>> flags['c'] = 2
+        >>> list(flags.items())
+        [('b', 1), ('c', 2), ('a', 3)]
+        >>> flags.peek()
+        ('b', 1)
+    """
+
+    __slots__ = ("_values", "_buckets", "_priorities")
+
+    def __init__(self, items: Mapping[str, int] | None = None) -> None:
+        self._values: dict[str, int] = {}
+        self._buckets: dict[int, dict[str, None]] = {}
+        self._priorities: list[int] = []
+        if items:
+            for key, priority in items.items():
+                self[key] = priority
+
+    def __getitem__(self, key: str) -> int:
+        return self._values[key]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def __iter__(self) -> Iterator[str]:
+        buckets = self._buckets
+        for priority in self._priorities:
+            yield from buckets[priority]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def __setitem__(self, key: str, priority: int) -> None:
+        """Insert ``key`` or move it to a new priority."""
+        if key in self._values:
+            old = self._values[key]
+            if old == priority:
+                return
+            self._discard(key, old)
+
+        bucket = self._buckets.get(priority)
+        if bucket is None:
+            bucket = self._buckets[priority] = {}
+            insort(self._priorities, priority)
+        bucket[key] = None
+        self._values[key] = priority
+
+    def __delitem__(self, key: str) -> None:
+        self._discard(key, self._values.pop(key))
+
+    def _discard(self, key: str, priority: int) -> None:
+        """Remove ``key`` from its bucket, dropping the bucket if emptied."""
+        bucket = self._buckets[priority]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[priority]
+            del self._priorities[bisect_left(self._priorities, priority)]
+
+    def peek(self) -> tuple[str, int]:
+        """
+        Return the key with the smallest priority without removing it.
+
+        Raises:
+            KeyError: If the mapping is empty
+        """
+        if not self._priorities:
+            raise KeyError("peek from an empty PriorityDict")
+        priority = self._priorities[0]
+        return next(iter(self._buckets[priority])), priority
+
+    def pop_top(self) -> tuple[str, int]:
+        """Remove and return the key with the smallest priority."""
+        key, priority = self.peek()
+        del self[key]
+        return key, priority
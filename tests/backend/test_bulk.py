@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from grizlyudvacator.backend.rules.bulk import encode_flags, evaluate_matrix
+from grizlyudvacator.backend.rules.rule_engine import RuleEngine, get_rule_engine
+from grizlyudvacator.backend.rules.statutes import StatuteRule
+
+FLAG_NAMES = [
+    "no_actual_notice",
+    "discovery_date",
+    "excusable_neglect",
+    "illness",
+    "jurisdiction_defect",
+    "wrong_address_service",
+    "service_may_be_valid",
+    "supporting_facts",
+]
+
+
+def test_matches_row_by_row_evaluation():
+    rng = np.random.default_rng(11)
+    flags = rng.random((400, len(FLAG_NAMES))) < 0.25
+    received = np.array(
+        [rng.choice([True, False, None]) for _ in range(400)], dtype=object
+    )
+
+    statutes, result = evaluate_matrix(
+        flags, FLAG_NAMES, {"received_notice": received}
+    )
+
+    engine = get_rule_engine()
+    for row in range(400):
+        facts = {"received_notice": received[row]} if received[row] is not None else {}
+        facts.update((n, True) for n, hit in zip(FLAG_NAMES, flags[row]) if hit)
+        expected = engine.evaluate(facts)["statutes"]
+        assert [s for s, hit in zip(statutes, result[row]) if hit] == expected
+
+
+def test_masks_span_multiple_words():
+    names = [f"f{i}" for i in range(130)]
+    engine = RuleEngine(
+        [
+            StatuteRule("A", all_flags=frozenset({"f1", "f129"})),
+            StatuteRule(
+                "B", any_flags=frozenset({"f70"}), forbidden_flags=frozenset({"f128"})
+            ),
+        ]
+    )
+    flags = encode_flags([["f1", "f129"], ["f1", "f70"], ["f70", "f128"]], names)
+
+    _, result = evaluate_matrix(flags, names, engine=engine)
+
+    assert result.tolist() == [[True, False], [False, True], [False, False]]
+
+
+def test_required_flag_without_a_column_never_matches():
+    engine = RuleEngine([StatuteRule("A", all_flags=frozenset({"x", "y"}))])
+    _, result = evaluate_matrix(np.ones((2, 1), dtype=bool), ["x"], engine=engine)
+    assert not result.any()
+
+
+def test_shape_errors():
+    with pytest.raises(ValueError):
+        evaluate_matrix(np.zeros((2, 3), dtype=bool), ["a", "b"])
+    with pytest.raises(ValueError):
+        evaluate_matrix(
+            np.zeros((2, 1), dtype=bool), ["a"], {"received_notice": np.array([True])}
+        )
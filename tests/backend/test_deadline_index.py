@@ -0,0 +1,99 @@
+from datetime import date
+
+from grizlyudvacator.backend.interview.deadline_index import (
+    DeadlineIndex,
+    answer_deadlines,
+)
+
+
+def sessions():
+    return [
+        ("a", {"judgment_date": "2025-01-15"}),  # 473(b): 2025-07-15
+        ("b", {"judgment_date": "2025-01-20"}),  # 473(b): 2025-07-21 (Sunday)
+        ("c", {"judgment_date": "2024-12-01"}),  # 473(b): 2025-06-02
+        ("d", {"received_notice": True}),  # no judgment date yet
+    ]
+
+
+def test_answer_deadlines_need_a_judgment_date():
+    assert answer_deadlines({"judgment_date": ""}) == {}
+    deadlines = answer_deadlines(
+        {"judgment_date": "2024-03-04", "notice_of_entry_date": "2024-05-01"}
+    )
+    assert deadlines == {
+        "ccp_473b": date(2024, 9, 4),
+        "ccp_473_5": date(2024, 10, 28),
+    }
+
+
+def test_learning_of_the_judgment_does_not_start_the_180_days():
+    """Only served written notice of entry shortens § 473.5 to 180 days."""
+    deadlines = answer_deadlines(
+        {"judgment_date": "2024-03-04", "became_aware_date": "2024-05-01"}
+    )
+    assert deadlines["ccp_473_5"] == date(2026, 3, 4)
+
+
+def test_range_query_is_inclusive_and_sorted():
+    index = DeadlineIndex.from_sessions(sessions())
+
+    assert len(index) == 3
+    assert "d" not in index
+    assert index.expiring("ccp_473b", date(2025, 6, 2), date(2025, 7, 15)) == [
+        (date(2025, 6, 2), "c"),
+        (date(2025, 7, 15), "a"),
+    ]
+    assert index.expiring("ccp_473d", date(2025, 1, 1), date(2026, 1, 1)) == []
+
+
+def test_next_expiring_skips_past_deadlines():
+    index = DeadlineIndex.from_sessions(sessions())
+
+    assert index.next_expiring("ccp_473b", 2, after=date(2025, 6, 3)) == [
+        (date(2025, 7, 15), "a"),
+        (date(2025, 7, 21), "b"),
+    ]
+    assert index.next_expiring("ccp_473b", 5, after=date(2025, 8, 1)) == []
+
+
+def test_updates_and_removals_are_incremental():
+    index = DeadlineIndex.from_sessions(sessions())
+
+    index.update_answers("a", {"judgment_date": "2025-03-03"})
+    index.update_answers("d", {"judgment_date": "2025-01-02"})
+    index.remove("c")
+    index.remove("missing")
+
+    upcoming = index.next_expiring("ccp_473b", 10, after=date(2025, 1, 1))
+    assert [case for _, case in upcoming] == ["d", "b", "a"]
+    assert index.deadlines("c") == {}
+    assert index.deadlines("a")["ccp_473b"] == date(2025, 9, 3)
+
+
+def test_dates_outside_the_court_calendar_leave_deadlines_unknown():
+    assert answer_deadlines({"judgment_date": "2075-01-15"}) == {}
+    # The notice date only affects § 473.5, so § 473(b) is still known
+    deadlines = answer_deadlines(
+        {"judgment_date": "2025-01-15", "notice_of_entry_date": "1990-01-01"}
+    )
+    assert deadlines == {"ccp_473b": date(2025, 7, 15)}
+
+    index = DeadlineIndex()
+    index.update_answers("late", {"judgment_date": "2075-01-15"})
+    assert "late" not in index
+
+
+def test_replaced_entries_are_not_returned_twice():
+    index = DeadlineIndex.from_sessions(sessions())
+    for _ in range(100):
+        index.update_answers("a", {"judgment_date": "2025-01-15"})
+    index.remove("b")
+    index.update_answers("b", {"judgment_date": "2025-01-20"})
+
+    assert index.expiring("ccp_473b", date(2025, 1, 1), date(2025, 12, 31)) == [
+        (date(2025, 6, 2), "c"),
+        (date(2025, 7, 15), "a"),
+        (date(2025, 7, 21), "b"),
+    ]
+    # Stale entries are compacted away even without queries in between
+    assert len(index._entries["ccp_473b"]) <= 2 * len(index)
@@ -0,0 +1,60 @@
+from datetime import date
+
+import numpy as np
+
+from grizlyudvacator.backend.rules.deadlines import (
+    add_months,
+    ccp_473_5_deadline,
+    ccp_473b_deadline,
+    earliest_hearing_date,
+    last_service_date,
+    motion_deadlines,
+    motion_deadlines_array,
+)
+
+
+def test_add_months_clamps_to_month_end():
+    assert add_months(date(2025, 8, 31), 6) == date(2026, 2, 28)
+    assert add_months(date(2024, 1, 15), 24) == date(2026, 1, 15)
+
+
+def test_ccp_473b_deadline_rolls_to_next_court_day():
+    # 2025-01-04 + 6 months is Friday 2025-07-04, a holiday
+    assert ccp_473b_deadline(date(2025, 1, 4)) == date(2025, 7, 7)
+    assert ccp_473b_deadline(date(2025, 1, 15)) == date(2025, 7, 15)
+
+
+def test_ccp_473_5_takes_the_earlier_limit():
+    judgment = date(2024, 3, 4)
+    assert ccp_473_5_deadline(judgment) == date(2026, 3, 4)
+    assert ccp_473_5_deadline(judgment, date(2024, 5, 1)) == date(2024, 10, 28)
+    assert ccp_473_5_deadline(judgment, date(2024, 6, 4)) == date(2024, 12, 2)
+
+
+def test_ccp_1005_notice_period():
+    hearing = date(2025, 12, 22)
+    served = last_service_date(hearing)
+    assert served == date(2025, 11, 26)
+    assert earliest_hearing_date(served) == hearing
+    assert last_service_date(hearing, by_mail=True) == date(2025, 11, 21)
+
+
+def test_caseload_form_matches_scalar():
+    judgments = [date(2025, 1, 4), date(2024, 3, 4), date(2025, 8, 31)]
+    notices = [None, date(2024, 6, 4), None]
+    services = [date(2025, 11, 26), date(2025, 3, 3), None]
+
+    columns = motion_deadlines_array(
+        np.array(judgments, dtype="datetime64[D]"),
+        np.array(notices, dtype="datetime64[D]"),
+        np.array(services, dtype="datetime64[D]"),
+        by_mail=np.array([False, True, False]),
+    )
+
+    for row, judgment in enumerate(judgments):
+        expected = motion_deadlines(
+            judgment, notices[row], services[row], by_mail=row == 1
+        )
+        for key, value in expected.items():
+            cell = columns[key][row]
+            assert (None if np.isnat(cell) else cell.astype(object)) == value
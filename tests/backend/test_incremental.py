@@ -0,0 +1,74 @@
+import random
+
+from grizlyudvacator.backend.rules.incremental import IncrementalMatcher
+from grizlyudvacator.backend.rules.rule_engine import RuleEngine, get_rule_engine
+from grizlyudvacator.backend.rules.statutes import StatuteRule
+
+FLAGS = [
+    "no_actual_notice",
+    "jurisdiction_defect",
+    "excusable_neglect",
+    "service_may_be_valid",
+    "supporting_facts",
+]
+
+
+def test_matches_full_evaluation_after_every_change():
+    """Random assert/retract sequences agree with a from-scratch evaluation."""
+    engine = get_rule_engine()
+    rng = random.Random(7)
+    matcher = IncrementalMatcher(engine)
+    flags, answers = set(), {}
+
+    for _ in range(300):
+        if rng.random() < 0.6:
+            flag = rng.choice(FLAGS)
+            if flag in flags:
+                flags.discard(flag)
+                matcher.remove_flag(flag)
+            else:
+                flags.add(flag)
+                matcher.add_flag(flag)
+        else:
+            value = rng.choice([True, False, None])
+            if value is None:
+                answers.pop("received_notice", None)
+                matcher.clear_answer("received_notice")
+            else:
+                answers["received_notice"] = value
+                matcher.set_answer("received_notice", value)
+
+        facts = dict(answers)
+        facts.update(dict.fromkeys(flags, True))
+        assert matcher.result() == engine.evaluate(facts)
+
+
+def test_forbidden_flags_and_dependencies_propagate():
+    engine = RuleEngine(
+        [
+            StatuteRule(
+                "A", any_flags=frozenset({"x"}), forbidden_flags=frozenset({"z"})
+            ),
+            StatuteRule("B", any_statutes=frozenset({"A"})),
+        ]
+    )
+    matcher = IncrementalMatcher(engine)
+
+    matcher.add_flag("x")
+    assert matcher.eligible == ["A", "B"]
+    matcher.add_flag("z")
+    assert matcher.eligible == []
+    matcher.remove_flag("z")
+    assert matcher.eligible == ["A", "B"]
+
+
+def test_flag_and_truthy_answer_with_the_same_name_are_counted_separately():
+    engine = RuleEngine([StatuteRule("A", any_flags=frozenset({"judgment_date"}))])
+    matcher = IncrementalMatcher(engine)
+
+    matcher.add_flag("judgment_date")
+    matcher.set_answer("judgment_date", "2025-01-02")
+    matcher.remove_flag("judgment_date")
+    assert matcher.eligible == ["A"]
+    matcher.clear_answer("judgment_date")
+    assert matcher.eligible == []
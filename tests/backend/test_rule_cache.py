@@ -0,0 +1,65 @@
+from grizlyudvacator.backend.rules import rule_engine, statutes
+from grizlyudvacator.backend.rules.rule_engine import RuleCache, RuleEngine
+from grizlyudvacator.backend.rules.statutes import STATUTE_RULES, StatuteRule
+
+PROFILE = ["no_actual_notice", "jurisdiction_defect", "supporting_facts"]
+
+
+def test_same_profile_is_a_hit():
+    cache = RuleCache(RuleEngine(STATUTE_RULES))
+
+    first = cache.evaluate(PROFILE)
+    second = cache.evaluate(list(reversed(PROFILE)))
+
+    assert first == second == RuleEngine(STATUTE_RULES).evaluate(PROFILE)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_flags_and_answers_no_rule_reads_share_an_entry():
+    cache = RuleCache(RuleEngine(STATUTE_RULES))
+
+    cache.evaluate({"no_actual_notice": True, "declare_facts": "wrong unit"})
+    cache.evaluate({"no_actual_notice": True, "declare_facts": "neighbor", "x": 1})
+    assert cache.hits == 1
+
+    # received_notice feeds a CCP 473.5 predicate, so it is part of the key
+    result = cache.evaluate({"no_actual_notice": True, "received_notice": True})
+    assert cache.misses == 2
+    assert "CCP § 473.5" not in result["statutes"]
+
+
+def test_returned_results_cannot_corrupt_the_cache():
+    cache = RuleCache(RuleEngine(STATUTE_RULES))
+    cache.evaluate(PROFILE)["statutes"].clear()
+    assert cache.evaluate(PROFILE)["statutes"]
+
+
+def test_lru_is_bounded():
+    cache = RuleCache(RuleEngine(STATUTE_RULES), maxsize=2)
+    cache.evaluate(["no_actual_notice"])
+    cache.evaluate(["jurisdiction_defect"])
+    cache.evaluate(["no_actual_notice"])
+    cache.evaluate(["excusable_neglect"])  # evicts jurisdiction_defect
+
+    assert len(cache) == 2
+    cache.evaluate(["no_actual_notice"])
+    assert cache.hits == 2
+    cache.evaluate(["jurisdiction_defect"])
+    assert cache.misses == 4
+
+
+def test_changing_rule_definitions_invalidates(monkeypatch):
+    cache = RuleCache()
+    assert cache.evaluate(["jurisdiction_defect"])["statutes"][0] == "CCP § 473(d)"
+    cache.evaluate(["jurisdiction_defect"])
+    assert cache.hits == 1
+
+    changed = STATUTE_RULES + (
+        StatuteRule("Test rule", any_flags=frozenset({"jurisdiction_defect"})),
+    )
+    monkeypatch.setattr(statutes, "STATUTE_RULES", changed)
+
+    result = cache.evaluate(["jurisdiction_defect"])
+    assert "Test rule" in result["statutes"]
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert rule_engine.get_rule_engine().rules == changed
@@ -0,0 +1,88 @@
+import pytest
+
+from grizlyudvacator.backend.rules.rule_engine import (
+    RuleEngine,
+    evaluate_statutes,
+    get_rule_engine,
+)
+from grizlyudvacator.backend.rules.statutes import STATUTE_RULES, StatuteRule
+
+
+def test_every_applicable_statute_is_returned():
+    result = evaluate_statutes(
+        ["no_actual_notice", "jurisdiction_defect", "supporting_facts"]
+    )
+
+    assert result["statutes"] == ["CCP § 473.5", "CCP § 473(d)", "CCP § 918"]
+    assert result["justification"]["CCP § 473(d)"] == ["jurisdiction_defect"]
+    assert result["justification"]["CCP § 918"] == ["CCP § 473.5", "CCP § 473(d)"]
+
+
+def test_no_active_flags_means_no_statutes():
+    assert evaluate_statutes([]) == {"statutes": [], "justification": {}}
+    assert evaluate_statutes({"service_may_be_valid": True}) == {
+        "statutes": [],
+        "justification": {},
+    }
+
+
+def test_answer_predicates_use_the_facts_mapping():
+    facts = {"received_notice": True, "no_actual_notice": True}
+    assert "CCP § 473.5" not in evaluate_statutes(facts)["statutes"]
+
+    facts["received_notice"] = False
+    assert "CCP § 473.5" in evaluate_statutes(facts)["statutes"]
+
+
+def test_legacy_473b_conditions_still_apply():
+    result = evaluate_statutes({"service_defective": True, "received_notice": True})
+    assert result["statutes"] == ["CCP § 473(b)", "CCP § 918"]
+
+
+def test_forbidden_and_required_flags():
+    engine = RuleEngine(
+        [
+            StatuteRule(
+                "A",
+                all_flags=frozenset({"x", "y"}),
+                forbidden_flags=frozenset({"z"}),
+            )
+        ]
+    )
+    assert engine.evaluate(["x", "y"])["statutes"] == ["A"]
+    assert engine.evaluate(["x"])["statutes"] == []
+    assert engine.evaluate(["x", "y", "z"])["statutes"] == []
+
+
+def test_only_rules_indexed_by_active_flags_are_checked(monkeypatch):
+    rules = [StatuteRule(f"R{i}", any_flags=frozenset({f"f{i}"})) for i in range(500)]
+    engine = RuleEngine(rules)
+    checked = []
+    original = RuleEngine.matches
+
+    def spy(self, rule, *args):
+        checked.append(rule.statute)
+        return original(self, rule, *args)
+
+    monkeypatch.setattr(RuleEngine, "matches", spy)
+
+    assert engine.evaluate(["f3", "f400"])["statutes"] == ["R3", "R400"]
+    assert checked == ["R3", "R400"]
+
+
+def test_invalid_tables_are_rejected():
+    with pytest.raises(ValueError):
+        RuleEngine([StatuteRule("A")])
+    with pytest.raises(ValueError):
+        RuleEngine([StatuteRule("A", any_statutes=frozenset({"B"}))])
+    with pytest.raises(ValueError):
+        RuleEngine(
+            [StatuteRule("A", any_flags=frozenset({"x"}), answers=(("q", "?", 1),))]
+        )
+
+
+def test_version_tracks_rule_definitions():
+    engine = get_rule_engine()
+    assert engine.version == RuleEngine(STATUTE_RULES).version
+    changed = STATUTE_RULES[:-1]
+    assert RuleEngine(changed).version != engine.version
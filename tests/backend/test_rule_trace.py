@@ -0,0 +1,59 @@
+import itertools
+
+from grizlyudvacator.backend.rules.rule_engine import RuleEngine, evaluate_statutes
+from grizlyudvacator.backend.rules.statutes import (
+    CCP_473_5,
+    CCP_473D,
+    CCP_918,
+    STATUTE_RULES,
+)
+
+FLAGS = [
+    "excusable_neglect",
+    "no_actual_notice",
+    "jurisdiction_defect",
+    "judgment_void_on_face",
+]
+
+
+def _conditions(result, statute):
+    entry = next(e for e in result["explanation"] if e["statute"] == statute)
+    return entry, {c["condition"]: c for c in entry["conditions"]}
+
+
+def test_explain_matches_evaluate():
+    engine = RuleEngine(STATUTE_RULES)
+    for size in range(len(FLAGS) + 1):
+        for flags in itertools.combinations(FLAGS, size):
+            for received in (None, True, False):
+                facts = dict.fromkeys(flags, True)
+                facts["received_notice"] = received
+                explained = engine.explain(facts)
+                assert explained.pop("explanation")
+                assert explained == engine.evaluate(facts)
+
+
+def test_failing_answer_predicate_is_recorded_with_its_input():
+    result = evaluate_statutes(
+        {"no_actual_notice": True, "received_notice": True}, explain=True
+    )
+
+    entry, conditions = _conditions(result, CCP_473_5)
+    assert not entry["applies"]
+    assert conditions["any_flags"]["value"] is True
+    answer = conditions["answer"]
+    assert answer["predicate"] == "ne" and answer["value"] is False
+    assert answer["inputs"] == {"received_notice": True}
+
+
+def test_dependent_statute_records_prerequisites():
+    result = evaluate_statutes(["jurisdiction_defect"], explain=True)
+
+    entry, conditions = _conditions(result, CCP_918)
+    assert entry["applies"]
+    assert conditions["any_statutes"]["inputs"][CCP_473D] is True
+    assert result["justification"][CCP_918] == [CCP_473D]
+
+
+def test_untraced_results_have_no_explanation():
+    assert "explanation" not in evaluate_statutes(["no_actual_notice"])
@@ -0,0 +1,68 @@
+import pytest
+
+from grizlyudvacator.cli.interview import artifact_cache
+from grizlyudvacator.cli.interview.artifact_cache import (
+    artifact_path,
+    load_interview,
+)
+from grizlyudvacator.cli.interview.interview_engine import CompiledInterview
+
+
+def test_first_load_writes_artifact(tmp_path, yaml_path):
+    """A cache miss compiles the YAML and stores the artifact by content hash."""
+    engine = load_interview(str(yaml_path), cache_dir=tmp_path)
+
+    assert artifact_path(yaml_path.read_bytes(), tmp_path).exists()
+    assert engine.current_id == "received_notice"
+    assert engine.answers == {}
+    assert engine.flags == []
+
+
+def test_cached_load_skips_parsing_and_validation(tmp_path, monkeypatch, yaml_path):
+    """A cache hit must not touch the YAML parser or the graph validators."""
+    load_interview(str(yaml_path), cache_dir=tmp_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("should not be called on a cache hit")
+
+    monkeypatch.setattr(artifact_cache.yaml, "safe_load", fail)
+    monkeypatch.setattr(CompiledInterview, "_validate_flow_control", fail)
+    monkeypatch.setattr(CompiledInterview, "_validate_question_references", fail)
+
+    engine = load_interview(str(yaml_path), cache_dir=tmp_path)
+    assert set(engine.questions) == {
+        q["id"] for q in engine.yaml_data["questions"]
+    }
+
+
+def test_changed_yaml_gets_new_artifact(tmp_path, yaml_path):
+    """Editing the YAML changes its hash, so the old artifact is never reused."""
+    yaml_file = tmp_path / "interview.yaml"
+    yaml_file.write_text(yaml_path.read_text())
+    load_interview(str(yaml_file), cache_dir=tmp_path)
+
+    yaml_file.write_text(yaml_path.read_text() + "\n# edited\n")
+    load_interview(str(yaml_file), cache_dir=tmp_path)
+
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+
+
+def test_corrupt_artifact_is_recompiled(tmp_path, yaml_path):
+    """A truncated artifact is treated as a miss and rewritten."""
+    path = artifact_path(yaml_path.read_bytes(), tmp_path)
+    path.write_bytes(b"not a pickle")
+
+    engine = load_interview(str(yaml_path), cache_dir=tmp_path)
+
+    assert engine.current_id == "received_notice"
+    assert path.read_bytes() != b"not a pickle"
+
+
+def test_invalid_yaml_is_not_cached(tmp_path):
+    """Validation errors surface and leave no artifact behind."""
+    yaml_file = tmp_path / "broken.yaml"
+    yaml_file.write_text("metadata: {}\n")
+
+    with pytest.raises(ValueError):
+        load_interview(str(yaml_file), cache_dir=tmp_path)
+    assert not list(tmp_path.glob("*.pickle"))
@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+
+from grizlyudvacator.backend.rules.bulk import encode_flags, evaluate_matrix
+from grizlyudvacator.backend.rules.rule_engine import RuleEngine
+from grizlyudvacator.backend.rules.statutes import StatuteRule
+from grizlyudvacator.cli.interview.batch import (
+    evaluate_case,
+    evaluate_cases,
+    statute_facts,
+)
+from grizlyudvacator.cli.interview.interview_engine import CompiledInterview
+
+COMPLETE = {
+    "received_notice": False,
+    "became_aware_date": "2025-01-02",
+    "judgment_date": "2024-12-01",
+    "service_type": "Publication",
+    "address_at_time": False,
+    "declare_facts": "They served the wrong unit",
+    "explain_why_no_response": "not on this path",
+}
+
+
+def test_complete_case_matches_interactive_session(compiled):
+    session = compiled.new_session()
+    for question_id in [
+        "received_notice",
+        "became_aware_date",
+        "judgment_date",
+        "service_type",
+        "address_at_time",
+        "declare_facts",
+        "review_summary",
+    ]:
+        session.process_answer(question_id, COMPLETE.get(question_id))
+
+    case = evaluate_case(compiled, COMPLETE)
+
+    assert case["complete"]
+    assert case["error"] is None
+    assert case["path"][0] == "received_notice"
+    assert case["path"][-1] == "review_summary"
+    assert "explain_why_no_response" not in case["answers"]
+    assert case["flags"] == session.flags
+    assert set(case["result"]) == {"statutes", "justification"}
+
+
+def test_walk_stops_at_first_missing_answer(compiled):
+    case = evaluate_case(compiled, {"received_notice": True})
+
+    assert not case["complete"]
+    assert case["stopped_at"] == "explain_why_no_response"
+    assert case["path"] == ["received_notice"]
+    assert case["error"] is None
+
+
+def test_invalid_answer_is_reported_not_raised(compiled):
+    answers = dict(COMPLETE, service_type="Carrier pigeon")
+    case = evaluate_case(compiled, answers)
+
+    assert case["stopped_at"] == "service_type"
+    assert "Invalid choice" in case["error"]
+    assert "service_type" not in case["answers"]
+
+
+def test_cases_share_one_compiled_interview(compiled):
+    cases = [COMPLETE, {"received_notice": True}] * 500
+
+    results = list(evaluate_cases(compiled, cases))
+
+    assert len(results) == 1000
+    assert [r["complete"] for r in results[:2]] == [True, False]
+    assert results[0]["flags"] == results[998]["flags"]
+
+
+def test_flags_do_not_overwrite_answers_of_the_same_name(compiled):
+    # vacate_default.yaml's judgment_date question raises a judgment_date flag
+    case = evaluate_case(compiled, COMPLETE)
+    assert "judgment_date" in case["flags"]
+
+    facts = statute_facts(case["answers"], case["flags"])
+    assert facts["judgment_date"] == case["answers"]["judgment_date"]
+    assert facts["discovery_date"] is True
+
+
+def test_case_and_caseload_paths_agree(compiled):
+    """One case gives the same statutes headless and through the bulk matrix."""
+    case = evaluate_case(compiled, COMPLETE)
+    names = list(case["flags"])
+    answers = {
+        qid: np.array([answer], dtype=object)
+        for qid, answer in case["answers"].items()
+    }
+
+    statutes, result = evaluate_matrix(
+        encode_flags([case["flags"]], names), names, answers
+    )
+
+    expected = case["result"]["statutes"]
+    assert expected
+    assert [s for s, hit in zip(statutes, result[0]) if hit] == expected
+
+
+def test_answers_win_over_same_named_flags_in_both_paths():
+    engine = RuleEngine(
+        [
+            StatuteRule("A", any_flags=frozenset({"x"})),
+            StatuteRule("B", any_flags=frozenset({"x"}), answers=(("x", "eq", True),)),
+        ]
+    )
+    # The flag x is raised in every case; the answer to x varies
+    cases = [False, None, "yes"]
+
+    _, result = evaluate_matrix(
+        np.ones((len(cases), 1), dtype=bool),
+        ["x"],
+        {"x": np.array(cases, dtype=object)},
+        engine=engine,
+    )
+
+    for row, answer in enumerate(cases):
+        answers = {} if answer is None else {"x": answer}
+        expected = engine.evaluate(statute_facts(answers, ["x"]))["statutes"]
+        assert [s for s, hit in zip("AB", result[row]) if hit] == expected
+    assert result.tolist() == [[False, False], [True, True], [True, False]]
+
+
+def test_walk_that_never_finishes_is_stopped():
+    data = {
+        "questions": [
+            {"id": "q1", "type": "text", "prompt": "One?", "next": "q2"},
+            {"id": "q2", "type": "text", "prompt": "Two?", "next": "q1"},
+        ]
+    }
+    # Skip the compile-time cycle check to exercise the runtime bound
+    compiled = CompiledInterview(data, CompiledInterview._parse_questions(data))
+
+    with pytest.raises(ValueError, match="within 2 steps"):
+        evaluate_case(compiled, {"q1": "a", "q2": "b"})
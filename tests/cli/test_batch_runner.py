@@ -0,0 +1,205 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from grizlyudvacator.backend.generator import doc_filler
+from grizlyudvacator.cli.batch_runner import (
+    coerce_answer,
+    errors_path,
+    iter_records,
+    run_batch,
+)
+from grizlyudvacator.cli.main import build_parser
+
+CASE = {
+    "received_notice": False,
+    "became_aware_date": "2025-01-02",
+    "judgment_date": "2024-12-01",
+    "service_type": "Publication",
+    "address_at_time": False,
+    "declare_facts": "They knocked on the wrong door",
+}
+
+
+def write_jsonl(path, count):
+    with open(path, "w") as f:
+        for i in range(count):
+            answers = dict(CASE, received_notice=bool(i % 2))
+            if i % 2:
+                answers["explain_why_no_response"] = "illness"
+            f.write(json.dumps({"case_id": f"c{i}", "answers": answers}) + "\n")
+
+
+def read_results(path):
+    return [json.loads(line) for line in Path(path).read_text().splitlines()]
+
+
+def test_jsonl_results_are_ordered(tmp_path, yaml_path):
+    source, results = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_jsonl(source, 25)
+
+    total = run_batch(source, results, str(yaml_path), workers=0, chunk_size=4)
+
+    rows = read_results(results)
+    assert total == 25
+    assert [r["case_id"] for r in rows] == [f"c{i}" for i in range(25)]
+    assert rows[0]["complete"] and "CCP § 473.5" in rows[0]["result"]["statutes"]
+    assert "CCP § 473(b)" in rows[1]["result"]["statutes"]
+
+
+def test_process_pool_keeps_input_order(tmp_path, yaml_path):
+    source, results = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_jsonl(source, 200)
+
+    run_batch(source, results, str(yaml_path), workers=2, chunk_size=7, max_pending=3)
+
+    assert [r["case_id"] for r in read_results(results)] == [
+        f"c{i}" for i in range(200)
+    ]
+
+
+def test_csv_cells_are_typed_and_may_span_lines(tmp_path, yaml_path):
+    source, results = tmp_path / "in.csv", tmp_path / "out.jsonl"
+    source.write_text(
+        "case_id,received_notice,became_aware_date,judgment_date,service_type,"
+        "address_at_time,declare_facts\n"
+        'a,no,2025-01-02,2024-12-01,Publication,n,"first line\nwrong unit"\n'
+        "b,yes,,,,,\n"
+    )
+
+    run_batch(source, results, str(yaml_path), workers=0)
+
+    first, second = read_results(results)
+    assert first["case_id"] == "a"
+    assert first["complete"]
+    assert first["answers"]["declare_facts"] == "first line\nwrong unit"
+    assert "miscommunication" in first["flags"]
+    assert second["stopped_at"] == "explain_why_no_response"
+
+
+def test_resume_after_interruption_skips_finished_chunks(tmp_path, yaml_path):
+    source, results = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_jsonl(source, 20)
+
+    def crash(records, elapsed):
+        if records >= 10:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_batch(
+            source, results, str(yaml_path), workers=0, chunk_size=5, progress=crash
+        )
+    assert len(read_results(results)) == 10
+
+    # Simulate a torn write after the last checkpoint
+    with open(results, "a") as f:
+        f.write('{"case_id": "partial')
+
+    seen = []
+    total = run_batch(
+        source,
+        results,
+        str(yaml_path),
+        workers=0,
+        chunk_size=5,
+        progress=lambda records, elapsed: seen.append(records),
+    )
+
+    assert total == 20
+    assert seen == [5, 10]
+    assert [r["case_id"] for r in read_results(results)] == [
+        f"c{i}" for i in range(20)
+    ]
+
+
+def test_unreadable_records_are_reported_and_skipped(tmp_path, yaml_path):
+    source, results = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_jsonl(source, 4)
+    lines = source.read_bytes().splitlines(keepends=True)
+    bad = [b'{"case_id": "torn\n', b"[1, 2]\n", b"\xff\xfe\n"]
+    source.write_bytes(lines[0] + bad[0] + lines[1] + bad[1] + lines[2] + bad[2])
+    offsets = [
+        len(lines[0]),
+        len(lines[0] + bad[0] + lines[1]),
+        len(lines[0] + bad[0] + lines[1] + bad[1] + lines[2]),
+    ]
+
+    total = run_batch(source, results, str(yaml_path), workers=0, chunk_size=2)
+
+    assert total == 3
+    assert [r["case_id"] for r in read_results(results)] == ["c0", "c1", "c2"]
+    errors = read_results(errors_path(results))
+    assert [e["offset"] for e in errors] == offsets
+    assert "expected a JSON object" in errors[1]["error"]
+
+    with pytest.raises(ValueError, match=f"byte {offsets[0]}"):
+        list(iter_records(source))
+
+
+def test_checkpoint_for_a_changed_input_is_rejected(tmp_path, yaml_path):
+    source, results = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_jsonl(source, 10)
+
+    def crash(records, elapsed):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_batch(
+            source, results, str(yaml_path), workers=0, chunk_size=5, progress=crash
+        )
+    write_jsonl(source, 12)
+
+    with pytest.raises(ValueError, match="changed since"):
+        run_batch(source, results, str(yaml_path), workers=0, chunk_size=5)
+    assert run_batch(source, results, str(yaml_path), workers=0, resume=False) == 12
+
+
+def test_each_motion_gets_its_own_path(tmp_path, monkeypatch, capsys, yaml_path):
+    source, results = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_jsonl(source, 3)
+    with open(source, "a") as f:
+        f.write(json.dumps({"case_id": "c0", "answers": CASE}) + "\n")
+    rendered = []
+    monkeypatch.setattr(
+        doc_filler, "render_motion", lambda answers, result, path: rendered.append(path)
+    )
+
+    run_batch(
+        source,
+        results,
+        str(yaml_path),
+        workers=0,
+        generate_documents=True,
+        documents_dir=tmp_path / "motions",
+    )
+
+    rows = read_results(results)
+    assert len(set(rendered)) == len(rendered) == 4
+    assert all(path.parent == tmp_path / "motions" for path in rendered)
+    assert [row["motion"] for row in rows] == [str(path) for path in rendered]
+    assert capsys.readouterr().out == ""
+
+
+def test_iter_records_resumes_from_offset(tmp_path):
+    source = tmp_path / "in.jsonl"
+    write_jsonl(source, 3)
+    offsets = [end for end, _ in iter_records(source)]
+
+    resumed = list(iter_records(source, offsets[0]))
+
+    assert [r["case_id"] for _, r in resumed] == ["c1", "c2"]
+
+
+def test_coerce_answer():
+    assert coerce_answer("boolean", " Yes ") is True
+    assert coerce_answer("boolean", "maybe") == "maybe"
+    assert coerce_answer("number", "3.5") == 3.5
+    assert coerce_answer("multiple_choice", "a; b") == ["a", "b"]
+
+
+def test_batch_subcommand_arguments():
+    options = build_parser().parse_args(["batch", "in.csv", "-j", "0", "--restart"])
+    assert options.command == "batch"
+    assert options.workers == 0 and options.restart
+    assert build_parser().parse_args([]).command is None
@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from grizlyudvacator.cli.interview.date_flags import (
+    date_flag_matrix,
+    question_date_flags,
+    to_datetime64,
+)
+from grizlyudvacator.cli.interview.interview_engine import CompiledInterview
+
+YAML_DATA = {
+    "questions": [
+        {
+            "id": "judgment_date",
+            "type": "date",
+            "prompt": "When was the judgment entered?",
+            "date_flags": {"time_barred": 180, "urgent_lockout": 5},
+        }
+    ]
+}
+
+
+def test_unusable_answers_become_nat():
+    dates = to_datetime64(["2025-01-02", None, "not a date", "2025-1-2"])
+    assert dates.dtype == np.dtype("datetime64[D]")
+    assert dates[0] == np.datetime64("2025-01-02")
+    assert np.isnat(dates[1:]).all()
+
+
+def test_matrix_thresholds_are_inclusive():
+    today = date(2025, 7, 1)
+    dates = to_datetime64(
+        [str(today - timedelta(days=n)) for n in (0, 4, 5, 179, 180)] + [None]
+    )
+
+    matrix = date_flag_matrix(dates, [180, 5], today)
+
+    assert matrix.shape == (6, 2)
+    assert matrix.tolist() == [
+        [False, False],
+        [False, False],
+        [False, True],
+        [False, True],
+        [True, True],
+        [False, False],
+    ]
+
+
+@pytest.mark.parametrize("days_ago", [0, 5, 30, 180, 400])
+def test_matches_session_date_flags(days_ago):
+    """The vectorized path agrees with Rule 2.3 in the interactive session."""
+    compiled = CompiledInterview(YAML_DATA)
+    answer = str(date.today() - timedelta(days=days_ago))
+    session = compiled.new_session()
+    session.process_answer("judgment_date", answer)
+
+    names, matrix = question_date_flags(
+        compiled, "judgment_date", to_datetime64([answer])
+    )
+
+    assert {n for n, hit in zip(names, matrix[0]) if hit} == set(session.flags)
@@ -0,0 +1,49 @@
+from grizlyudvacator.cli.interview.flags import FlagRegistry
+from grizlyudvacator.cli.interview.interview_engine import InterviewEngine
+
+
+def test_registry_interns_names_to_stable_bits():
+    """Names keep their bit once assigned; new names are appended."""
+    registry = FlagRegistry(["a", "b"])
+    assert registry.intern("a") == 0
+    assert registry.intern("b") == 1
+    assert registry.intern("c") == 2
+    assert registry.intern("a") == 0
+    assert len(registry) == 3
+
+
+def test_mask_round_trip_and_membership():
+    """Masks hold each name once and decode in bit order."""
+    registry = FlagRegistry(["x", "y", "z"])
+    mask = registry.mask(["z", "x", "z"])
+
+    assert mask == 0b101
+    assert registry.names(mask) == ["x", "z"]
+    assert registry.test(mask, "z")
+    assert not registry.test(mask, "y")
+    assert not registry.test(mask, "never_seen")
+
+
+def test_session_flags_are_deduplicated():
+    """Re-answering a question does not duplicate its flags."""
+    engine = InterviewEngine(
+        {
+            "questions": [
+                {
+                    "id": "q1",
+                    "type": "boolean",
+                    "prompt": "?",
+                    "flags": ["asked"],
+                    "follow_up": {"if_false": {"flags": ["asked", "said_no"]}},
+                }
+            ]
+        }
+    )
+    engine.process_answer("q1", False)
+    engine.process_answer("q1", False)
+    engine.add_flag("manual", priority=1)
+
+    assert engine.get_flags() == ["asked", "said_no", "manual"]
+    assert engine.has_flag("said_no")
+    assert not engine.has_flag("said_yes")
+    assert isinstance(engine.flag_mask, int)
@@ -0,0 +1,48 @@
+import pickle
+
+import yaml
+
+from grizlyudvacator.cli.interview.interview_engine import (
+    InterviewEngine,
+    InterviewSession,
+)
+
+
+def test_sessions_share_definition_but_not_state(compiled):
+    """Two sessions over one compiled interview do not see each other's answers."""
+    first = compiled.new_session()
+    second = compiled.new_session()
+
+    first.process_answer("received_notice", False)
+
+    assert first.questions is second.questions
+    assert first.answers == {"received_notice": False}
+    assert first.flags == ["no_actual_notice"]
+    assert second.answers == {}
+    assert second.flags == []
+    assert second.current_id == "received_notice"
+
+
+def test_sessions_have_no_instance_dict(compiled):
+    """Sessions are slot-only so per-session memory stays small."""
+    session = compiled.new_session()
+    assert not hasattr(session, "__dict__")
+    assert not hasattr(InterviewEngine(session.yaml_data), "__dict__")
+
+
+def test_engine_is_a_session(yaml_path):
+    """The YAML-driven engine behaves exactly like a session."""
+    engine = InterviewEngine(yaml.safe_load(yaml_path.read_text()))
+    assert isinstance(engine, InterviewSession)
+    assert engine.process_answer("received_notice", True) == "explain_why_no_response"
+
+
+def test_compiled_interview_round_trips_through_pickle(compiled):
+    """Matchers and validation plans are rebuilt after unpickling."""
+    compiled = pickle.loads(pickle.dumps(compiled))
+    session = compiled.new_session()
+
+    session.process_answer("explain_why_no_response", "I was sick with an illness")
+
+    assert "illness" in session.flags
+    assert "excusable_neglect" in session.flags
@@ -0,0 +1,251 @@
+import json
+import os
+import threading
+
+import pytest
+
+from grizlyudvacator.cli import main as main_module
+from grizlyudvacator.cli.interview import journal as journal_module
+from grizlyudvacator.cli.interview.journal import AnswerJournal
+from grizlyudvacator.cli.io.io_interface import IOInterface
+from grizlyudvacator.cli.main import (
+    InterviewRunner,
+    build_parser,
+    open_session_journal,
+)
+
+ANSWERS = [
+    ("received_notice", False),
+    ("became_aware_date", "2025-01-02"),
+    ("judgment_date", "2024-12-01"),
+    ("service_type", "Publication"),
+    ("address_at_time", False),
+]
+
+
+class ScriptedIO(IOInterface):
+    """IO that replays canned input and fails when it runs out."""
+
+    def __init__(self, inputs):
+        self.inputs = list(inputs)
+
+    def read_input(self, prompt):
+        if not self.inputs:
+            raise RuntimeError("intake process died")
+        return self.inputs.pop(0)
+
+    def write_output(self, message):
+        pass
+
+    def read_file(self, path):
+        return ""
+
+    def write_file(self, path, content):
+        pass
+
+    def exists(self, path):
+        return False
+
+    def getcwd(self):
+        return ""
+
+    def join_path(self, *parts):
+        return "/".join(parts)
+
+
+def run_answers(session, journal, answers):
+    for question_id, answer in answers:
+        session.process_answer(question_id, answer)
+        journal.append(question_id, answer, session)
+
+
+@pytest.mark.parametrize("snapshot_every", [0, 2])
+def test_restore_rebuilds_session(tmp_path, compiled, snapshot_every, yaml_hash):
+    """Replaying the journal (with or without snapshots) restores the state."""
+    path = tmp_path / "session.journal"
+    original = compiled.new_session()
+    with AnswerJournal(path, yaml_hash, snapshot_every=snapshot_every) as journal:
+        run_answers(original, journal, ANSWERS)
+
+    with AnswerJournal(path, yaml_hash, snapshot_every=snapshot_every) as journal:
+        restored = journal.restore(compiled.new_session())
+        assert journal.records == len(ANSWERS)
+
+    assert restored.answers == original.answers
+    assert restored.flags == original.flags
+    assert restored.current_id == "declare_facts"
+
+
+def test_torn_record_is_discarded(tmp_path, compiled, yaml_hash):
+    """A half-written last record is dropped and cut from the journal."""
+    path = tmp_path / "session.journal"
+    with AnswerJournal(path, yaml_hash, snapshot_every=0) as journal:
+        run_answers(compiled.new_session(), journal, ANSWERS[:2])
+    with open(path, "ab") as f:
+        f.write(b'["judgment_date","2024-1')
+
+    with AnswerJournal(path, yaml_hash) as journal:
+        session = journal.restore(compiled.new_session())
+        journal.append("judgment_date", "2024-12-01", session)
+
+    assert session.current_id == "judgment_date"
+    assert path.read_text().splitlines()[-1] == '["judgment_date","2024-12-01"]'
+
+
+def test_journal_for_another_interview_is_refused(tmp_path, compiled, yaml_hash):
+    """A journal or snapshot written against other YAML is never replayed."""
+    path = tmp_path / "session.journal"
+    with AnswerJournal(path, yaml_hash, snapshot_every=1) as journal:
+        run_answers(compiled.new_session(), journal, ANSWERS[:2])
+    assert path.read_text().splitlines()[0] == f'{{"yaml":"{yaml_hash}"}}'
+
+    with pytest.raises(ValueError, match="belongs to interview"):
+        AnswerJournal(path, "0" * 64)
+
+    # A matching journal next to a stale snapshot is refused as well
+    path.unlink()
+    with AnswerJournal(path, yaml_hash) as journal:
+        journal.snapshot_path.write_text(
+            json.dumps({"yaml": "0" * 64, "offset": 0, "records": 0, "state": {}})
+        )
+        with pytest.raises(ValueError, match="belongs to interview"):
+            journal.restore(compiled.new_session())
+
+
+def test_journal_without_header_is_refused(tmp_path, yaml_hash):
+    path = tmp_path / "session.journal"
+    path.write_text('["received_notice",false]\n')
+    with pytest.raises(ValueError, match="no interview header"):
+        AnswerJournal(path, yaml_hash)
+
+
+def test_rejected_record_ends_replay(tmp_path, compiled, yaml_hash):
+    """A record the session rejects is cut like a torn one."""
+    path = tmp_path / "session.journal"
+    with AnswerJournal(path, yaml_hash, snapshot_every=0) as journal:
+        run_answers(compiled.new_session(), journal, ANSWERS[:2])
+    good = path.read_text()
+    with open(path, "a") as f:
+        f.write('["no_such_question",1]\n["judgment_date","2024-12-01"]\n')
+
+    with AnswerJournal(path, yaml_hash) as journal:
+        session = journal.restore(compiled.new_session())
+        assert journal.records == 2
+
+    assert session.current_id == "judgment_date"
+    assert path.read_text() == good
+
+
+def test_runner_resumes_after_crash(tmp_path, compiled, yaml_hash):
+    """A runner restored from the journal continues at the unanswered question."""
+    path = tmp_path / "session.journal"
+    yaml_data = compiled.yaml_data
+
+    with AnswerJournal(path, yaml_hash) as journal:
+        runner = InterviewRunner(
+            yaml_data, ScriptedIO(["n", "2025-01-02"]), journal=journal
+        )
+        with pytest.raises(RuntimeError):
+            runner.run()
+
+    with AnswerJournal(path, yaml_hash) as journal:
+        runner = InterviewRunner(
+            yaml_data,
+            ScriptedIO(["2024-12-01", "3", "y", "no other facts", ""]),
+            journal=journal,
+        )
+        answers, flags = runner.run()
+
+    assert answers["received_notice"] is False
+    assert answers["became_aware_date"] == "2025-01-02"
+    assert answers["service_type"] == "Publication"
+    assert "no_actual_notice" in flags
+    assert "service_may_be_valid" in flags
+
+
+def test_append_never_fsyncs_on_the_answer_path(
+    tmp_path, compiled, monkeypatch, yaml_hash
+):
+    """fsync runs on the flusher thread, within sync_interval of the answer."""
+    synced = threading.Event()
+    callers = []
+
+    def fsync(fd):
+        callers.append(threading.current_thread())
+        synced.set()
+
+    monkeypatch.setattr(journal_module.os, "fsync", fsync)
+    path = tmp_path / "session.journal"
+    with AnswerJournal(
+        path, yaml_hash, snapshot_every=0, sync_interval=0.05
+    ) as journal:
+        run_answers(compiled.new_session(), journal, ANSWERS[:1])
+        assert threading.current_thread() not in callers
+
+        # No further answers and no close: the record still becomes durable
+        assert synced.wait(timeout=5)
+        assert callers == [journal_module._flusher._thread]
+        with journal._lock:
+            assert journal._pending == 0
+
+
+def test_full_batch_is_committed_without_waiting(
+    tmp_path, compiled, monkeypatch, yaml_hash
+):
+    synced = threading.Event()
+    monkeypatch.setattr(journal_module.os, "fsync", lambda fd: synced.set())
+
+    path = tmp_path / "session.journal"
+    with AnswerJournal(
+        path, yaml_hash, sync_every=2, sync_interval=60
+    ) as journal:
+        run_answers(compiled.new_session(), journal, ANSWERS[:2])
+        assert synced.wait(timeout=5)
+
+
+def test_open_journals_share_one_flusher_and_hold_no_fds(
+    tmp_path, compiled, monkeypatch, yaml_hash
+):
+    """Open sessions cost neither a thread nor a file descriptor each."""
+    synced = []
+    monkeypatch.setattr(journal_module.os, "fsync", lambda fd: synced.append(fd))
+    fds_before = len(os.listdir("/proc/self/fd"))
+    journals = [
+        AnswerJournal(
+            tmp_path / f"{i}.journal", yaml_hash, snapshot_every=0, sync_every=1
+        )
+        for i in range(50)
+    ]
+    try:
+        for journal in journals:
+            run_answers(compiled.new_session(), journal, ANSWERS[:1])
+        flushers = [t for t in threading.enumerate() if t.name == "journal-flusher"]
+        assert flushers == [journal_module._flusher._thread]
+
+        assert len(os.listdir("/proc/self/fd")) < fds_before + len(journals)
+    finally:
+        for journal in journals:
+            journal.close()
+    assert len(synced) >= len(journals)
+
+
+def test_cli_sessions_are_journaled_and_resumable(
+    tmp_path, monkeypatch, yaml_path, yaml_hash
+):
+    monkeypatch.setattr(main_module, "get_session_dir", lambda: tmp_path)
+    assert build_parser().parse_args(["--resume", "s1"]).resume == "s1"
+    assert build_parser().parse_args([]).resume is None
+
+    session, journal = open_session_journal(str(yaml_path))
+    with journal:
+        journal.append(*ANSWERS[0])
+    assert journal.path == tmp_path / f"{session}.journal"
+
+    resumed, journal = open_session_journal(str(yaml_path), session)
+    with journal:
+        assert resumed == session
+        assert journal.yaml_hash == yaml_hash
+
+    for missing in ["nope", "../nope"]:
+        with pytest.raises(ValueError, match="No saved session"):
+            open_session_journal(str(yaml_path), missing)
@@ -0,0 +1,76 @@
+import re
+
+from grizlyudvacator.cli.interview.keyword_matcher import (
+    KeywordMatcher,
+    compile_keyword_matcher,
+    parse_keywords,
+)
+
+KEYWORDS = {
+    "keywords": [
+        {"illness": "illness"},
+        {"work_conflict": "work"},
+        {"relied_on_someone": "friend|helper|lawyer"},
+        {"miscommunication": "wrong unit|wrong door|neighbor"},
+        {"wrong_anything": "wrong"},
+    ],
+}
+
+
+def naive_findall(keywords, text):
+    """Reference behaviour: one search per label."""
+    return [
+        label
+        for label, pattern in keywords.items()
+        if re.search(rf"\b(?:{pattern})\b", text, re.IGNORECASE)
+    ]
+
+
+def test_parse_keywords_accepts_list_and_mapping():
+    """Both YAML spellings normalize to the same mapping."""
+    as_list = parse_keywords({"keywords": [{"a": "x"}, {"b": "y"}, "junk"]})
+    as_dict = parse_keywords({"keywords": {"a": "x", "b": "y"}})
+    assert as_list == as_dict == {"a": "x", "b": "y"}
+    assert compile_keyword_matcher(None) is None
+    assert compile_keyword_matcher({"keywords": []}) is None
+
+
+def test_single_pass_matches_every_label():
+    """Labels are returned in declaration order, case-insensitively."""
+    matcher = compile_keyword_matcher(KEYWORDS)
+    text = "My NEIGHBOR said my lawyer would handle it; I had an illness."
+    assert matcher.findall(text) == [
+        "illness",
+        "relied_on_someone",
+        "miscommunication",
+    ]
+
+
+def test_labels_sharing_a_start_position_are_all_found():
+    """'wrong unit' and 'wrong' both start at the same offset."""
+    matcher = compile_keyword_matcher(KEYWORDS)
+    assert matcher.findall("they went to the wrong unit") == [
+        "miscommunication",
+        "wrong_anything",
+    ]
+
+
+def test_word_boundaries_are_respected():
+    """'work' must not match inside 'homework'."""
+    matcher = compile_keyword_matcher(KEYWORDS)
+    assert matcher.findall("I was doing homework") == []
+
+
+def test_matches_naive_search_on_narratives():
+    """The combined matcher agrees with one search per label."""
+    keywords = parse_keywords(KEYWORDS)
+    matcher = KeywordMatcher(keywords)
+    texts = [
+        "",
+        "work work work",
+        "A friend and a helper knocked on the wrong door",
+        "Illness, then work, then a neighbor at the wrong unit.",
+        "wrongful eviction by a lawyerly helper",
+    ]
+    for text in texts:
+        assert matcher.findall(text) == naive_findall(keywords, text)
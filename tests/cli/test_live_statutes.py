@@ -0,0 +1,48 @@
+from grizlyudvacator.backend.rules.rule_engine import evaluate_statutes
+from grizlyudvacator.cli.interview.batch import statute_facts
+
+
+def full_result(session):
+    return evaluate_statutes(statute_facts(session.answers, session.flags))
+
+
+def test_eligibility_updates_after_every_answer(compiled):
+    session = compiled.new_session()
+    matcher = session.track_statutes()
+    assert matcher.eligible == []
+
+    session.process_answer("received_notice", False)
+    assert matcher.eligible == ["CCP § 473.5", "CCP § 918"]
+
+    for question_id, answer in [
+        ("became_aware_date", "2025-01-02"),
+        ("judgment_date", "2024-12-01"),
+        ("service_type", "Publication"),
+        ("address_at_time", False),
+    ]:
+        session.process_answer(question_id, answer)
+        assert matcher.result() == full_result(session)
+    assert "CCP § 473(d)" in matcher.eligible
+
+
+def test_undo_and_revise_keep_the_matcher_in_sync(compiled):
+    session = compiled.new_session()
+    matcher = session.track_statutes()
+    session.process_answer("received_notice", False)
+    session.process_answer("became_aware_date", "2025-01-02")
+
+    session.undo()
+    assert matcher.result() == full_result(session)
+
+    session.revise("received_notice", True)
+    assert matcher.eligible == []
+    session.process_answer("explain_why_no_response", "I was in the hospital")
+    assert matcher.eligible == ["CCP § 473(b)", "CCP § 918"]
+    assert matcher.result() == full_result(session)
+
+
+def test_tracking_starts_from_existing_state(compiled):
+    session = compiled.new_session()
+    session.process_answer("received_notice", False)
+
+    assert session.track_statutes().result() == full_result(session)
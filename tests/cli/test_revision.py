@@ -0,0 +1,122 @@
+import pytest
+
+from grizlyudvacator.cli.interview.journal import AnswerJournal
+
+ANSWERS = [
+    ("received_notice", True),
+    ("explain_why_no_response", "I was sick with an illness"),
+    ("judgment_date", "2024-12-01"),
+    ("service_type", "Publication"),
+    ("address_at_time", False),
+]
+
+
+def answered(compiled, answers=ANSWERS):
+    session = compiled.new_session()
+    for question_id, answer in answers:
+        session.process_answer(question_id, answer)
+    return session
+
+
+def test_undo_reverts_only_the_last_step(compiled):
+    """Undo restores the answers, flags and position from before the step."""
+    session = answered(compiled)
+    before = answered(compiled, ANSWERS[:-1])
+
+    assert session.undo() == "address_at_time"
+    assert session.answers == before.answers
+    assert sorted(session.flags) == sorted(before.flags)
+    assert session.current_id == before.current_id
+
+
+def test_undo_keeps_flags_set_by_earlier_steps(compiled):
+    """A flag raised again by a later step survives undoing that step."""
+    session = compiled.new_session()
+    session.process_answer("received_notice", True)
+    session.process_answer("explain_why_no_response", "illness")
+    session.process_answer("explain_why_no_response", "illness and stress")
+
+    session.undo()
+
+    assert session.has_flag("illness")
+    assert not session.has_flag("emotional_state")
+    assert session.answers["explain_why_no_response"] == "illness"
+
+
+def test_undo_on_fresh_session_is_a_no_op(compiled):
+    session = compiled.new_session()
+    assert session.undo() is None
+    assert session.current_id == "received_notice"
+
+
+def test_revise_on_same_path_reapplies_later_answers(compiled):
+    """Changing a text answer keeps every downstream answer."""
+    session = answered(compiled)
+    expected = answered(
+        compiled,
+        [(qid, "work ran late" if qid == "explain_why_no_response" else a)
+         for qid, a in ANSWERS],
+    )
+
+    next_id = session.revise("explain_why_no_response", "work ran late")
+
+    assert next_id == "declare_facts"
+    assert session.answers == expected.answers
+    assert sorted(session.flags) == sorted(expected.flags)
+    assert not session.has_flag("illness")
+
+
+def test_revise_onto_a_new_branch_stops_at_first_unanswered(compiled):
+    """Answers from the abandoned branch are dropped with their flags."""
+    session = answered(compiled)
+
+    next_id = session.revise("received_notice", False)
+
+    assert next_id == "became_aware_date"
+    assert session.answers == {"received_notice": False}
+    assert session.flags == ["no_actual_notice"]
+
+
+def test_invalid_revision_changes_nothing(compiled):
+    session = answered(compiled)
+    answers, flags = dict(session.answers), session.flags
+
+    with pytest.raises(ValueError):
+        session.revise("service_type", "Carrier pigeon")
+    with pytest.raises(KeyError):
+        session.revise("declare_facts", "never answered")
+
+    assert session.answers == answers
+    assert session.flags == flags
+
+
+def test_history_survives_snapshot_restore(compiled):
+    session = answered(compiled)
+    restored = compiled.new_session()
+    restored.restore(session.snapshot())
+
+    restored.undo()
+    session.undo()
+
+    assert restored.answers == session.answers
+    assert sorted(restored.flags) == sorted(session.flags)
+
+
+def test_journal_replays_undo_and_revise(tmp_path, compiled, yaml_hash):
+    path = tmp_path / "session.jsonl"
+    session = compiled.new_session()
+    with AnswerJournal(path, yaml_hash, snapshot_every=0) as journal:
+        for question_id, answer in ANSWERS:
+            session.process_answer(question_id, answer)
+            journal.append(question_id, answer, session)
+        session.undo()
+        journal.append_undo(session)
+        session.revise("explain_why_no_response", "stress")
+        journal.append_revision("explain_why_no_response", "stress", session)
+
+    with AnswerJournal(path, yaml_hash) as journal:
+        resumed = journal.restore(compiled.new_session())
+
+    assert resumed.answers == session.answers
+    assert sorted(resumed.flags) == sorted(session.flags)
+    assert resumed.current_id == session.current_id
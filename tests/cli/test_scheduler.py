@@ -0,0 +1,104 @@
+from datetime import date
+
+import pytest
+
+from grizlyudvacator.cli.interview.interview_engine import CompiledInterview
+from grizlyudvacator.cli.interview.scheduler import (
+    RefreshScheduler,
+    TimeWheel,
+    next_flip,
+)
+
+YAML_DATA = {
+    "questions": [
+        {
+            "id": "judgment_date",
+            "type": "date",
+            "prompt": "When was the judgment entered?",
+            "date_flags": {"urgent_lockout": 5, "time_barred": 180},
+        }
+    ]
+}
+
+START = date(2025, 1, 1)
+
+
+@pytest.fixture
+def compiled():
+    return CompiledInterview(YAML_DATA)
+
+
+def answered(compiled, judgment_date):
+    session = compiled.new_session()
+    session.answers["judgment_date"] = judgment_date
+    return session
+
+
+def test_wheel_fires_keys_on_their_day_only():
+    wheel = TimeWheel(START, size=8)
+    wheel.schedule("a", date(2025, 1, 3))
+    wheel.schedule("b", date(2025, 1, 11))  # same slot, one turn later
+    wheel.schedule("c", date(2024, 12, 1))  # overdue
+
+    assert list(wheel.advance(date(2025, 1, 3))) == ["c", "a"]
+    assert "b" in wheel
+    assert list(wheel.advance(date(2025, 1, 10))) == []
+    assert list(wheel.advance(date(2026, 1, 1))) == ["b"]
+    assert len(wheel) == 0
+
+
+def test_wheel_reschedule_and_cancel():
+    wheel = TimeWheel(START, size=8)
+    wheel.schedule("a", date(2025, 1, 3))
+    wheel.schedule("a", date(2025, 1, 5))
+    wheel.schedule("b", date(2025, 1, 4))
+    wheel.cancel("b")
+
+    assert wheel.due("a") == date(2025, 1, 5)
+    assert list(wheel.advance(date(2025, 1, 4))) == []
+    assert list(wheel.advance(date(2025, 1, 5))) == ["a"]
+
+
+def test_next_flip_is_the_nearest_unset_threshold(compiled):
+    session = answered(compiled, "2024-12-30")
+    session.refresh_date_flags(START)
+    assert next_flip(session, START) == date(2025, 1, 4)
+
+    session.refresh_date_flags(date(2025, 1, 4))
+    assert session.flags == ["urgent_lockout"]
+    # The 180-day flag flips before the 473(b) deadline (2025-06-30) passes
+    assert next_flip(session, date(2025, 1, 4)) == date(2025, 6, 28)
+
+    session.refresh_date_flags(date(2025, 6, 28))
+    assert next_flip(session, date(2025, 6, 28)) == date(2025, 7, 1)
+
+
+def test_advance_wakes_only_due_sessions(compiled):
+    scheduler = RefreshScheduler(today=START)
+    scheduler.track("soon", answered(compiled, "2024-12-30"))
+    scheduler.track("later", answered(compiled, "2024-12-01"))
+    scheduler.track("undated", answered(compiled, None))
+
+    assert scheduler.advance(date(2025, 1, 3)) == {}
+    woken = scheduler.advance(date(2025, 1, 4))
+
+    assert list(woken) == ["soon"]
+    assert woken["soon"]["added_flags"] == ["urgent_lockout"]
+    assert woken["soon"]["next_refresh"] == date(2025, 6, 28)
+    assert "undated" not in scheduler.wheel
+
+    woken = scheduler.advance(date(2025, 6, 3))
+    assert list(woken) == ["later"]
+    assert woken["later"]["expired"] == ["ccp_473b"]
+
+
+def test_refreshed_flags_are_undone_with_their_answer(compiled):
+    session = compiled.new_session()
+    session.process_answer("judgment_date", "2000-01-01")
+    session.flag_mask = 0  # as if the flags were computed long ago
+
+    session.refresh_date_flags(START)
+    assert sorted(session.flags) == ["time_barred", "urgent_lockout"]
+
+    session.undo()
+    assert session.flags == []
@@ -0,0 +1,138 @@
+import pytest
+
+from grizlyudvacator.cli.interview.interview_engine import InterviewEngine
+from grizlyudvacator.cli.interview.transitions import END
+
+YAML_DATA = {
+    "questions": [
+        {
+            "id": "notice",
+            "type": "boolean",
+            "prompt": "Did you receive notice?",
+            "follow_up": {
+                "if_true": {"flags": ["had_notice"], "next": "service"},
+                "if_false": {"flags": ["no_actual_notice"]},
+            },
+            "next": "address",
+        },
+        {
+            "id": "service",
+            "type": "choice",
+            "prompt": "How were you served?",
+            "options": ["Personal service", "Publication"],
+            "follow_up": {
+                "options": {
+                    "Publication": {"flags": ["publication"], "next": "end"},
+                }
+            },
+            "next": "address",
+        },
+        {
+            "id": "address",
+            "type": "text",
+            "prompt": "Where were you living?",
+            "next": "end",
+        },
+        {"id": "end", "type": "summary", "prompt": "Done", "next": None},
+    ]
+}
+
+
+def test_boolean_branches_fall_back_to_question_next():
+    """A branch without its own ``next`` continues at the question's ``next``."""
+    engine = InterviewEngine(YAML_DATA)
+
+    assert engine.process_answer("notice", False) == "address"
+    assert engine.flags == ["no_actual_notice"]
+    assert engine.current_id == "address"
+
+
+def test_option_branches_and_default():
+    """Known options use their branch; other options take the default branch."""
+    engine = InterviewEngine(YAML_DATA)
+    assert engine.process_answer("service", "Publication") == "end"
+    assert engine.flags == ["publication"]
+
+    engine = InterviewEngine(YAML_DATA)
+    assert engine.process_answer("service", "Personal service") == "address"
+    assert engine.flags == []
+
+
+def test_table_ends_interview():
+    """The summary question leads to END and completes the interview."""
+    engine = InterviewEngine(YAML_DATA)
+    table = engine.transitions
+
+    end_index = table.index["end"]
+    assert table.successor[table.offset[end_index]] == END
+    assert engine.process_answer("end", None) is None
+    assert engine.is_complete()
+
+
+def test_explicit_end_branch_ends_interview():
+    """A branch to ``end`` finishes the interview when no question has that ID."""
+    yaml_data = {
+        "questions": [
+            {
+                "id": "q1",
+                "type": "boolean",
+                "prompt": "?",
+                "follow_up": {"if_true": {"next": "end"}},
+            }
+        ]
+    }
+    engine = InterviewEngine(yaml_data)
+
+    assert engine.process_answer("q1", True) is None
+    assert engine.is_complete()
+
+
+@pytest.mark.parametrize("key", ["if_true", "if_false"])
+def test_unknown_branch_target_is_rejected(key):
+    """A misspelled branch target is a compile error, not an early end."""
+    yaml_data = {
+        "questions": [
+            {
+                "id": "q1",
+                "type": "boolean",
+                "prompt": "?",
+                "follow_up": {key: {"next": "q2_typo"}},
+            },
+            {"id": "q2", "type": "text", "prompt": "?"},
+        ]
+    }
+    with pytest.raises(ValueError, match="non-existent question q2_typo"):
+        InterviewEngine(yaml_data)
+
+
+def test_unknown_option_target_is_rejected():
+    yaml_data = {
+        "questions": [
+            {
+                "id": "q1",
+                "type": "choice",
+                "prompt": "?",
+                "options": ["a"],
+                "follow_up": {"options": {"a": {"next": "nowhere"}}},
+            }
+        ]
+    }
+    with pytest.raises(ValueError, match="option 'a'"):
+        InterviewEngine(yaml_data)
+
+
+def test_cycle_through_a_branch_is_rejected():
+    """Cycles are found along every branch, not only the default chain."""
+    yaml_data = {
+        "questions": [
+            {
+                "id": "q1",
+                "type": "boolean",
+                "prompt": "?",
+                "follow_up": {"if_true": {"next": "q2"}},
+            },
+            {"id": "q2", "type": "text", "prompt": "?", "next": "q1"},
+        ]
+    }
+    with pytest.raises(ValueError, match="Circular reference"):
+        InterviewEngine(yaml_data)
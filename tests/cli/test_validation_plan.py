@@ -0,0 +1,75 @@
+from datetime import date, timedelta
+
+import pytest
+
+from grizlyudvacator.cli.interview.interview_engine import (
+    BooleanValidator,
+    ChoiceValidator,
+    DateValidator,
+    MultipleChoiceValidator,
+    NumberValidator,
+    Question,
+    TextValidator,
+)
+from grizlyudvacator.cli.interview.validators.plan import compile_validator
+
+FUTURE = (date.today() + timedelta(days=3)).isoformat()
+
+CASES = [
+    (
+        Question(id="n", type="number", min=1, max=10),
+        NumberValidator(),
+        [5, 0, 11, "7", 1.5],
+    ),
+    (
+        Question(id="t", type="text", min_length=2, max_length=4),
+        TextValidator(),
+        ["abc", "a", "abcde", 3],
+    ),
+    (Question(id="b", type="boolean"), BooleanValidator(), [True, "yes", 0]),
+    (
+        Question(id="d", type="date"),
+        DateValidator(),
+        ["2024-01-31", "2024-13-01", FUTURE, 20240131],
+    ),
+    (
+        Question(id="c", type="choice", options=["Personal service", "Other"]),
+        ChoiceValidator(),
+        ["Other", "Mail", None],
+    ),
+    (
+        Question(
+            id="m",
+            type="multiple_choice",
+            options=["a", "b", "c"],
+            min_choices=1,
+            max_choices=2,
+        ),
+        MultipleChoiceValidator(),
+        [["a"], ["a", "x", "y"], [], ["a", "b", "c"], "a"],
+    ),
+]
+
+
+def outcome(func, answer):
+    """Return the exception type and message raised by a validator, if any."""
+    try:
+        func(answer)
+    except (TypeError, ValueError) as e:
+        return type(e), str(e)
+    return None
+
+
+@pytest.mark.parametrize("question,validator,answers", CASES)
+def test_compiled_plan_matches_validator_classes(question, validator, answers):
+    """Compiled validators accept, reject and word errors exactly as before."""
+    validate = compile_validator(question)
+    for answer in answers:
+        assert outcome(validate, answer) == outcome(
+            lambda a: validator.validate(question, a), answer
+        )
+
+
+def test_summary_questions_have_no_plan():
+    """Question types without validation compile to None."""
+    assert compile_validator(Question(id="s", type="summary")) is None
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from grizlyudvacator.cli.interview.artifact_cache import yaml_content_hash
+from grizlyudvacator.cli.interview.interview_engine import CompiledInterview
+
+
+@pytest.fixture(scope="session")
+def yaml_path():
+    """The interview YAML shipped with the CLI."""
+    return (
+        Path(__file__).parents[1]
+        / "grizlyudvacator"
+        / "cli"
+        / "prompts"
+        / "vacate_default.yaml"
+    )
+
+
+@pytest.fixture(scope="session")
+def yaml_hash(yaml_path):
+    return yaml_content_hash(yaml_path.read_bytes())
+
+
+@pytest.fixture(scope="module")
+def compiled(yaml_path):
+    return CompiledInterview(yaml.safe_load(yaml_path.read_text()))
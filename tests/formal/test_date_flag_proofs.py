@@ -0,0 +1,147 @@
+import copy
+from datetime import date, timedelta
+
+import yaml
+import z3
+
+from grizlyudvacator.cli.interview.interview_engine import CompiledInterview
+from grizlyudvacator.formal import date_flag_proofs
+from grizlyudvacator.formal.date_flag_proofs import DateFlagProver, prove_date_flags
+from grizlyudvacator.formal.proof_cache import ProofCache
+
+YAML_DATA = {
+    "questions": [
+        {
+            "id": "judgment_date",
+            "type": "date",
+            "prompt": "When was the judgment entered?",
+            "date_flags": {"urgent_lockout": 5, "time_barred": 180},
+            "next": "served_date",
+        },
+        {
+            "id": "served_date",
+            "type": "date",
+            "prompt": "When were you served?",
+            "flags": ["late_service"],
+            "date_flags": {"late_service": 30},
+        },
+    ]
+}
+
+
+def test_thresholds_are_proved_for_every_date():
+    result = DateFlagProver().prove_question(
+        CompiledInterview(YAML_DATA), "judgment_date"
+    )
+    assert result == {"proved": True, "counterexamples": []}
+
+
+def test_static_flag_overlap_is_a_counterexample():
+    result = DateFlagProver().prove_question(
+        CompiledInterview(YAML_DATA), "served_date"
+    )
+
+    assert not result["proved"]
+    (counterexample,) = result["counterexamples"]
+    assert counterexample["flag"] == "late_service"
+    assert counterexample["property"] == "exact"
+    assert counterexample["days_diff"] < 30
+    assert counterexample["raised_by"] == ["static"]
+
+
+def test_keyword_and_branch_flags_sharing_a_name_are_counterexamples():
+    data = copy.deepcopy(YAML_DATA)
+    judgment = data["questions"][0]
+    judgment["flags_from_text"] = {"keywords": [{"time_barred": "2019"}]}
+    judgment["follow_up"] = {"options": {"unknown": {"flags": ["urgent_lockout"]}}}
+
+    result = DateFlagProver().prove_question(CompiledInterview(data), "judgment_date")
+
+    raised_by = {c["flag"]: c["raised_by"] for c in result["counterexamples"]}
+    assert raised_by == {
+        "urgent_lockout": ["branch"],
+        "time_barred": ["keyword:time_barred"],
+    }
+
+
+def test_compiled_thresholds_are_checked_against_the_yaml():
+    compiled = CompiledInterview(YAML_DATA)
+    position = compiled.transitions.index["judgment_date"]
+    # Simulate a compiler that got one threshold wrong
+    compiled.date_flag_bits[position] = tuple(
+        (threshold + 1 if threshold == 5 else threshold, bit)
+        for threshold, bit in compiled.date_flag_bits[position]
+    )
+
+    result = DateFlagProver().prove_question(compiled, "judgment_date")
+
+    (counterexample,) = result["counterexamples"]
+    assert counterexample["flag"] == "urgent_lockout"
+    assert counterexample["days_diff"] == 5
+
+
+def test_encoding_matches_the_engine_around_each_threshold():
+    """The proof's comparison agrees with _process_date_flags at t-1, t, t+1."""
+    compiled = CompiledInterview(YAML_DATA)
+    session = compiled.new_session()
+    prover = DateFlagProver()
+    registry = compiled.flag_registry
+    for question in compiled.question_list:
+        position = compiled.transitions.index[question.id]
+        date_bits = compiled.date_flag_bits[position]
+        for flag, threshold in (question.date_flags or {}).items():
+            bit = registry.bit(flag)
+            thresholds = [t for t, flag_bit in date_bits if flag_bit == bit]
+            for days in (threshold - 1, threshold, threshold + 1):
+                answer = (date.today() - timedelta(days=days)).isoformat()
+                mask = session._process_date_flags(position, question, answer)
+
+                fired = prover._fired(prover.today, [], thresholds)
+                encoded = z3.simplify(
+                    z3.substitute(
+                        fired,
+                        (prover.answer, z3.IntVal(0, prover.context)),
+                        (prover.today, z3.IntVal(days, prover.context)),
+                    )
+                )
+                assert z3.is_true(encoded) == registry.test(mask, flag), (
+                    question.id,
+                    flag,
+                    days,
+                )
+
+
+def test_proof_is_cached_by_yaml_hash(tmp_path, monkeypatch):
+    yaml_path = tmp_path / "interview.yaml"
+    yaml_path.write_text(yaml.safe_dump(YAML_DATA))
+    cache = ProofCache(tmp_path / "proofs")
+
+    first = prove_date_flags(yaml_path, cache)
+    assert not first["proved"]
+    assert set(first["questions"]) == {"judgment_date", "served_date"}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("should not be called on a cache hit")
+
+    monkeypatch.setattr(date_flag_proofs, "compile_interview", fail)
+    assert prove_date_flags(yaml_path, cache) == first
+    assert cache.hits == 1
+
+    fixed = copy.deepcopy(YAML_DATA)
+    del fixed["questions"][1]["flags"]
+    yaml_path.write_text(yaml.safe_dump(fixed))
+    monkeypatch.undo()
+    assert prove_date_flags(yaml_path, cache)["proved"]
+
+
+def test_engine_change_invalidates_cached_proofs(tmp_path, monkeypatch):
+    yaml_path = tmp_path / "interview.yaml"
+    yaml_path.write_text(yaml.safe_dump(YAML_DATA))
+    cache = ProofCache(tmp_path / "proofs")
+    prove_date_flags(yaml_path, cache)
+
+    monkeypatch.setattr(date_flag_proofs, "ENGINE_FINGERPRINT", "changed")
+    prove_date_flags(yaml_path, cache)
+
+    assert cache.hits == 0
+    assert len(cache) == 2
@@ -0,0 +1,96 @@
+import copy
+
+import pytest
+import yaml
+
+from grizlyudvacator.cli.interview.interview_engine import CompiledInterview
+from grizlyudvacator.formal import graph_verifier
+from grizlyudvacator.formal.graph_verifier import GraphVerifier, verify_interview_graph
+from grizlyudvacator.formal.proof_cache import ProofCache
+
+YAML_DATA = {
+    "questions": [
+        {
+            "id": "received_notice",
+            "type": "boolean",
+            "prompt": "Did you receive notice?",
+            "follow_up": {
+                "if_true": {"next": "service_type", "flags": ["had_notice"]},
+                "if_false": {"next": "review_summary", "flags": ["no_notice"]},
+            },
+        },
+        {
+            "id": "service_type",
+            "type": "choice",
+            "prompt": "How were you served?",
+            "options": ["personal", "mail"],
+            "follow_up": {
+                "next": "review_summary",
+                "options": {"mail": {"flags": ["mail_service"]}},
+            },
+        },
+        {"id": "review_summary", "type": "summary", "prompt": "Review"},
+    ]
+}
+
+
+def verify(data):
+    return GraphVerifier(CompiledInterview(data)).verify()
+
+
+def test_well_formed_graph_is_proved():
+    assert verify(YAML_DATA) == {
+        "unreachable_questions": [],
+        "dead_ends": [],
+        "bypasses_final": None,
+        "unreachable_flags": [],
+        "proved": True,
+    }
+
+
+def test_loop_under_a_branch_is_rejected_at_compile_time():
+    data = copy.deepcopy(YAML_DATA)
+    data["questions"][1]["follow_up"]["options"]["mail"]["next"] = "received_notice"
+
+    with pytest.raises(ValueError, match="Circular reference"):
+        CompiledInterview(data)
+
+
+def test_branches_that_no_answer_takes_are_unreachable():
+    data = copy.deepcopy(YAML_DATA)
+    # A required question retries on False, so its if_false branch is dead
+    data["questions"][0]["required"] = True
+    data["questions"][1]["options"] = ["personal"]
+    orphan = {"id": "orphan", "type": "text", "prompt": "?", "flags": ["orphaned"]}
+    data["questions"].append(orphan)
+
+    result = verify(data)
+
+    assert result["unreachable_questions"] == ["orphan"]
+    assert result["unreachable_flags"] == ["mail_service", "no_notice", "orphaned"]
+    assert result["bypasses_final"] is None
+
+
+def test_path_skipping_the_final_question_is_reported():
+    data = copy.deepcopy(YAML_DATA)
+    data["questions"][1]["follow_up"]["options"]["mail"]["next"] = "end"
+
+    result = verify(data)
+
+    assert result["bypasses_final"] == ["received_notice", "service_type"]
+
+
+def test_result_is_cached_by_yaml_hash(tmp_path, monkeypatch):
+    yaml_path = tmp_path / "interview.yaml"
+    yaml_path.write_text(yaml.safe_dump(YAML_DATA))
+    cache = ProofCache(tmp_path / "proofs")
+
+    first = verify_interview_graph(yaml_path, cache)
+    assert first["proved"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("should not be called on a cache hit")
+
+    monkeypatch.setattr(graph_verifier, "compile_interview", fail)
+    assert verify_interview_graph(yaml_path, cache) == first
+    assert cache.hits == 1
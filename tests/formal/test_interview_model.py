@@ -69,3 +69,38 @@ def test_interview_state():
     # Test duplicate flag handling
     state.add_flag("new_flag")
     assert state.flags.count("new_flag") == 1  # Should only be one instance
+
+
+def test_checks_do_not_accumulate_assertions():
+    """Each check runs in its own scope, so order does not matter."""
+    verifier = InterviewVerifier()
+    base = len(verifier.solver.assertions())
+    current_date = datetime(2024, 6, 1)
+    date_flags = {"urgent": 7, "warning": 14}
+
+    assert not verifier.verify_date_flags(
+        date_flags, current_date, current_date - timedelta(days=1)
+    )
+    assert verifier.verify_date_flags(
+        date_flags, current_date, current_date - timedelta(days=10)
+    )
+    assert len(verifier.solver.assertions()) == base
+
+
+def test_batch_verification():
+    """The batch API agrees with one-at-a-time checks."""
+    current_date = datetime(2024, 6, 1)
+    cases = [
+        (current_date - timedelta(days=days_ago), {"urgent": 7, "warning": 14})
+        for days_ago in (1, 7, 8, 15, 400)
+    ]
+    cases.append((current_date - timedelta(days=30), {}))
+
+    results = InterviewVerifier().verify_date_flags_batch(cases, current_date)
+
+    assert results == [False, False, True, True, True, False]
+    single = InterviewVerifier()
+    assert results == [
+        single.verify_date_flags(flags, current_date, answer_date)
+        for answer_date, flags in cases
+    ]
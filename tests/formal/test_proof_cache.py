@@ -0,0 +1,94 @@
+import os
+from datetime import datetime, timedelta
+
+from automation.scripts import z3_proof_runner
+from automation.scripts.z3_proof_runner import Z3ProofLogger
+from grizlyudvacator.formal.proof_cache import ProofCache, proof_key
+
+FLAGS = {"urgent": 7, "warning": 14, "info": 30}
+
+
+def _case(current_date, days_ago, flags):
+    return {
+        "answer_date": (current_date - timedelta(days=days_ago)).isoformat(),
+        "current_date": current_date.isoformat(),
+        "flags": flags,
+    }
+
+
+def test_key_is_normalized():
+    assert proof_key({"flags": [["a", 1]], "elapsed": 5}) == proof_key(
+        {"elapsed": 5, "flags": [["a", 1]]}
+    )
+    assert proof_key({"elapsed": 5}) != proof_key({"elapsed": 6})
+
+
+def test_round_trip_and_counters(tmp_path):
+    cache = ProofCache(tmp_path)
+    assert cache.get("missing") is None
+
+    cache.put("k", {"status": "SAT"})
+    assert cache.get("k") == {"status": "SAT"}
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(ProofCache(tmp_path)) == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ProofCache(tmp_path, max_bytes=10**6)
+    for key in "abc":
+        cache.put(key, {"model": key * 100})
+    for key, age in zip("abc", (30, 20, 10)):
+        path = tmp_path / f"{key}.json"
+        stamp = path.stat().st_mtime_ns - age * 10**9
+        os.utime(path, ns=(stamp, stamp))
+    assert cache.get("a")  # now the most recently used
+
+    entry_size = (tmp_path / "a.json").stat().st_size
+    cache.max_bytes = 3 * entry_size
+    cache.put("d", {"model": "d" * 100})
+
+    assert cache.get("b") is None
+    assert cache.get("a") and cache.get("c") and cache.get("d")
+
+
+def test_puts_under_the_cap_do_not_scan_the_directory(tmp_path, monkeypatch):
+    ProofCache(tmp_path).put("old", {"model": "x" * 100})
+    cache = ProofCache(tmp_path, max_bytes=10**6)
+    entry_size = cache._total
+
+    def scan():
+        raise AssertionError("should only scan when over the cap")
+
+    monkeypatch.setattr(cache, "_entries", scan)
+    cache.put("a", {"model": "a" * 100})
+    cache.put("a", {"model": "b" * 100})  # replacing does not double count
+
+    assert cache._total == 2 * entry_size
+    monkeypatch.undo()
+    cache.max_bytes = entry_size
+    cache.put("b", {"model": "b" * 100})
+    assert len(cache) == 1 and cache._total == entry_size
+
+
+def test_identical_runs_skip_the_solver(tmp_path, monkeypatch):
+    cache = ProofCache(tmp_path / "proofs")
+    logger = Z3ProofLogger(output_dir=str(tmp_path / "logs"), cache=cache)
+    first = logger.evaluate_flags(_case(datetime(2024, 6, 1), 10, FLAGS))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("should not be called on a cache hit")
+
+    monkeypatch.setattr(z3_proof_runner.z3, "Solver", fail)
+    # Same thresholds and elapsed time on a later run, flags reordered
+    reordered = dict(reversed(list(FLAGS.items())))
+    case = _case(datetime(2025, 1, 1, 9, 30), 10, reordered)
+    second = logger.evaluate_flags(case)
+
+    assert cache.hits == 1
+    for field in ("status", "z3_model", "z3_constraints"):
+        assert second[field] == first[field]
+    assert second["triggered_flags"] == ["urgent"]
+    assert second["current_date"] == case["current_date"]
+
+    logger.log_proof(case, second, format="json")
+    assert (tmp_path / "logs" / "z3_proof_log.json").exists()
@@ -0,0 +1,127 @@
+import json
+import time
+from datetime import datetime, timedelta
+
+import z3
+
+from automation.scripts import z3_proof_runner
+from automation.scripts.z3_proof_runner import Z3ProofLogger, run_verification_suite
+from grizlyudvacator.formal.proof_cache import ProofCache
+
+NOW = datetime(2024, 6, 1)
+
+
+def _cases(count):
+    return [
+        {
+            "answer_date": (NOW - timedelta(days=days_ago)).isoformat(),
+            "current_date": NOW.isoformat(),
+            "flags": {"urgent": 7, "warning": 14, "info": 30},
+        }
+        for days_ago in range(count)
+    ]
+
+
+def _run(tmp_path, cases, workers):
+    return run_verification_suite(
+        cases,
+        workers=workers,
+        output_dir=str(tmp_path / "logs"),
+        cache=ProofCache(tmp_path / "proofs"),
+    )
+
+
+def test_pool_logs_in_case_order(tmp_path):
+    cases = _cases(40)
+    summary = _run(tmp_path, cases, workers=2)
+
+    assert summary["cases"] == 40 and summary["workers"] == 2
+    assert summary["statuses"] == {"SAT": 40}
+    assert summary["cases_per_second"] > 0
+    logged = json.loads((tmp_path / "logs" / "z3_proof_log.json").read_text())
+    assert [entry["answer_date"] for entry in logged] == [
+        case["answer_date"] for case in cases
+    ]
+    assert [len(entry["triggered_flags"]) for entry in logged[:16]] == (
+        [0] * 8 + [1] * 7 + [2]
+    )
+    markdown = (tmp_path / "logs" / "z3_proof_log.md").read_text()
+    assert markdown.count("### [") == 40
+
+
+def test_in_process_run_matches_pool(tmp_path):
+    cases = _cases(12)
+    _run(tmp_path / "pool", cases, workers=2)
+    _run(tmp_path / "inline", cases, workers=0)
+
+    def solver_fields(run):
+        log_file = tmp_path / run / "logs" / "z3_proof_log.json"
+        logged = json.loads(log_file.read_text())
+        return [(e["status"], e["z3_model"], e["z3_constraints"]) for e in logged]
+
+    assert solver_fields("pool") == solver_fields("inline")
+
+
+def test_timeouts_are_reported_and_not_cached(tmp_path, monkeypatch):
+    cache = ProofCache(tmp_path / "proofs")
+    logger = Z3ProofLogger(str(tmp_path / "logs"), cache, timeout_ms=1)
+    monkeypatch.setattr(z3.Solver, "check", lambda self, *args: z3.unknown)
+    monkeypatch.setattr(z3.Solver, "reason_unknown", lambda self: "timeout")
+
+    result = logger.evaluate_flags(_cases(10)[9])
+
+    assert result["status"] == "UNKNOWN"
+    assert "timeout" in result["z3_model"]
+    assert len(cache) == 0
+
+
+def _hang_on_first_case(test_case):
+    if test_case["answer_date"] == NOW.isoformat():
+        time.sleep(60)
+    return z3_proof_runner._worker_logger.evaluate_flags(test_case)
+
+
+def test_stuck_worker_is_timed_out_in_place(tmp_path, monkeypatch):
+    monkeypatch.setattr(z3_proof_runner, "_evaluate_in_worker", _hang_on_first_case)
+    cases = _cases(4)
+    started = time.monotonic()
+
+    summary = run_verification_suite(
+        cases,
+        workers=2,
+        output_dir=str(tmp_path / "logs"),
+        cache=ProofCache(tmp_path / "proofs"),
+        case_timeout=1,
+    )
+
+    assert time.monotonic() - started < 30
+    assert summary["statuses"] == {"TIMEOUT": 1, "SAT": 3}
+    logged = json.loads((tmp_path / "logs" / "z3_proof_log.json").read_text())
+    assert [entry["status"] for entry in logged] == ["TIMEOUT", "SAT", "SAT", "SAT"]
+
+
+def _hang_on_first_case_and_slow_down_the_rest(test_case):
+    if test_case["answer_date"] == NOW.isoformat():
+        time.sleep(60)
+    time.sleep(0.4)
+    return z3_proof_runner._worker_logger.evaluate_flags(test_case)
+
+
+def test_case_timeout_runs_from_when_the_case_starts(tmp_path, monkeypatch):
+    """Cases queued behind slow ones keep their whole budget."""
+    monkeypatch.setattr(
+        z3_proof_runner,
+        "_evaluate_in_worker",
+        _hang_on_first_case_and_slow_down_the_rest,
+    )
+
+    # One worker runs five 0.4s cases back to back, well past 1s in total
+    summary = run_verification_suite(
+        _cases(6),
+        workers=2,
+        output_dir=str(tmp_path / "logs"),
+        cache=ProofCache(tmp_path / "proofs"),
+        case_timeout=1,
+    )
+
+    assert summary["statuses"] == {"TIMEOUT": 1, "SAT": 5}
@@ -150,3 +150,40 @@ def test_interview_with_invalid_input_handling():
     mock_io.write_output.assert_any_call(
         "Invalid input. Enter numbers separated by commas."
     )
+
+
+def test_prompt_answers_go_through_the_session():
+    """Answers from _ask_question_impl drive flags and flow in the engine."""
+    mock_io = ConsoleIO()
+    mock_io.write_output = MagicMock()
+    mock_io.read_input = MagicMock(side_effect=["n", "9", "2"])
+
+    yaml_data = {
+        "questions": [
+            {
+                "id": "intro",
+                "prompt": "Did you respond to the court papers?",
+                "type": "boolean",
+                "follow_up": {
+                    "if_true": {"flags": ["responded"], "next": "end"},
+                    "if_false": {"flags": ["no_response"], "next": "how"},
+                },
+            },
+            {
+                "id": "how",
+                "prompt": "How were you served?",
+                "type": "choice",
+                "options": ["Personal", "Mail"],
+                "flags": ["service_method"],
+                "next": "end",
+            },
+            {"id": "end", "prompt": "Interview Summary", "type": "summary"},
+        ]
+    }
+
+    answers, flags = _run_interview_impl(mock_io, yaml_data)
+
+    assert answers == {"intro": False, "how": "Mail"}
+    assert set(flags) == {"no_response", "service_method"}
+    mock_io.write_output.assert_any_call("Invalid choice.")
+    mock_io.write_output.assert_any_call("📋 Interview complete. Thank you!")
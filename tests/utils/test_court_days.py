@@ -0,0 +1,102 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from grizlyudvacator.utils.court_days import CourtCalendar, judicial_holidays
+
+
+@pytest.fixture(scope="module")
+def court_calendar():
+    return CourtCalendar(2023, 2026)
+
+
+def test_2025_judicial_holidays():
+    assert sorted(judicial_holidays(2025)) == [
+        date(2025, 1, 1),
+        date(2025, 1, 20),
+        date(2025, 2, 12),
+        date(2025, 2, 17),
+        date(2025, 3, 31),
+        date(2025, 5, 26),
+        date(2025, 6, 19),
+        date(2025, 7, 4),
+        date(2025, 9, 1),
+        date(2025, 9, 26),
+        date(2025, 11, 11),
+        date(2025, 11, 27),
+        date(2025, 11, 28),
+        date(2025, 12, 25),
+    ]
+
+
+def test_weekend_holidays_are_observed_on_adjacent_weekdays():
+    holidays = judicial_holidays(2023)
+    assert date(2023, 11, 10) in holidays  # Veterans Day, a Saturday
+    assert date(2023, 1, 2) in holidays  # New Year's Day, a Sunday
+
+
+def test_holidays_apply_only_from_their_first_year():
+    assert date(2022, 6, 20) not in judicial_holidays(2022)  # Juneteenth, a Sunday
+    assert date(2023, 6, 19) in judicial_holidays(2023)
+    assert date(2000, 3, 31) not in judicial_holidays(2000)
+    assert date(2013, 9, 27) not in judicial_holidays(2013)
+    assert date(2014, 9, 26) in judicial_holidays(2014)
+
+
+def test_ccp_1005_window_skips_juneteenth(court_calendar):
+    # 16 court days from Fri 2025-06-06 pass Thu 6/19, so they end Tue 7/1
+    service = date(2025, 6, 6)
+    hearing = court_calendar.add_court_days(service, 16)
+    assert hearing == date(2025, 7, 1)
+    assert court_calendar.court_days_between(service, hearing) == 16
+    assert court_calendar.add_court_days(hearing, -16) == service
+
+
+def test_add_court_days_skips_weekends_and_holidays(court_calendar):
+    # Wed 2025-11-26 -> Mon 12/1 (Thanksgiving Thursday and Friday closed)
+    assert court_calendar.add_court_days(date(2025, 11, 26), 1) == date(2025, 12, 1)
+    assert court_calendar.add_court_days(date(2025, 12, 1), -1) == date(2025, 11, 26)
+    assert court_calendar.add_court_days(date(2025, 11, 29), 0) == date(2025, 11, 29)
+
+
+def test_add_and_diff_agree_with_day_by_day_count(court_calendar):
+    start = date(2024, 12, 20)
+    day, counted = start, 0
+    while counted < 40:
+        day += timedelta(days=1)
+        if day.weekday() < 5 and day not in judicial_holidays(day.year):
+            counted += 1
+    assert court_calendar.add_court_days(start, 40) == day
+    assert court_calendar.court_days_between(start, day) == 40
+    assert court_calendar.court_days_between(day, start) == -40
+
+
+def test_next_court_day(court_calendar):
+    assert court_calendar.next_court_day(date(2025, 7, 4)) == date(2025, 7, 7)
+    assert court_calendar.next_court_day(date(2025, 7, 7)) == date(2025, 7, 7)
+    assert not court_calendar.is_court_day(date(2025, 7, 5))
+
+
+def test_out_of_range_dates_are_rejected(court_calendar):
+    with pytest.raises(ValueError):
+        court_calendar.add_court_days(date(2030, 1, 2), 1)
+    with pytest.raises(ValueError):
+        court_calendar.add_court_days(date(2026, 12, 30), 5)
+
+
+def test_vectorized_forms_match_scalar(court_calendar):
+    days = [date(2024, 1, 1) + timedelta(days=n) for n in range(0, 700, 13)]
+    array = np.array(days, dtype="datetime64[D]")
+
+    for count in (-16, 0, 16):
+        expected = [court_calendar.add_court_days(d, count) for d in days]
+        result = court_calendar.add_court_days_array(array, count)
+        assert result.astype(object).tolist() == expected
+
+    expected = [court_calendar.next_court_day(d) for d in days]
+    result = court_calendar.next_court_day_array(array)
+    assert result.astype(object).tolist() == expected
+
+    missing = np.array(["NaT"], dtype="datetime64[D]")
+    assert np.isnat(court_calendar.add_court_days_array(missing, 3)).all()
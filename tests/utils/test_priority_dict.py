@@ -0,0 +1,52 @@
+import pytest
+from hypothesis import given, strategies as st
+
+from grizlyudvacator.utils.priority_dict import PriorityDict
+from grizlyudvacator.utils.sorted_dict import sorted_dict
+
+
+def test_empty():
+    """An empty mapping has no top entry."""
+    flags = PriorityDict()
+    assert len(flags) == 0
+    assert list(flags) == []
+    with pytest.raises(KeyError):
+        flags.peek()
+
+
+def test_update_moves_key():
+    """Re-prioritizing a key moves it and drops emptied buckets."""
+    flags = PriorityDict({"a": 3, "b": 1, "c": 2})
+    flags["b"] = 5
+
+    assert list(flags.items()) == [("c", 2), ("a", 3), ("b", 5)]
+    assert flags.peek() == ("c", 2)
+    assert flags._priorities == [2, 3, 5]
+
+
+def test_delete_and_pop_top():
+    """Deleting and popping keep the order intact."""
+    flags = PriorityDict({"a": 3, "b": 1, "c": 2})
+    del flags["c"]
+    assert flags.pop_top() == ("b", 1)
+    assert dict(flags) == {"a": 3}
+
+
+@given(
+    st.lists(
+        st.tuples(st.sampled_from("abcdefgh"), st.integers(-5, 5)),
+        max_size=60,
+    )
+)
+def test_matches_sorted_dict(updates):
+    """After any sequence of updates, values come out in sorted_dict order."""
+    flags = PriorityDict()
+    reference = {}
+    for key, priority in updates:
+        flags[key] = priority
+        reference[key] = priority
+
+    assert dict(flags) == reference
+    assert list(flags.values()) == list(sorted_dict(reference).values())
+    if reference:
+        assert flags.peek()[1] == min(reference.values())